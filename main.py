@@ -2,12 +2,24 @@ import argparse
 import json
 import sys
 import os
-from typing import Dict, Any
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Any
 
 from sta_engine.parser import VerilogParser
+from sta_engine.incremental import IncrementalParser
 from sta_engine.analysis import TimingAnalyzer
+from sta_engine.reduction import GraphReducer
+from sta_engine.outofcore import OutOfCoreBuilder, OutOfCoreAnalyzer
+from sta_engine.sensitivity import SensitivityAnalyzer, save_sensitivity
+from sta_engine.vector import VectorTimingAnalyzer
+from sta_engine.parallel import ParallelTimingAnalyzer, measure_scaling
+from sta_engine.statistical import StatisticalTimingAnalyzer
+from sta_engine.store import save_results
 from sta_engine.report import ReportGenerator
-from sta_engine.visualizer import GraphVisualizer
+from sta_engine.visualizer import GraphVisualizer, render_source
+from sta_engine.pipeline import TaskGraph
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """Loads JSON configuration from the given path."""
@@ -21,6 +33,169 @@ def load_config(config_path: str) -> Dict[str, Any]:
         print(f"Error: Failed to parse configuration file '{config_path}': {e}")
         sys.exit(1)
 
+def print_scaling(graph, config: Dict[str, Any], worker_counts: str):
+    """Benchmarks parallel AT propagation for the given worker counts."""
+    counts = [int(c) for c in worker_counts.split(",") if c.strip()]
+    rows = measure_scaling(graph, config['timing_constraints'], config['library'], counts)
+
+    print("\n--- Propagation Scaling ---")
+    print("{:<10} {:<12} {:<12} {:<10} {:<10} {:<10}".format("Workers", "Time (s)", "Cached (s)", "Speedup", "Scaling", "Identical"))
+    for row in rows:
+        scaling = "-" if row['scaling'] is None else f"{row['scaling']:.2f}"
+        print(f"{str(row['workers']):<10} {row['seconds']:<12.4f} {row['cached']:<12.4f} {row['speedup']:<10.2f} {scaling:<10} {row['identical']}")
+    print()
+
+def filter_cone(graph, pin: str, results: List[Dict[str, Any]]):
+    """Keeps only result rows in the fanin or fanout cone of `pin`; returns (worst_slack, worst_node, rows)."""
+    starts = graph.fanin_cone(pin)
+    ends = graph.fanout_cone(pin)
+    print(f"Cone of {pin}: {len(starts)} startpoints, {len(ends)} endpoints")
+
+    rows = [r for r in results if graph.reaches(pin, r['node']) or graph.reaches(r['node'], pin)]
+    worst = min(rows, key=lambda r: r['slack'], default=None)
+    if worst is None:
+        return float('inf'), None, rows
+    return worst['slack'], worst['node'], rows
+
+def run_analysis(args, config: Dict[str, Any], graph, instances):
+    """Runs the main analysis (plus Monte Carlo / sensitivities if requested);
+    returns (analyzer, results, statistics, sensitivity)."""
+    if args.scaling:
+        print_scaling(graph, config, args.scaling)
+
+    analysis_graph = graph
+    if args.reduce:
+        timing_points = TimingAnalyzer(graph, config['timing_constraints'], config['library']).is_timing_point
+        reducer = GraphReducer(graph, timing_points)
+        analysis_graph = reducer.reduce()
+        print(reducer.summary())
+
+    if args.bus_compress:
+        analyzer = VectorTimingAnalyzer(analysis_graph, config['timing_constraints'], config['library'], instances)
+    elif args.workers > 1:
+        analyzer = ParallelTimingAnalyzer(analysis_graph, config['timing_constraints'], config['library'],
+                                          workers=args.workers)
+    else:
+        analyzer = TimingAnalyzer(analysis_graph, config['timing_constraints'], config['library'])
+    if args.endpoint:
+        results = analyzer.query_endpoints(args.endpoint)
+    else:
+        results = analyzer.run_analysis()
+    if args.reduce:
+        reducer.expand()
+    if args.cone:
+        results = filter_cone(graph, args.cone, results[2])
+
+    statistics = None
+    if args.monte_carlo > 0:
+        mc = StatisticalTimingAnalyzer(graph, config['timing_constraints'], config['library'],
+                                       samples=args.monte_carlo, seed=args.seed, chunk_size=args.mc_chunk)
+        statistics = mc.run_statistical()
+
+    sensitivity = None
+    if args.sensitivity or args.sensitivity_out:
+        sensitivity = SensitivityAnalyzer(analyzer).run()
+    return analyzer, results, statistics, sensitivity
+
+def print_summary(args, config: Dict[str, Any], worst_slack: float, worst_node, results, statistics, sensitivity):
+    print("\n--- Timing Analysis Report ---")
+    print(f"Design: {args.design}")
+    print(f"Clock Period: {config['timing_constraints'].get('clock_period', 'N/A')} ns")
+    
+    if args.verbose:
+        print("\n{:<20} {:<10} {:<10} {:<10} {:<10}".format("Node", "AT", "RT", "Slack", "Status"))
+        print("-" * 65)
+        for res in results:
+            print(f"{res['node']:<20} {res['at']:<10.4f} {res['rt']:<10.4f} {res['slack']:<10.4f} {res['status']}")
+
+    print("\n--- Final Summary ---")
+    status = "MET" if worst_slack >= 0 else "VIOLATED"
+    print(f"Timing Status: {status}")
+    print(f"Worst Slack:   {worst_slack:+.4f} ns")
+    if worst_node:
+        print(f"Critical Node: {worst_node}")
+
+    if statistics:
+        print("\n--- Statistical Summary ---")
+        print(f"Samples:       {statistics['samples']}")
+        print(f"Timing Yield:  {statistics['timing_yield'] * 100:.2f} %")
+        for ep in statistics['endpoints'][:5]:
+            print(f"{ep['node']:<20} mean {ep['mean']:+.4f}  sigma {ep['sigma']:.4f}  yield {ep['yield'] * 100:.2f} %")
+
+    if sensitivity:
+        print("\n--- Slack Sensitivity (per ns of delay) ---")
+        print(f"TNS:           {sensitivity['tns']:+.4f} ns ({sensitivity['violating']} violating endpoints)")
+        print("{:<32} {:<10} {:<10}".format("Parameter", "dWNS", "dTNS"))
+        for p in sensitivity['parameters'][:10]:
+            print(f"{p['parameter']:<32} {p['d_wns']:<+10.2f} {p['d_tns']:<+10.2f}")
+
+def run_out_of_core(args, config: Dict[str, Any]):
+    """Streams the design to disk and times it there, without building the in-memory Graph."""
+    try:
+        graph = OutOfCoreBuilder(config['library'], args.out_of_core).build(args.design)
+        analyzer = OutOfCoreAnalyzer(graph, config['timing_constraints'], config['library'])
+        worst_slack, worst_node, results = analyzer.run_analysis()
+    except Exception as e:
+        print(f"Error during out-of-core analysis: {e}")
+        sys.exit(1)
+
+    print_summary(args, config, worst_slack, worst_node, results, None, None)
+    if args.report:
+        try:
+            ReportGenerator(args.design, config, worst_slack, worst_node, results).generate(args.report)
+        except OSError:
+            sys.exit(1)
+
+def watch_design(args, config: Dict[str, Any], vparser: IncrementalParser, analyzer: TimingAnalyzer):
+    """Polls the design file and re-times only the edited part of the graph on each save."""
+    print(f"\nWatching {args.design} for changes (Ctrl+C to stop)...")
+    last_mtime = os.path.getmtime(args.design)
+    try:
+        while True:
+            time.sleep(args.watch_interval)
+            try:
+                mtime = os.path.getmtime(args.design)
+            except OSError:
+                continue
+            if mtime == last_mtime:
+                continue
+            last_mtime = mtime
+
+            start = time.perf_counter()
+            try:
+                diff = vparser.reparse(args.design)
+                if diff.is_empty():
+                    print("No netlist changes.")
+                    continue
+                if args.endpoint:
+                    analyzer.reset_queries()
+                    worst_slack, worst_node, results = analyzer.query_endpoints(args.endpoint)
+                elif diff.full_rebuild:
+                    worst_slack, worst_node, results = analyzer.run_analysis()
+                else:
+                    worst_slack, worst_node, results = analyzer.update_analysis(diff.touched)
+                if args.cone:
+                    worst_slack, worst_node, results = filter_cone(vparser.graph, args.cone, results)
+            except Exception as e:
+                print(f"Error during incremental update: {e}")
+                continue
+
+            status = "MET" if worst_slack >= 0 else "VIOLATED"
+            print(f"\n--- Incremental Update ({time.perf_counter() - start:.3f} s) ---")
+            print(f"Changes:       {diff.summary()}")
+            print(f"Timing Status: {status}")
+            print(f"Worst Slack:   {worst_slack:+.4f} ns")
+            if worst_node:
+                print(f"Critical Node: {worst_node}")
+
+            if args.report:
+                try:
+                    ReportGenerator(args.design, config, worst_slack, worst_node, results).generate(args.report)
+                except OSError as e:
+                    print(f"Error writing report: {e}")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
 def main():
     parser = argparse.ArgumentParser(description="Static Timing Analysis (STA) Engine")
     parser.add_argument("--design", required=True, help="Path to Verilog design file")
@@ -28,16 +203,55 @@ def main():
     parser.add_argument("--verbose", action="store_true", help="Print detailed node information")
     parser.add_argument("--report", help="Output Markdown report file")
     parser.add_argument("--plot", help="Output Graph visualization file (PNG)", default=None)
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for parallel AT propagation")
+    parser.add_argument("--scaling", help="Comma-separated worker counts to benchmark (e.g. 1,2,4,8)")
+    parser.add_argument("--monte-carlo", type=int, default=0, metavar="N", help="Run statistical timing with N Monte Carlo samples")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for Monte Carlo sampling")
+    parser.add_argument("--mc-chunk", type=int, default=256, help="Monte Carlo samples propagated per chunk")
+    parser.add_argument("--save-results", help="Save per-pin AT/RT/slack to a columnar results file (see query.py)")
+    parser.add_argument("--endpoint", action="append", metavar="PIN", help="Only time the fanin cone of this endpoint (repeatable)")
+    parser.add_argument("--cone", metavar="PIN", help="Only report pins in the fanin/fanout cone of PIN")
+    parser.add_argument("--sensitivity", action="store_true", help="Rank library delays by their effect on WNS/TNS")
+    parser.add_argument("--sensitivity-out", metavar="JSON", help="Write the sensitivities to a JSON file (implies --sensitivity)")
+    parser.add_argument("--bus-compress", action="store_true", help="Propagate bit-parallel bus instances as vector nodes")
+    parser.add_argument("--reduce", action="store_true", help="Collapse series pins and parallel arcs before analysis")
+    parser.add_argument("--out-of-core", metavar="DIR", help="Stream the netlist into memory-mapped files in DIR and analyze from disk")
+    parser.add_argument("--watch", action="store_true", help="Keep running and incrementally re-analyze when the design file changes")
+    parser.add_argument("--watch-interval", type=float, default=1.0, help="Seconds between design file checks in watch mode")
 
     args = parser.parse_args()
+    if args.mc_chunk < 1:
+        parser.error("--mc-chunk must be at least 1")
+    if args.bus_compress and args.workers > 1:
+        parser.error("--bus-compress cannot be combined with --workers")
+    if args.reduce and (args.sensitivity or args.sensitivity_out):
+        parser.error("--sensitivity cannot be combined with --reduce (merged arcs span several cells)")
+    if args.reduce and args.watch:
+        parser.error("--reduce cannot be combined with --watch (edits apply to the unreduced graph)")
+    if args.endpoint and (args.sensitivity or args.sensitivity_out):
+        parser.error("--sensitivity cannot be combined with --endpoint (only the queried cones are timed)")
+    if args.out_of_core:
+        in_memory_only = [flag for flag, value in (
+            ("--plot", args.plot), ("--workers", args.workers > 1), ("--scaling", args.scaling),
+            ("--monte-carlo", args.monte_carlo), ("--save-results", args.save_results), ("--endpoint", args.endpoint),
+            ("--cone", args.cone), ("--sensitivity", args.sensitivity or args.sensitivity_out),
+            ("--bus-compress", args.bus_compress), ("--reduce", args.reduce), ("--watch", args.watch)) if value]
+        if in_memory_only:
+            parser.error(f"--out-of-core cannot be combined with {', '.join(in_memory_only)}")
 
     # 1. Load Config
     config = load_config(args.config)
     print(f"Loaded configuration from {args.config}")
+    if config['timing_constraints'].get('propagated_clock', False) and (args.sensitivity or args.sensitivity_out):
+        parser.error("--sensitivity cannot be combined with propagated_clock (clock tree arcs move required times)")
+
+    if args.out_of_core:
+        run_out_of_core(args, config)
+        return
 
     # 2. Parse Design & Build Graph
     try:
-        vparser = VerilogParser(config['library'])
+        vparser = IncrementalParser(config['library']) if args.watch else VerilogParser(config['library'])
         graph = vparser.parse(args.design)
         print(f"Graph built successfully: {graph.summary()}")
     except Exception as e:
@@ -47,41 +261,63 @@ def main():
              print("\nHint: 'iverilog' (Icarus Verilog) seems to be missing. It is required for parsing.")
         sys.exit(1)
 
-    # 3. Plot Graph if requested
-    if args.plot:
-        visualizer = GraphVisualizer(graph)
-        visualizer.plot(args.plot)
+    # Independent stages run as a task graph: rendering in a background
+    # process, report/export writing on an I/O thread, analysis and console
+    # output here. The plot shows the graph before analysis, so its DOT
+    # source is built up front.
+    with ProcessPoolExecutor(max_workers=1) as render_pool, ThreadPoolExecutor(max_workers=1) as io_pool:
+        stages = TaskGraph()
 
-    # 4. Run Analysis
-    try:
-        analyzer = TimingAnalyzer(graph, config['timing_constraints'], config['library'])
-        worst_slack, worst_node, results = analyzer.run_analysis()
-    except Exception as e:
-        print(f"Error during analysis: {e}")
-        sys.exit(1)
+        # 3. Plot Graph if requested
+        if args.plot:
+            dot = GraphVisualizer(graph).build()
+            if dot is not None:
+                stages.add("plot", render_source, dot.source, args.plot, executor=render_pool)
 
-    # 5. Console Output
-    print("\n--- Timing Analysis Report ---")
-    print(f"Design: {args.design}")
-    print(f"Clock Period: {config['timing_constraints'].get('clock_period', 'N/A')} ns")
-    
-    if args.verbose:
-        print("\n{:<20} {:<10} {:<10} {:<10} {:<10}".format("Node", "AT", "RT", "Slack", "Status"))
-        print("-" * 65)
-        for res in results:
-            print(f"{res['node']:<20} {res['at']:<10.4f} {res['rt']:<10.4f} {res['slack']:<10.4f} {res['status']}")
+        # 4. Run Analysis
+        analysis = stages.add("analysis", run_analysis, args, config, graph, vparser.instances)
+        if analysis.exception() is None:
+            analyzer, (worst_slack, worst_node, results), statistics, sensitivity = analysis.result()
 
-    print("\n--- Final Summary ---")
-    status = "MET" if worst_slack >= 0 else "VIOLATED"
-    print(f"Timing Status: {status}")
-    print(f"Worst Slack:   {worst_slack:+.4f} ns")
-    if worst_node:
-        print(f"Critical Node: {worst_node}")
+            # 5. Generate Markdown Report (the I/O stages are queued first so
+            # they write while the summary is printed)
+            if args.report:
+                generator = ReportGenerator(args.design, config, worst_slack, worst_node, results, statistics, sensitivity)
+                stages.add("report", generator.generate, args.report, deps=["analysis"], executor=io_pool)
 
-    # 6. Generate Markdown Report
-    if args.report:
-        generator = ReportGenerator(args.design, config, worst_slack, worst_node, results)
-        generator.generate(args.report)
+            # 6. Save Results Store
+            if args.save_results:
+                metadata = {
+                    "design": args.design,
+                    "config": args.config,
+                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "clock_period": config['timing_constraints'].get('clock_period'),
+                    "worst_slack": worst_slack,
+                    "worst_node": worst_node,
+                }
+                stages.add("save-results", save_results, args.save_results, graph, results, metadata,
+                           deps=["analysis"], executor=io_pool)
+
+            if args.sensitivity_out:
+                stages.add("save-sensitivity", save_sensitivity, args.sensitivity_out, sensitivity,
+                           deps=["analysis"], executor=io_pool)
+
+            # 7. Console Output
+            print_summary(args, config, worst_slack, worst_node, results, statistics, sensitivity)
+
+        failures = stages.wait()
+
+    if args.verbose and stages.durations:
+        print("\nStage timings: " + ", ".join(f"{name} {seconds:.3f} s" for name, seconds in stages.durations.items()))
+
+    for name, error in failures:
+        print(f"Error during {name}: {error}")
+    if failures:
+        sys.exit(1)
+
+    # 8. Watch Mode
+    if args.watch:
+        watch_design(args, config, vparser, analyzer)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,80 @@
+import argparse
+import sys
+
+from sta_engine.store import ResultStore
+
+def print_rows(rows):
+    print("\n{:<20} {:<10} {:<10} {:<10} {:<10}".format("Node", "AT", "RT", "Slack", "Status"))
+    print("-" * 65)
+    for res in rows:
+        print(f"{res['node']:<20} {res['at']:<10.4f} {res['rt']:<10.4f} {res['slack']:<10.4f} {res['status']}")
+
+def print_histogram(store: ResultStore, bins: int):
+    print("\n--- Endpoint Slack Histogram ---")
+    buckets = store.histogram(bins)
+    peak = max((count for _, _, count in buckets), default=0) or 1
+    for low, high, count in buckets:
+        bar = "#" * round(40 * count / peak)
+        print(f"[{low:+.4f}, {high:+.4f})  {count:>8}  {bar}")
+
+def print_diff(store: ResultStore, baseline: ResultStore, limit: int):
+    diff = store.diff(baseline)
+    print(f"\n--- Diff vs {baseline.path} ---")
+    print(f"Newly Violating:   {len(diff['newly_violating'])}")
+    print(f"Fixed:             {len(diff['fixed'])}")
+    print(f"Added Endpoints:   {len(diff['added_endpoints'])}")
+    print(f"Removed Endpoints: {len(diff['removed_endpoints'])}")
+
+    for d in diff['newly_violating'][:limit]:
+        print(f"  NEW VIOLATION {d['node']:<20} {d['old_slack']:+.4f} -> {d['new_slack']:+.4f}")
+
+    print("\n{:<20} {:<10} {:<10} {:<10}".format("Node", "Old", "New", "Delta"))
+    print("-" * 55)
+    for d in diff['deltas'][:limit]:
+        print(f"{d['node']:<20} {d['old_slack']:<+10.4f} {d['new_slack']:<+10.4f} {d['delta']:<+10.4f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Query saved STA results without re-running analysis")
+    parser.add_argument("results", help="Results file written by main.py --save-results")
+    parser.add_argument("--pattern", help="Glob pattern on pin names (e.g. 'reg_*/D')")
+    parser.add_argument("--min-slack", type=float, help="Only rows with slack >= value")
+    parser.add_argument("--max-slack", type=float, help="Only rows with slack <= value")
+    parser.add_argument("--all-pins", action="store_true", help="Include unconstrained pins, not only endpoints")
+    parser.add_argument("--histogram", type=int, metavar="BINS", help="Print an endpoint slack histogram")
+    parser.add_argument("--diff", metavar="BASELINE", help="Compare endpoint slack against another results file")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum rows to print")
+
+    args = parser.parse_args()
+    if args.histogram is not None and args.histogram < 1:
+        parser.error("--histogram needs at least 1 bin")
+
+    try:
+        store = ResultStore(args.results)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    with store:
+        meta = store.metadata
+        print(f"Results: {args.results} ({len(store)} pins)")
+        if meta:
+            print(f"Design: {meta.get('design', 'N/A')}  Generated on: {meta.get('timestamp', 'N/A')}")
+
+        if args.diff:
+            try:
+                with ResultStore(args.diff) as baseline:
+                    print_diff(store, baseline, args.limit)
+            except (OSError, ValueError) as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+        elif args.histogram is not None:
+            print_histogram(store, args.histogram)
+        else:
+            rows = store.query(args.pattern, args.min_slack, args.max_slack, endpoints_only=not args.all_pins)
+            # Unconstrained pins (NaN slack) sort last
+            rows.sort(key=lambda x: (x['slack'] != x['slack'], x['slack']))
+            print_rows(rows[:args.limit])
+            print(f"\n{len(rows)} matching rows")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 from typing import Dict, List, Any, Tuple, Optional
 from collections import deque, defaultdict
 from .graph import Graph, Node
+from .loops import LoopBreaker, CombinationalLoop
+from .clock import ClockTree
 
 class TimingAnalyzer:
     """Performs Static Timing Analysis (STA) on the graph."""
@@ -9,6 +11,11 @@ class TimingAnalyzer:
         self.graph = graph
         self.constraints = constraints
         self.lib = library
+        self.loops: List[CombinationalLoop] = []
+        self.clock_tree: Optional[ClockTree] = None
+        self.launch: Dict[str, Dict[Optional[str], float]] = {} # Node -> {launch clock pin (None for inputs): AT}
+        self._cone_at: Optional[Dict[str, float]] = None # Memoized ATs of on-demand endpoint queries
+        self._slack_rows: Optional[Dict[str, Dict[str, Any]]] = None # Last slack results, patched by update_analysis
 
     def run_analysis(self) -> Tuple[float, Optional[str], List[Dict[str, Any]]]:
         """Runs the full timing analysis pipeline."""
@@ -16,27 +23,265 @@ class TimingAnalyzer:
         self._calculate_required_times()
         return self._calculate_slack()
 
+    def query_endpoints(self, names: List[str]) -> Tuple[float, Optional[str], List[Dict[str, Any]]]:
+        """Times only the fanin cones of the named endpoints (same return shape as run_analysis)."""
+        worst_slack = float('inf')
+        worst_node = None
+        results = []
+        for name in names:
+            row = self.query_endpoint(name)
+            if row is None:
+                print(f"Warning: Endpoint '{name}' is not reachable from any start point")
+                continue
+            results.append(row)
+            if row['slack'] < worst_slack:
+                worst_slack = row['slack']
+                worst_node = row['node']
+        return worst_slack, worst_node, results
+
+    def query_endpoint(self, name: str) -> Optional[Dict[str, Any]]:
+        """Demand-driven timing of one endpoint: walks its transitive fanin only.
+
+        ATs are memoized across queries, so endpoints sharing logic reuse the
+        common part of their cones. Results stay valid until the graph changes
+        (see reset_queries). Returns None if no start point reaches the endpoint.
+        """
+        node = self.graph.get_node(name)
+        if node is None:
+            raise ValueError(f"Endpoint '{name}' not found in the design")
+
+        if self._cone_at is None:
+            self._cone_at = {}
+            self.launch = {}
+            self._prepare_clock()
+
+        node.at = self._cone_arrival(node)
+        node.rt = self._required_time(node)
+        if node.rt == 999.0:
+            raise ValueError(f"'{name}' is not a timing endpoint")
+        if node.at == -1.0:
+            return None
+
+        slack = node.rt - node.at
+        return {
+            "node": node.name,
+            "at": node.at,
+            "rt": node.rt,
+            "slack": slack,
+            "status": "MET" if slack >= 0 else "VIOLATED"
+        }
+
+    def reset_queries(self):
+        """Drops memoized endpoint-query ATs (needed after the graph is edited)."""
+        self._cone_at = None
+
+    def _cone_arrival(self, root: Node) -> float:
+        """Computes the AT of `root` by an iterative post-order walk over its fanin cone."""
+        cache = self._cone_at
+        if root.name in cache:
+            return cache[root.name]
+
+        track_launch = self.clock_tree is not None
+        on_path = {root.name}
+        work = [(root, self.graph.get_fanin(root), 0)] # (node, fanin, next fanin to visit)
+        while work:
+            node, fanin, pos = work[-1]
+            if pos < len(fanin):
+                work[-1] = (node, fanin, pos + 1)
+                source = fanin[pos][0]
+                if source.name in cache:
+                    continue
+                if source.name in on_path:
+                    # The queries never run the loop breaker; a back edge is simply not followed
+                    print(f"Warning: Combinational loop, ignoring {source.name} -> {node.name} in endpoint query")
+                    continue
+                on_path.add(source.name)
+                work.append((source, self.graph.get_fanin(source), 0))
+                continue
+
+            work.pop()
+            on_path.discard(node.name)
+            at = self._start_arrival(node)
+            launches = self._start_launches(node, at) if track_launch else None
+            for source, delay, _ in fanin:
+                source_at = cache.get(source.name, -1.0)
+                if source_at == -1.0:
+                    continue
+                at = max(at, source_at + delay)
+                if track_launch:
+                    self._merge_launches(launches, self.launch.get(source.name, {}), delay)
+            cache[node.name] = node.at = at
+            if track_launch:
+                self.launch[node.name] = self._prune_launches(launches)
+
+        return cache[root.name]
+
+    def update_analysis(self, changed: List[Node]) -> Tuple[float, Optional[str], List[Dict[str, Any]]]:
+        """Re-times only the fanout cone of `changed` nodes after an incremental graph edit.
+
+        Every node in the cone pulls its AT from its fanin (via the graph's reverse
+        index), so nodes outside the cone keep their previous values.
+        """
+        print(f"Updating Arrival Times ({len(changed)} changed nodes)...")
+        self.reset_queries()
+        changed = list(changed)
+        if self.clock_tree is not None:
+            changed.extend(self._retime_clock_tree())
+
+        track_launch = self.clock_tree is not None
+        order = self._fanout_cone_order(changed)
+        for node in order:
+            at = self._start_arrival(node)
+            launches = self._start_launches(node, at) if track_launch else None
+            for source, delay, _ in self.graph.get_fanin(node):
+                if source.at == -1.0:
+                    continue
+                at = max(at, source.at + delay)
+                if track_launch:
+                    self._merge_launches(launches, self.launch.get(source.name, {}), delay)
+            node.at = at
+            if track_launch:
+                self.launch[node.name] = self._prune_launches(launches)
+
+        for node in order + changed:
+            node.rt = self._required_time(node)
+        return self._update_slack(order + changed)
+
+    def _retime_clock_tree(self) -> List[Node]:
+        """Rebuilds the clock tree; returns the register pins whose clock latency moved."""
+        old = self.clock_tree
+        self._prepare_clock()
+        moved = []
+        for name in set(old.late) | set(self.clock_tree.late):
+            if old.late.get(name) == self.clock_tree.late.get(name) and old.early.get(name) == self.clock_tree.early.get(name):
+                continue
+            inst = name.rsplit("/", 1)[0]
+            for pin in ("Q", "D"):
+                node = self.graph.get_node(f"{inst}/{pin}")
+                if node is not None:
+                    moved.append(node)
+        return moved
+
+    def _fanout_cone_order(self, roots: List[Node]) -> List[Node]:
+        """Returns the transitive fanout of `roots` in topological order."""
+        cone = set()
+        stack = [n for n in roots if n.name in self.graph.nodes]
+        while stack:
+            node = stack.pop()
+            if node in cone:
+                continue
+            cone.add(node)
+            stack.extend(target for target, _, _ in node.edges)
+
+        # An edit may have closed a loop; only the cone can contain it
+        order = self._break_loops(list(cone))
+        if order is not None:
+            return order
+
+        in_degree = defaultdict(int)
+        for node in cone:
+            for target, _, _ in node.edges:
+                in_degree[target] += 1
+
+        queue = deque(n for n in cone if in_degree[n] == 0)
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for target, _, _ in node.edges:
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    queue.append(target)
+        return order
+
     def _propagate_arrival_times(self):
         """Propagates Arrival Times (AT) through the graph using topological traversal."""
         print("Propagating Arrival Times...")
         nodes = self.graph.get_all_nodes()
         
-        # 1. Initialize and Set Start Points
+        # 1. Break Combinational Loops (without any, the breaker's Kahn pass is the sort)
+        topo_order = self._break_loops(nodes)
+        self.reset_queries()
+
+        # 2. Initialize and Set Start Points (timing the clock tree first if propagated)
         self._reset_at(nodes)
+        self.launch = {}
+        self._prepare_clock()
         self._apply_input_delays(nodes)
         
-        # 2. Topological Sort
-        topo_order = self._topological_sort(nodes)
+        # 3. Topological Sort
+        if topo_order is None:
+            topo_order = self._topological_sort(nodes)
         
-        # 3. Propagate Delays
+        # 4. Propagate Delays (with propagated clocks, per launch register for CRPR)
+        track_launch = self.clock_tree is not None
         for node in topo_order:
             if node.at == -1.0: 
                 continue
-                
+
+            if track_launch:
+                # All fanin has been pushed by now, so the candidates are final
+                launches = self.launch[node.name] = self._prune_launches(self.launch.get(node.name, {}))
             for target_node, delay, _ in node.edges:
                 new_at = node.at + delay
                 if new_at > target_node.at:
                     target_node.at = new_at
+                if track_launch:
+                    self._merge_launches(self.launch.setdefault(target_node.name, {}), launches, delay)
+
+    def _start_launches(self, node: Node, at: float) -> Dict[Optional[str], float]:
+        """Launch candidates of a start point: its register clock pin (None for inputs)."""
+        if at == -1.0:
+            return {}
+        return {self._register_clock_pin(node) if self._is_dff_output(node) else None: at}
+
+    def _merge_launches(self, launches: Dict[Optional[str], float], source: Dict[Optional[str], float], delay: float):
+        for launch, at in source.items():
+            at += delay
+            if at > launches.get(launch, -1.0):
+                launches[launch] = at
+
+    def _prune_launches(self, launches: Dict[Optional[str], float]) -> Dict[Optional[str], float]:
+        """Drops launches that cannot give the worst slack at any capture register.
+
+        A launch with AT a and CRPR credit in [lo, hi] yields a slack between
+        RT + lo - a and RT + hi - a, so it is dominated once another launch's
+        RT + hi' - a' lies below RT + lo - a for every capture pin.
+        """
+        if len(launches) < 2:
+            return launches
+        bounds = {launch: self.clock_tree.credit_bounds(launch) for launch in launches}
+        worst = max(at - bounds[launch][1] for launch, at in launches.items())
+        return {launch: at for launch, at in launches.items() if at - bounds[launch][0] >= worst}
+
+    def _prepare_clock(self):
+        """Times the clock network when `propagated_clock` is set; otherwise clocks are ideal."""
+        if not self.constraints.get('propagated_clock', False):
+            self.clock_tree = None
+            return
+
+        self.clock_tree = ClockTree(
+            self.graph,
+            self.constraints.get('clock_port', 'clk'),
+            self.constraints.get('clock_derate_early', 1.0),
+            self.constraints.get('clock_derate_late', 1.0),
+        ).build()
+        sinks = self.clock_tree.sinks()
+        if sinks:
+            latencies = [self.clock_tree.late[s] for s in sinks]
+            print(f"Propagated clock: {len(sinks)} sinks, latency {min(latencies):.4f} - {max(latencies):.4f} ns")
+
+    def _break_loops(self, nodes: List[Node]) -> Optional[List[Node]]:
+        """Finds combinational loops (SCCs) among `nodes` and cuts them per the configured policy.
+
+        Returns a topological order of `nodes` when there was no loop to cut, else None.
+        """
+        breaker = LoopBreaker.from_constraints(self.graph, self.constraints)
+        loops = breaker.run(nodes)
+        for loop in loops:
+            print(f"Warning: Combinational loop of {loop}")
+        self.loops.extend(loops)
+        return breaker.order
 
     def _reset_at(self, nodes: List[Node]):
         for node in nodes:
@@ -44,23 +289,45 @@ class TimingAnalyzer:
 
     def _apply_input_delays(self, nodes: List[Node]):
         """Sets initial arrival times for start points (Inputs, Flip-Flops)."""
-        input_delay = self.constraints.get('input_delay', 0.0)
-        dff_clk_q = self.lib['cells']['DFF']['delay_clk_q']
-
         for node in nodes:
-            # Start Point: DFF Outputs (Q pin)
-            if self._is_dff_output(node):
-                node.at = dff_clk_q
-            
-            # Start Point: Primary Inputs
-            # Heuristic: Known input names or simple ports
-            if node.type == "port" and node.name in ["rst", "clk"]:
-                 # Clock and Reset paths usually handled differently or have 0 specific delay in basic STA
-                 # For data path STA, we often care about data inputs
-                 pass 
-            
-            if "data_in" in node.name or node.name == "rst": # Heuristic from original code
-                node.at = input_delay
+            start_at = self._start_arrival(node)
+            if start_at != -1.0:
+                node.at = start_at
+                if self.clock_tree is not None:
+                    self.launch[node.name] = self._start_launches(node, start_at)
+
+    def _start_arrival(self, node: Node) -> float:
+        """Returns the launch AT of a start point, or -1.0 if the node is not one."""
+        # Start Point: Primary Inputs
+        # Heuristic: Known input names or simple ports. Clock and Reset paths are
+        # usually handled differently; for data path STA we care about data inputs
+        if "data_in" in node.name or node.name == "rst": # Heuristic from original code
+            return self.constraints.get('input_delay', 0.0)
+
+        # Start Point: DFF Outputs (Q pin), launched by the late clock edge
+        if self._is_dff_output(node):
+            return self._clock_latency(node, late=True) + self.lib['cells']['DFF']['delay_clk_q']
+
+        return -1.0
+
+    def is_timing_point(self, node: Node) -> bool:
+        """True for pins with their own timing semantics (start/end points, the clock source)."""
+        if self.constraints.get('propagated_clock', False) and node.name == self.constraints.get('clock_port', 'clk'):
+            return True
+        return self._start_arrival(node) != -1.0 or self._required_time(node) != 999.0
+
+    def _register_clock_pin(self, node: Node) -> str:
+        inst_name = node.name.rsplit("/", 1)[0]
+        return f"{inst_name}/{self.lib['cells']['DFF'].get('clock_pin', 'C')}"
+
+    def _clock_latency(self, node: Node, late: bool) -> float:
+        """Clock arrival at the register owning `node`; 0 for ideal clocks."""
+        if self.clock_tree is None:
+            return 0.0
+        clock_pin = self._register_clock_pin(node)
+        if clock_pin not in self.clock_tree:
+            return 0.0
+        return self.clock_tree.late[clock_pin] if late else self.clock_tree.early[clock_pin]
 
     def _is_dff_output(self, node: Node) -> bool:
         return node.name.endswith("/Q") and "reg_" in node.name
@@ -87,19 +354,36 @@ class TimingAnalyzer:
     def _calculate_required_times(self):
         """Calculates Required Times (RT) based on clock period and constraints."""
         print("Calculating Required Times...")
+        for node in self.graph.get_all_nodes():
+            required = self._required_time(node)
+            if required != 999.0:
+                node.rt = required
+
+    def _required_time(self, node: Node) -> float:
+        """Returns the RT of an end point, or 999.0 if the node is not constrained."""
         period = self.constraints['clock_period']
         uncertainty = self.constraints['clock_uncertainty']
-        output_delay = self.constraints['output_delay']
-        dff_setup = self.lib['cells']['DFF']['setup']
-        
-        for node in self.graph.get_all_nodes():
-            # End Point: DFF Inputs (D pin)
-            if self._is_dff_input(node):
-                node.rt = period - dff_setup - uncertainty
-            
-            # End Point: Primary Outputs
-            if node.name == "sum_out": # Specific to example design, should be generalized
-                node.rt = period - output_delay - uncertainty
+
+        # End Point: Primary Outputs
+        if node.name == "sum_out": # Specific to example design, should be generalized
+            return period - self.constraints['output_delay'] - uncertainty
+
+        # End Point: DFF Inputs (D pin), captured by the early clock edge; the
+        # common launch/capture clock path is credited back (CRPR). The credit
+        # depends on the launch, so the RT is the one giving the worst slack
+        # over all launch candidates against the pin's AT
+        if self._is_dff_input(node):
+            required = period - self.lib['cells']['DFF']['setup'] - uncertainty
+            if self.clock_tree is not None:
+                capture = self._register_clock_pin(node)
+                required += self._clock_latency(node, late=False)
+                launches = self.launch.get(node.name)
+                if launches and node.at != -1.0:
+                    required += node.at + min(self.clock_tree.crpr(launch, capture) - at
+                                               for launch, at in launches.items())
+            return required
+
+        return 999.0
 
     def _is_dff_input(self, node: Node) -> bool:
          return node.name.endswith("/D") and "reg_" in node.name
@@ -107,26 +391,50 @@ class TimingAnalyzer:
     def _calculate_slack(self) -> Tuple[float, Optional[str], List[Dict[str, Any]]]:
         """Calculates slack for valid timing points."""
         print("Calculating Slack...")
-        worst_slack = float('inf')
-        worst_node = None
-        results = []
-        
+        self._slack_rows = {}
         for node in self.graph.get_all_nodes():
             # Only calculate slack for constrained nodes (where RT is set)
-            if node.rt == 999.0 or node.at == -1.0:
-                continue
-            
-            slack = node.rt - node.at
-            results.append({
-                "node": node.name,
-                "at": node.at,
-                "rt": node.rt,
-                "slack": slack,
-                "status": "MET" if slack >= 0 else "VIOLATED"
-            })
-            
-            if slack < worst_slack:
-                worst_slack = slack
-                worst_node = node.name
-                    
+            row = self._slack_row(node)
+            if row is not None:
+                self._slack_rows[node.name] = row
+        return self._worst_slack()
+
+    def _update_slack(self, nodes: List[Node]) -> Tuple[float, Optional[str], List[Dict[str, Any]]]:
+        """Recomputes slack only for `nodes`, keeping the other rows of the last run."""
+        if self._slack_rows is None:
+            return self._calculate_slack()
+
+        print(f"Calculating Slack ({len(nodes)} pins)...")
+        rows = self._slack_rows
+        for node in nodes:
+            row = self._slack_row(node)
+            if row is not None:
+                rows[node.name] = row
+            else:
+                rows.pop(node.name, None)
+        for name in rows.keys() - self.graph.nodes.keys(): # Pins removed by the edit
+            del rows[name]
+        return self._worst_slack()
+
+    def _slack_row(self, node: Node) -> Optional[Dict[str, Any]]:
+        if node.rt == 999.0 or node.at == -1.0:
+            return None
+
+        slack = node.rt - node.at
+        return {
+            "node": node.name,
+            "at": node.at,
+            "rt": node.rt,
+            "slack": slack,
+            "status": "MET" if slack >= 0 else "VIOLATED"
+        }
+
+    def _worst_slack(self) -> Tuple[float, Optional[str], List[Dict[str, Any]]]:
+        worst_slack = float('inf')
+        worst_node = None
+        results = list(self._slack_rows.values())
+        for row in results:
+            if row['slack'] < worst_slack:
+                worst_slack = row['slack']
+                worst_node = row['node']
         return worst_slack, worst_node, results
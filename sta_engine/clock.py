@@ -0,0 +1,137 @@
+from collections import deque, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from .graph import Graph, Node
+
+
+class ClockTree:
+    """Propagated clock network with an O(1) lowest-common-ancestor index for CRPR.
+
+    The tree is the forward cone of the clock port. Every pin keeps the
+    fanin with the latest arrival as its tree parent, and carries an early
+    and a late latency (net and buffer delays scaled by the early/late
+    derates). The LCA index is a sparse table of minimum depth over the
+    Euler tour of the tree, built once in O(n log n). Each pin also keeps
+    the range of CRPR credit (late - early) along its path from the root,
+    which bounds the credit it can share with any capture pin.
+    """
+
+    def __init__(self, graph: Graph, clock_port: str = "clk", early_derate: float = 1.0, late_derate: float = 1.0):
+        self.graph = graph
+        self.clock_port = clock_port
+        self.early_derate = early_derate
+        self.late_derate = late_derate
+
+        self.parent: Dict[str, Optional[str]] = {}
+        self.early: Dict[str, float] = {}
+        self.late: Dict[str, float] = {}
+        self.credit: Dict[str, Tuple[float, float]] = {} # Pin -> (min, max) late - early over its root path
+
+        self._first: Dict[str, int] = {} # Pin -> first position in the Euler tour
+        self._euler: List[str] = []
+        self._depth: List[int] = []
+        self._sparse: List[List[int]] = []
+
+    def build(self) -> 'ClockTree':
+        root = self.graph.get_node(self.clock_port)
+        if root is None:
+            raise ValueError(f"Clock port '{self.clock_port}' not found in the design")
+
+        self._time_tree(root)
+        self._build_lca_index(root.name)
+        return self
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.late
+
+    def sinks(self) -> List[str]:
+        """Clock tree leaves (normally register clock pins)."""
+        has_child = {p for p in self.parent.values() if p is not None}
+        return [name for name in self.parent if name not in has_child]
+
+    def lca(self, a: str, b: str) -> str:
+        """Lowest common ancestor of two clock pins via a sparse-table range-min query."""
+        lo, hi = sorted((self._first[a], self._first[b]))
+        k = (hi - lo + 1).bit_length() - 1
+        left = self._sparse[k][lo]
+        right = self._sparse[k][hi - (1 << k) + 1]
+        return self._euler[left if self._depth[left] <= self._depth[right] else right]
+
+    def crpr(self, launch: str, capture: str) -> float:
+        """Common path pessimism: the late/early latency spread at the branch point."""
+        if launch not in self.late or capture not in self.late:
+            return 0.0
+        common = self.lca(launch, capture)
+        return self.late[common] - self.early[common]
+
+    def credit_bounds(self, pin: Optional[str]) -> Tuple[float, float]:
+        """Smallest and largest CRPR credit `pin` can get against any capture pin."""
+        return self.credit.get(pin, (0.0, 0.0))
+
+    def _time_tree(self, root: Node):
+        """Times the clock cone in topological order, keeping the latest fanin as parent."""
+        cone = {root.name: root}
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            for target, _, _ in node.edges:
+                if target.name not in cone:
+                    cone[target.name] = target
+                    queue.append(target)
+
+        in_degree = defaultdict(int)
+        for node in cone.values():
+            for target, _, _ in node.edges:
+                in_degree[target.name] += 1
+
+        self.parent[root.name] = None
+        self.early[root.name] = self.late[root.name] = 0.0
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            for target, delay, _ in node.edges:
+                late = self.late[node.name] + delay * self.late_derate
+                if target.name not in self.late or late > self.late[target.name]:
+                    self.parent[target.name] = node.name
+                    self.late[target.name] = late
+                    self.early[target.name] = self.early[node.name] + delay * self.early_derate
+                in_degree[target.name] -= 1
+                if in_degree[target.name] == 0:
+                    queue.append(target)
+
+    def _build_lca_index(self, root: str):
+        children: Dict[str, List[str]] = defaultdict(list)
+        for name, parent in self.parent.items():
+            if parent is not None:
+                children[parent].append(name)
+
+        # Iterative Euler tour: a node is recorded on entry and after each child
+        work: List[Tuple[str, int, int]] = [(root, 0, 0)] # (pin, depth, next child)
+        while work:
+            name, depth, child = work[-1]
+            if child == 0:
+                self._first[name] = len(self._euler)
+                spread = self.late[name] - self.early[name]
+                low, high = self.credit.get(self.parent[name], (spread, spread))
+                self.credit[name] = (min(low, spread), max(high, spread))
+            self._euler.append(name)
+            self._depth.append(depth)
+
+            kids = children.get(name, [])
+            if child < len(kids):
+                work[-1] = (name, depth, child + 1)
+                work.append((kids[child], depth + 1, 0))
+            else:
+                work.pop()
+
+        level = list(range(len(self._euler)))
+        self._sparse = [level]
+        span = 1
+        while 2 * span <= len(self._euler):
+            prev = self._sparse[-1]
+            level = []
+            for i in range(len(self._euler) - 2 * span + 1):
+                a, b = prev[i], prev[i + span]
+                level.append(a if self._depth[a] <= self._depth[b] else b)
+            self._sparse.append(level)
+            span *= 2
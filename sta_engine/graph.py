@@ -10,6 +10,7 @@ class Node:
     at: float = -1.0  # Arrival Time
     rt: float = 999.0  # Required Time
     slack: float = 0.0  # Slack
+    cell: Optional[str] = None  # Library cell of the owning instance (pins only)
 
     def add_edge(self, target: 'Node', weight: float, edge_type: str):
         self.edges.append((target, weight, edge_type))
@@ -29,10 +30,14 @@ class Graph:
     """Manages the graph nodes and connectivity."""
     def __init__(self):
         self.nodes: Dict[str, Node] = {} # name -> Node
+        self._fanin: Optional[Dict[str, List[Tuple[Node, float, str]]]] = None # name -> [(source, weight, edge_type)]
+        self._reachability = None # ReachabilityIndex, built on first cone query
+        self.revision = 0 # Bumped on every structural change, so analyzers can cache derived layouts
 
     def get_or_create_node(self, name: str, node_type: str = "pin") -> Node:
         if name not in self.nodes:
             self.nodes[name] = Node(name, node_type)
+            self._structure_changed()
         return self.nodes[name]
     
     def get_node(self, name: str) -> Optional[Node]:
@@ -41,5 +46,87 @@ class Graph:
     def get_all_nodes(self) -> List[Node]:
         return list(self.nodes.values())
 
+    def add_edge(self, source: Node, target: Node, weight: float, edge_type: str):
+        """Adds an edge, keeping the fanin index current if it has been built."""
+        source.add_edge(target, weight, edge_type)
+        self._structure_changed()
+        if self._fanin is not None:
+            self._fanin.setdefault(target.name, []).append((source, weight, edge_type))
+
+    def get_fanin(self, node: Node) -> List[Tuple[Node, float, str]]:
+        """Returns the incoming edges of a node; the reverse index is built on first use."""
+        if self._fanin is None:
+            self._fanin = {}
+            for source in self.nodes.values():
+                for target, weight, edge_type in source.edges:
+                    self._fanin.setdefault(target.name, []).append((source, weight, edge_type))
+        return self._fanin.get(node.name, [])
+
+    def remove_edge(self, source: Node, target: Node, edge_type: str):
+        """Removes the edges of the given type from source to target."""
+        source.edges = [e for e in source.edges if not (e[0] is target and e[2] == edge_type)]
+        self._structure_changed()
+        if self._fanin is not None:
+            self._fanin[target.name] = [e for e in self._fanin.get(target.name, [])
+                                        if not (e[0] is source and e[2] == edge_type)]
+
+    def remove_edges(self, source: Node, edge_type: str):
+        """Removes all outgoing edges of the given type from a node."""
+        self._structure_changed()
+        if self._fanin is not None:
+            for target, _, kind in source.edges:
+                if kind == edge_type:
+                    self._fanin[target.name] = [e for e in self._fanin[target.name]
+                                                if not (e[0] is source and e[2] == edge_type)]
+        source.edges = [e for e in source.edges if e[2] != edge_type]
+
+    def remove_node(self, name: str):
+        """Removes a node together with its incoming and outgoing edges."""
+        node = self.nodes.pop(name, None)
+        if node is None:
+            return
+        self._structure_changed()
+
+        for source, _, _ in self.get_fanin(node):
+            source.edges = [e for e in source.edges if e[0] is not node]
+        for target, _, _ in node.edges:
+            self._fanin[target.name] = [e for e in self._fanin[target.name] if e[0] is not node]
+        self._fanin.pop(name, None)
+        node.edges = []
+
+    def clear(self):
+        self.nodes.clear()
+        self._fanin = None
+        self._structure_changed()
+
+    def fanin_cone(self, name: str) -> List[str]:
+        """Startpoints (pins without fanin, see ReachabilityIndex) whose fanout cone contains `name`."""
+        return self.reachability().fanin_startpoints(self._require(name))
+
+    def fanout_cone(self, name: str) -> List[str]:
+        """Endpoints (pins without fanout, see ReachabilityIndex) in the fanout cone of `name`."""
+        return self.reachability().fanout_endpoints(self._require(name))
+
+    def reaches(self, source: str, target: str) -> bool:
+        """True if a timing path leads from `source` to `target`."""
+        return self.reachability().reaches(self._require(source), self._require(target))
+
+    def reachability(self):
+        """Returns the reachability index, rebuilding it if the graph changed since the last query."""
+        if self._reachability is None:
+            # Imported here: the index module depends on this one
+            from .reachability import ReachabilityIndex
+            self._reachability = ReachabilityIndex(self).build()
+        return self._reachability
+
+    def _structure_changed(self):
+        self._reachability = None
+        self.revision += 1
+
+    def _require(self, name: str) -> str:
+        if name not in self.nodes:
+            raise ValueError(f"Pin '{name}' not found in the design")
+        return name
+
     def summary(self) -> str:
         return f"Total Nodes: {len(self.nodes)}"
@@ -0,0 +1,198 @@
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Set, Tuple
+
+from pyverilog.vparser.ast import InstanceList, ModuleDef
+from pyverilog.vparser.parser import VerilogParser as PyverilogParser
+
+from .graph import Graph, Node
+from .parser import VerilogParser
+from .statements import iter_statements
+
+
+@dataclass
+class NetlistDiff:
+    """Instance-level and connection-level changes applied by a re-parse."""
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    nets: Set[str] = field(default_factory=set)
+    touched: List[Node] = field(default_factory=list)  # Nodes whose fanin or start/end status changed
+    full_rebuild: bool = False
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed or self.full_rebuild)
+
+    def summary(self) -> str:
+        if self.full_rebuild:
+            return "Ports changed: full rebuild"
+        return (f"+{len(self.added)} / -{len(self.removed)} / ~{len(self.changed)} instances, "
+                f"{len(self.nets)} nets reconnected")
+
+
+class IncrementalParser(VerilogParser):
+    """VerilogParser that keeps its parse state and patches the live Graph on re-parse.
+
+    The file is first compared with the previous version statement by
+    statement (comments and whitespace ignored). Only the instance
+    statements that were added or removed are run through Pyverilog, with
+    one parser kept for the whole session (building its LALR tables costs
+    more than parsing a large netlist), and instances are compared by (cell type, port -> net) signature; only the
+    pins of added, removed or re-wired instances and the edges of the nets
+    they sit on are rebuilt. A change to the module header re-parses the
+    whole module and falls back to a full rebuild of the same Graph object
+    if the ports changed.
+    """
+
+    def __init__(self, library_config: Dict[str, Any]):
+        super().__init__(library_config)
+        self.ports: List[Tuple[str, str]] = []
+        self.statements: Counter = Counter() # Normalized statement text -> occurrences
+        self._statement_parser = None
+
+    def parse(self, file_path: str) -> Graph:
+        graph = super().parse(file_path)
+        self.statements = self._read_statements(file_path)
+        if self._statement_parser is None:
+            self._statement_parser = PyverilogParser()
+        return graph
+
+    def reparse(self, file_path: str) -> NetlistDiff:
+        """Re-reads the file and applies only the differences to the Graph."""
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"{file_path} not found")
+
+        print(f"Re-parsing Verilog: {file_path}")
+        statements = self._read_statements(file_path)
+        added = statements - self.statements
+        removed = self.statements - statements
+        if any(self._needs_module_parse(text) for text in added + removed):
+            return self._reparse_module(file_path)
+
+        # Declarations, assigns and unknown cells never reach the graph
+        added = [text for text in added.elements() if self._is_instance(text)]
+        removed = [text for text in removed.elements() if self._is_instance(text)]
+        try:
+            old_instances = self._parse_statements(removed)
+            new_instances = self._parse_statements(added)
+        except Exception as e:
+            raise RuntimeError(f"Failed to parse Verilog file: {e}") from e
+        self.statements = statements
+
+        diff = NetlistDiff()
+        for name, inst in new_instances.items():
+            if name not in self.instances:
+                diff.added.append(name)
+            elif name not in old_instances or self._instance_signature(inst) != self.instances[name]:
+                diff.changed.append(name)
+        diff.removed = [name for name in old_instances if name not in new_instances and name in self.instances]
+        return self._apply(diff, new_instances)
+
+    def _reparse_module(self, file_path: str) -> NetlistDiff:
+        """Re-parses the whole module and diffs every instance (used when the header changed)."""
+        try:
+            module_def = self._read_module(file_path)
+        except Exception as e:
+            raise RuntimeError(f"Failed to parse Verilog file: {e}") from e
+
+        if self._collect_ports(module_def) != self.ports:
+            return self._rebuild(file_path)
+        self.statements = self._read_statements(file_path)
+
+        new_instances = self._collect_instances(module_def)
+        diff = NetlistDiff()
+        for name, inst in new_instances.items():
+            if name not in self.instances:
+                diff.added.append(name)
+            elif self._instance_signature(inst) != self.instances[name]:
+                diff.changed.append(name)
+        diff.removed = [name for name in self.instances if name not in new_instances]
+        return self._apply(diff, new_instances)
+
+    def _apply(self, diff: NetlistDiff, new_instances: Dict[str, Any]) -> NetlistDiff:
+        """Patches the Graph for the instances in `diff`; `new_instances` holds the new ASTs."""
+        for name in diff.removed + diff.changed:
+            diff.nets.update(self._remove_instance(name))
+        for name in diff.added + diff.changed:
+            self._process_single_instance(new_instances[name])
+            if name in self.instances:
+                diff.nets.update(self.instances[name][1].values())
+                diff.touched.extend(self._instance_pins(name))
+
+        for net_name in diff.nets:
+            for driver in self.net_drivers.get(net_name, []):
+                self.graph.remove_edges(driver, "net")
+            self._connect_net(net_name)
+            diff.touched.extend(self.net_loads.get(net_name, []))
+
+        return diff
+
+    def _read_statements(self, file_path: str) -> Counter:
+        return Counter(" ".join(text.split()) for text in iter_statements(file_path, directives=True) if text)
+
+    def _needs_module_parse(self, statement: str) -> bool:
+        """True for the module header and for statements using compiler directives (the
+        statement parser skips the preprocessor)."""
+        return re.match(r"(module|macromodule)\b", statement) is not None or "`" in statement
+
+    def _is_instance(self, statement: str) -> bool:
+        head = re.match(r"[\w$]+", statement)
+        return head is not None and head.group(0) in self.lib['cells']
+
+    def _parse_statements(self, statements: List[str]) -> Dict[str, Any]:
+        """Runs Pyverilog on just the given instance statements; returns their instances by name."""
+        if not statements:
+            return {}
+        text = "module incremental_patch;\n" + "".join(f"{stmt};\n" for stmt in statements) + "endmodule\n"
+        ast = self._statement_parser.parse(text, debug=0)
+        return self._collect_instances(ast.description.definitions[0])
+
+    def _rebuild(self, file_path: str) -> NetlistDiff:
+        self.graph.clear()
+        self.net_drivers.clear()
+        self.net_loads.clear()
+        self.instances.clear()
+        self.parse(file_path)
+        return NetlistDiff(full_rebuild=True, touched=self.graph.get_all_nodes())
+
+    def _build(self, module_def: ModuleDef):
+        super()._build(module_def)
+        self.ports = self._collect_ports(module_def)
+
+    def _collect_instances(self, module_def: ModuleDef) -> Dict[str, Any]:
+        instances = {}
+        for item in module_def.items:
+            if isinstance(item, InstanceList):
+                for inst in item.instances:
+                    # Unknown cells never make it into the graph; don't report them as edits
+                    if inst.module in self.lib['cells']:
+                        instances[inst.name] = inst
+        return instances
+
+    def _collect_ports(self, module_def: ModuleDef) -> List[Tuple[str, str]]:
+        declarations = (self._port_declaration(port) for port in module_def.portlist.ports)
+        return [(type(decl).__name__, decl.name) for decl in declarations if decl is not None]
+
+    def _instance_pins(self, inst_name: str) -> List[Node]:
+        cell_type, connections = self.instances[inst_name]
+        cell_info = self.lib['cells'][cell_type]
+        pins = set(connections) | set(cell_info.get('inputs', [])) | set(cell_info.get('outputs', []))
+        return [node for node in (self.graph.get_node(f"{inst_name}/{pin}") for pin in sorted(pins)) if node is not None]
+
+    def _remove_instance(self, inst_name: str) -> Set[str]:
+        """Drops an instance's pins from the Graph and net tables; returns the nets it was on."""
+        if inst_name not in self.instances:
+            return set()
+
+        pins = self._instance_pins(inst_name)
+        _, connections = self.instances.pop(inst_name)
+        nets = set(connections.values())
+        for net_name in nets:
+            for table in (self.net_drivers, self.net_loads):
+                if net_name in table:
+                    table[net_name] = [n for n in table[net_name] if n not in pins]
+        for node in pins:
+            self.graph.remove_node(node.name)
+        return nets
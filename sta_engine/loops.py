@@ -0,0 +1,198 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from .graph import Graph, Node
+
+
+@dataclass
+class CombinationalLoop:
+    """A strongly connected component of the timing graph and the edges cut to open it."""
+    pins: List[str]
+    broken_edges: List[Tuple[str, str, float, str]] = field(default_factory=list) # (source, target, weight, edge_type)
+
+    def __str__(self):
+        limit = 8
+        pins = ", ".join(self.pins[:limit]) + (", ..." if len(self.pins) > limit else "")
+        cuts = ", ".join(f"{src} -> {dst}" for src, dst, _, _ in self.broken_edges[:limit])
+        if len(self.broken_edges) > limit:
+            cuts += f", ... ({len(self.broken_edges)} edges)"
+        return f"{len(self.pins)} pins [{pins}], broken at {cuts}"
+
+
+def find_strongly_connected_components(nodes: List[Node]) -> List[List[Node]]:
+    """Iterative Tarjan SCC over the subgraph induced by `nodes`, O(V+E)."""
+    # Bookkeeping is keyed by id(): Node hashes by name in Python code, which dominates on large graphs
+    members = {id(node) for node in nodes}
+    index: Dict[int, int] = {}
+    lowlink: Dict[int, int] = {}
+    on_stack: Set[int] = set()
+    stack: List[Node] = []
+    components = []
+    counter = 0
+
+    for root in nodes:
+        if id(root) in index:
+            continue
+
+        # Each frame is (node, position in its edge list)
+        work = [(root, 0)]
+        index[id(root)] = lowlink[id(root)] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(id(root))
+
+        while work:
+            node, pos = work[-1]
+            key = id(node)
+            edges = node.edges
+            while pos < len(edges) and id(edges[pos][0]) not in members:
+                pos += 1
+
+            if pos < len(edges):
+                work[-1] = (node, pos + 1)
+                target = edges[pos][0]
+                target_key = id(target)
+                if target_key not in index:
+                    index[target_key] = lowlink[target_key] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack.add(target_key)
+                    work.append((target, 0))
+                elif target_key in on_stack:
+                    lowlink[key] = min(lowlink[key], index[target_key])
+                continue
+
+            work.pop()
+            if work:
+                parent_key = id(work[-1][0])
+                lowlink[parent_key] = min(lowlink[parent_key], lowlink[key])
+
+            if lowlink[key] == index[key]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(id(member))
+                    component.append(member)
+                    if member is node:
+                        break
+                components.append(component)
+
+    return components
+
+
+def kahn_order(nodes: List[Node]) -> Tuple[List[Node], List[Node]]:
+    """Kahn's algorithm over the subgraph induced by `nodes`.
+
+    Returns (topological order of the nodes it could order, the rest); the
+    rest are the pins on a cycle or downstream of one, so it is empty
+    exactly when the subgraph is acyclic. The order is the same FIFO order
+    as TimingAnalyzer._topological_sort.
+    """
+    in_degree: Dict[int, int] = dict.fromkeys(map(id, nodes), 0)
+    for node in nodes:
+        for target, _, _ in node.edges:
+            key = id(target)
+            if key in in_degree:
+                in_degree[key] += 1
+
+    ordered = [node for node in nodes if in_degree[id(node)] == 0]
+    for node in ordered: # Grows while iterating
+        for target, _, _ in node.edges:
+            key = id(target)
+            if key in in_degree:
+                in_degree[key] -= 1
+                if in_degree[key] == 0:
+                    ordered.append(target)
+
+    if len(ordered) == len(nodes):
+        return ordered, []
+    return ordered, [node for node in nodes if in_degree[id(node)] > 0]
+
+
+class LoopBreaker:
+    """Finds combinational loops and removes edges until the graph is acyclic.
+
+    Policies:
+      - "back_edge": cut the edges that close a cycle in a DFS of each loop,
+        started from its alphabetically first pin (deterministic).
+      - "pins": first cut the in-loop edges entering the configured `pins`,
+        then fall back to "back_edge" for any cycle that remains.
+    """
+
+    POLICIES = ("back_edge", "pins")
+
+    def __init__(self, graph: Graph, policy: str = "back_edge", pins: Optional[List[str]] = None):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown loop breaking policy '{policy}' (expected one of {', '.join(self.POLICIES)})")
+        self.graph = graph
+        self.policy = policy
+        self.pins = set(pins or [])
+        self.order: Optional[List[Node]] = None # Topological order of the last run's nodes, if it found no loop
+
+    @classmethod
+    def from_constraints(cls, graph: Graph, constraints: Dict[str, Any]) -> 'LoopBreaker':
+        settings = constraints.get('loop_breaking', {})
+        return cls(graph, settings.get('policy', 'back_edge'), settings.get('pins'))
+
+    def run(self, nodes: Optional[List[Node]] = None) -> List[CombinationalLoop]:
+        """Breaks every loop in `nodes` (default: the whole graph) and reports them."""
+        if nodes is None:
+            nodes = self.graph.get_all_nodes()
+
+        # Kahn first: SCCs are only searched among the pins it cannot order
+        ordered, unordered = kahn_order(nodes)
+        self.order = None if unordered else ordered
+        loops = []
+        for component in find_strongly_connected_components(unordered):
+            if len(component) == 1 and not any(t is component[0] for t, _, _ in component[0].edges):
+                continue
+
+            component.sort(key=lambda n: n.name)
+            loop = CombinationalLoop([n.name for n in component])
+            if self.policy == "pins":
+                self._cut_at_pins(component, loop)
+            self._cut_back_edges(component, loop)
+            loops.append(loop)
+        return loops
+
+    def _cut(self, source: Node, target: Node, weight: float, edge_type: str, loop: CombinationalLoop):
+        self.graph.remove_edge(source, target, edge_type)
+        loop.broken_edges.append((source.name, target.name, weight, edge_type))
+
+    def _cut_at_pins(self, component: List[Node], loop: CombinationalLoop):
+        members = set(component)
+        for node in component:
+            for target, weight, edge_type in list(node.edges):
+                if target in members and target.name in self.pins:
+                    self._cut(node, target, weight, edge_type, loop)
+
+    def _cut_back_edges(self, component: List[Node], loop: CombinationalLoop):
+        """Iterative DFS restricted to the component; edges into the DFS stack close cycles."""
+        members = set(component)
+        visited: Set[Node] = set()
+        on_path: Set[Node] = set()
+
+        for root in component:
+            if root in visited:
+                continue
+            visited.add(root)
+            on_path.add(root)
+            work = [(root, list(root.edges), 0)]
+
+            while work:
+                node, edges, pos = work[-1]
+                if pos == len(edges):
+                    work.pop()
+                    on_path.discard(node)
+                    continue
+
+                work[-1] = (node, edges, pos + 1)
+                target, weight, edge_type = edges[pos]
+                if target not in members:
+                    continue
+                if target in on_path:
+                    self._cut(node, target, weight, edge_type, loop)
+                elif target not in visited:
+                    visited.add(target)
+                    on_path.add(target)
+                    work.append((target, list(target.edges), 0))
@@ -0,0 +1,527 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import json
+import os
+import re
+from array import array
+from typing import Dict, List, Any, Optional, Tuple
+
+from .analysis import TimingAnalyzer
+from .graph import Graph, Node
+from .loops import find_strongly_connected_components
+from .statements import iter_statements
+
+# Connection roles, as in VerilogParser.net_loads / net_drivers
+LOAD, DRIVER = 0, 1
+KIND_PIN, KIND_PORT = 0, 1
+
+_KEYWORDS = {"wire", "reg", "logic", "assign", "input", "output", "inout", "parameter", "localparam",
+             "supply0", "supply1", "tri", "genvar", "integer", "defparam"}
+_PORT_DECL = re.compile(r"^\s*(input|output|inout)\b\s*(?:wire|reg|logic)?\s*(?:signed\s*)?(?:\[[^\]]*\]\s*)?([\w$]+)\s*$")
+_INSTANCE = re.compile(r"^\s*(\\\S+|[\w$]+)\s*(?:\[[^\]]*\])?\s*\((.*)\)\s*$", re.S)
+_CONNECTION = re.compile(r"\.\s*([\w$]+)\s*\(\s*([^()]*?)\s*\)")
+
+
+class _ColumnWriter:
+    """Appends values to a raw binary column file in fixed-size chunks."""
+
+    def __init__(self, path: str, typecode: str, chunk_size: int):
+        self.file = open(path, 'wb')
+        self.typecode = typecode
+        self.chunk_size = chunk_size
+        self.buffer = array(typecode)
+        self.count = 0
+
+    def append(self, value):
+        self.buffer.append(value)
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        self.buffer.tofile(self.file)
+        self.count += len(self.buffer)
+        self.buffer = array(self.typecode)
+
+    def close(self) -> int:
+        self.flush()
+        self.file.close()
+        return self.count
+
+
+class OutOfCoreGraph:
+    """A timing graph stored as memory-mapped column files in `workdir`.
+
+    Files: pin names (UTF-8 blob + offsets) and pin kinds, the arc list
+    (source, target, delay), the same arcs as a CSR sorted by source, and
+    the AT / RT / slack arrays written by OutOfCoreAnalyzer.
+    """
+
+    def __init__(self, workdir: str):
+        if np is None:
+            raise RuntimeError("numpy not installed. Please run 'uv add numpy'")
+        self.workdir = workdir
+        with open(self.path("meta.json")) as f:
+            meta = json.load(f)
+        self.num_pins: int = meta["pins"]
+        self.num_arcs: int = meta["arcs"]
+        self.design: str = meta.get("design", "")
+        self._name_offsets = self.column("names.idx", np.uint64)
+        self._name_blob = self.column("names.bin", np.uint8)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.workdir, name)
+
+    def column(self, name: str, dtype, mode: str = 'r', length: Optional[int] = None):
+        """Memory-maps a column file; `mode='w+'` creates it with `length` entries."""
+        if mode == 'w+':
+            return np.memmap(self.path(name), dtype=dtype, mode='w+', shape=(max(length, 1),))[:length]
+        if os.path.getsize(self.path(name)) == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(self.path(name), dtype=dtype, mode=mode)
+
+    def names(self, lo: int, hi: int) -> List[str]:
+        """Pin names for ids [lo, hi)."""
+        offsets = self._name_offsets
+        start, end = int(offsets[lo]), int(offsets[hi])
+        blob = bytes(self._name_blob[start:end]).decode('utf-8')
+        bounds = (offsets[lo:hi + 1] - start).tolist()
+        return [blob[bounds[i]:bounds[i + 1]] for i in range(hi - lo)]
+
+    def name(self, pin: int) -> str:
+        return self.names(pin, pin + 1)[0]
+
+
+class OutOfCoreBuilder:
+    """Streams a structural Verilog netlist into an OutOfCoreGraph without building `Node`s.
+
+    The file is read statement by statement with regular expressions (ANSI
+    module ports and named-port cell instances, the subset VerilogParser
+    turns into timing nodes). Pins, internal cell arcs and net connections
+    are appended to column files in chunks. Net edges are then built by
+    sorting the connection records by net, and the arcs are re-sorted by
+    source into a CSR. Peak memory is a few arrays over the connection or
+    arc count (for the sorts), never per-pin Python objects. Connections
+    are sorted by a 64-bit hash of the net name, which brings each net's
+    connections together; nets are then told apart by name, chunk by
+    chunk, so a hash collision cannot merge two nets.
+    """
+
+    def __init__(self, library_config: Dict[str, Any], workdir: str, chunk_size: int = 1 << 20):
+        if np is None:
+            raise RuntimeError("numpy not installed. Please run 'uv add numpy'")
+        self.lib = library_config
+        self.workdir = workdir
+        self.chunk_size = chunk_size
+        self.num_pins = 0
+
+    def build(self, file_path: str) -> OutOfCoreGraph:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"{file_path} not found")
+        os.makedirs(self.workdir, exist_ok=True)
+
+        print(f"Streaming Verilog into {self.workdir}: {file_path}")
+        self._open_writers()
+        try:
+            for statement in iter_statements(file_path):
+                self._process_statement(statement)
+        finally:
+            counts = {name: writer.close() for name, writer in self.writers.items()}
+            self.names_file.close()
+            self.conn_names_file.close()
+
+        self._build_net_arcs(counts["conn_net"])
+        num_arcs = self._build_csr()
+
+        with open(os.path.join(self.workdir, "meta.json"), 'w') as f:
+            json.dump({"design": file_path, "pins": self.num_pins, "arcs": num_arcs}, f)
+        print(f"Out-of-core graph: {self.num_pins} pins, {num_arcs} arcs")
+        return OutOfCoreGraph(self.workdir)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.workdir, name)
+
+    def _open_writers(self):
+        columns = {
+            "names_idx": ("names.idx", 'Q'), "kind": ("kind.bin", 'b'),
+            "conn_net": ("conn_net.bin", 'q'), "conn_pin": ("conn_pin.bin", 'q'), "conn_role": ("conn_role.bin", 'b'),
+            "conn_name_idx": ("conn_name.idx", 'Q'),
+            "arc_src": ("arc_src.bin", 'q'), "arc_dst": ("arc_dst.bin", 'q'), "arc_delay": ("arc_delay.bin", 'd'),
+        }
+        self.writers = {key: _ColumnWriter(self._path(name), code, self.chunk_size) for key, (name, code) in columns.items()}
+        self.names_file = open(self._path("names.bin"), 'wb')
+        self.names_size = 0
+        self.writers["names_idx"].append(0)
+        self.conn_names_file = open(self._path("conn_name.bin"), 'wb')
+        self.conn_names_size = 0
+        self.writers["conn_name_idx"].append(0)
+
+    def _process_statement(self, statement: str):
+        if not statement:
+            return
+        head = re.match(r"[\w$]+", statement)
+        if head is None:
+            print(f"Warning: Skipping unrecognized statement '{statement[:60]}'")
+            return
+        word = head.group(0)
+        if word in ("module", "macromodule"):
+            self._process_ports(statement)
+        elif word in self.lib['cells']:
+            body = statement[head.end():]
+            if body.lstrip().startswith("#"):
+                body = body[body.index(")", body.index("#")) + 1:] # Drop a parameter override
+            for instance in self._split_instances(body):
+                self._process_instance(word, instance)
+        elif word not in _KEYWORDS:
+            print(f"Warning: Unknown cell type {word} in statement '{statement[:60]}'")
+
+    def _process_ports(self, header: str):
+        """Creates port pins for ANSI-style port declarations (like VerilogParser._process_ports)."""
+        start, end = header.find("("), header.rfind(")")
+        if start < 0 or end < 0:
+            return
+        direction = None
+        for item in header[start + 1:end].split(","):
+            match = _PORT_DECL.match(item)
+            if match:
+                direction, name = match.groups()
+            elif direction is not None and re.fullmatch(r"\s*[\w$]+\s*", item):
+                name = item.strip() # `input a, b`: b inherits the direction
+            else:
+                continue
+            pin = self._add_pin(name, KIND_PORT)
+            if direction == "input":
+                self._add_connection(name, pin, DRIVER)
+            elif direction == "output":
+                self._add_connection(name, pin, LOAD)
+
+    def _split_instances(self, body: str) -> List[str]:
+        """Splits `a (...), b (...)` at top-level commas."""
+        parts, depth, start = [], 0, 0
+        for i, char in enumerate(body):
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif char == "," and depth == 0:
+                parts.append(body[start:i])
+                start = i + 1
+        parts.append(body[start:])
+        return parts
+
+    def _process_instance(self, cell_type: str, text: str):
+        match = _INSTANCE.match(text)
+        if match is None:
+            print(f"Warning: Could not parse {cell_type} instance '{text.strip()[:60]}'")
+            return
+
+        inst_name, ports = match.groups()
+        cell_info = self.lib['cells'][cell_type]
+        inputs = cell_info.get('inputs', [])
+        outputs = cell_info.get('outputs', [])
+
+        pins: Dict[str, int] = {}
+        for port, net in _CONNECTION.findall(ports):
+            pin = pins[port] = self._add_pin(f"{inst_name}/{port}", KIND_PIN)
+            net = re.sub(r"\s+", "", net)
+            if port in inputs:
+                self._add_connection(net, pin, LOAD)
+            elif port in outputs:
+                self._add_connection(net, pin, DRIVER)
+
+        if not cell_info.get('is_seq', False):
+            delay = cell_info.get('delay', 0.0)
+            for out_pin in outputs:
+                if out_pin not in pins:
+                    pins[out_pin] = self._add_pin(f"{inst_name}/{out_pin}", KIND_PIN)
+                for in_pin in inputs:
+                    if in_pin not in pins:
+                        pins[in_pin] = self._add_pin(f"{inst_name}/{in_pin}", KIND_PIN)
+                    self._add_arc(pins[in_pin], pins[out_pin], delay)
+
+    def _add_pin(self, name: str, kind: int) -> int:
+        raw = name.encode('utf-8')
+        self.names_file.write(raw)
+        self.names_size += len(raw)
+        self.writers["names_idx"].append(self.names_size)
+        self.writers["kind"].append(kind)
+        self.num_pins += 1
+        return self.num_pins - 1
+
+    def _add_connection(self, net: str, pin: int, role: int):
+        raw = net.encode('utf-8')
+        self.conn_names_file.write(raw)
+        self.conn_names_size += len(raw)
+        self.writers["conn_name_idx"].append(self.conn_names_size)
+        self.writers["conn_net"].append(hash(net))
+        self.writers["conn_pin"].append(pin)
+        self.writers["conn_role"].append(role)
+
+    def _add_arc(self, source: int, target: int, delay: float):
+        self.writers["arc_src"].append(source)
+        self.writers["arc_dst"].append(target)
+        self.writers["arc_delay"].append(delay)
+
+    def _build_net_arcs(self, num_connections: int):
+        """Sorts connections by net and appends every driver -> load arc."""
+        if num_connections == 0:
+            return
+        nets = np.memmap(self._path("conn_net.bin"), dtype=np.int64, mode='r')
+        order = np.argsort(nets, kind='stable')
+        keys = nets[order]
+        del nets
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        ends = np.r_[starts[1:], len(keys)]
+        del keys
+
+        pins = np.memmap(self._path("conn_pin.bin"), dtype=np.int64, mode='r')
+        roles = np.memmap(self._path("conn_role.bin"), dtype=np.int8, mode='r')
+        name_offsets = np.memmap(self._path("conn_name.idx"), dtype=np.uint64, mode='r')
+        name_blob = np.memmap(self._path("conn_name.bin"), dtype=np.uint8, mode='r') \
+            if os.path.getsize(self._path("conn_name.bin")) else np.zeros(0, np.uint8)
+        fanout_factor = self.lib.get('wire_load_model', {}).get('fanout_factor', 0.0)
+
+        with open(self._path("arc_src.bin"), 'ab') as src_file, \
+                open(self._path("arc_dst.bin"), 'ab') as dst_file, \
+                open(self._path("arc_delay.bin"), 'ab') as delay_file:
+            first = 0
+            while first < len(starts):
+                # A chunk of whole nets, about chunk_size connections
+                last = int(np.searchsorted(ends, ends[first] + self.chunk_size - 1, side='right'))
+                last = max(last, first + 1)
+                lo, hi = int(starts[first]), int(ends[last - 1])
+                chunk_pins = pins[order[lo:hi]]
+                chunk_roles = roles[order[lo:hi]]
+                # The chunk holds whole hash groups, so every connection of a net
+                # is in it; number the nets by name (colliding names stay apart)
+                net_ids: Dict[bytes, int] = {}
+                first_byte = name_offsets[order[lo:hi]].tolist()
+                last_byte = name_offsets[order[lo:hi] + 1].tolist()
+                net_of = np.array([net_ids.setdefault(bytes(name_blob[a:b]), len(net_ids))
+                                   for a, b in zip(first_byte, last_byte)], dtype=np.int64)
+                num_nets = len(net_ids)
+
+                is_load = chunk_roles == LOAD
+                is_driver = chunk_roles == DRIVER
+                loads = np.bincount(net_of[is_load], minlength=num_nets)
+                drivers = np.bincount(net_of[is_driver], minlength=num_nets)
+                delay = loads * fanout_factor
+
+                # Single-driver nets (the common case) vectorized; the rest pairwise
+                single = drivers == 1
+                driver_pin = np.full(num_nets, -1, dtype=np.int64)
+                sole = is_driver & single[net_of]
+                driver_pin[net_of[sole]] = chunk_pins[sole]
+                picked = is_load & single[net_of]
+                src = [driver_pin[net_of[picked]]]
+                dst = [chunk_pins[picked]]
+                delays = [delay[net_of[picked]]]
+
+                for net in np.flatnonzero(drivers > 1):
+                    in_net = net_of == net
+                    net_drivers = chunk_pins[in_net & is_driver]
+                    net_loads = chunk_pins[in_net & is_load]
+                    src.append(np.repeat(net_drivers, len(net_loads)))
+                    dst.append(np.tile(net_loads, len(net_drivers)))
+                    delays.append(np.full(len(net_drivers) * len(net_loads), delay[net]))
+
+                np.concatenate(src).astype(np.int64).tofile(src_file)
+                np.concatenate(dst).astype(np.int64).tofile(dst_file)
+                np.concatenate(delays).astype(np.float64).tofile(delay_file)
+                first = last
+
+    def _build_csr(self) -> int:
+        """Sorts the arc list by source into CSR offsets / targets / delays."""
+        src = np.memmap(self._path("arc_src.bin"), dtype=np.int64, mode='r') if os.path.getsize(self._path("arc_src.bin")) else np.zeros(0, np.int64)
+        num_arcs = len(src)
+
+        offsets = np.memmap(self._path("csr_offsets.bin"), dtype=np.int64, mode='w+', shape=(self.num_pins + 1,))
+        offsets[0] = 0
+        np.cumsum(np.bincount(src, minlength=self.num_pins), out=offsets[1:])
+        offsets.flush()
+        if num_arcs == 0:
+            open(self._path("csr_dst.bin"), 'wb').close()
+            open(self._path("csr_delay.bin"), 'wb').close()
+            return 0
+
+        order = np.argsort(src, kind='stable')
+        del src
+        dst = np.memmap(self._path("arc_dst.bin"), dtype=np.int64, mode='r')
+        delay = np.memmap(self._path("arc_delay.bin"), dtype=np.float64, mode='r')
+        csr_dst = np.memmap(self._path("csr_dst.bin"), dtype=np.int64, mode='w+', shape=(num_arcs,))
+        csr_delay = np.memmap(self._path("csr_delay.bin"), dtype=np.float64, mode='w+', shape=(num_arcs,))
+        for lo in range(0, num_arcs, self.chunk_size):
+            idx = order[lo:lo + self.chunk_size]
+            csr_dst[lo:lo + len(idx)] = dst[idx]
+            csr_delay[lo:lo + len(idx)] = delay[idx]
+        csr_dst.flush()
+        csr_delay.flush()
+        return num_arcs
+
+
+def _arc_indices(first, counts):
+    """CSR arc indices of several pins (a ragged arange over their [first, first + count) ranges)."""
+    return np.repeat(first - np.cumsum(counts) + counts, counts) + np.arange(int(counts.sum()))
+
+
+class OutOfCoreAnalyzer:
+    """Times an OutOfCoreGraph level by level with a bounded working set.
+
+    Start and end point rules are TimingAnalyzer's (`_start_arrival`,
+    `_required_time`), applied to a transient Node per pin. Propagation
+    follows Kahn frontiers over the CSR: each frontier is processed in
+    chunks of `chunk_size` pins, so only the chunk's arcs are in memory
+    while AT and in-degree live in memory-mapped files. Pins on
+    combinational loops never reach the frontier and are reported, not
+    timed (the loop breaker needs the in-memory graph); their member pins
+    are listed. Propagated clocks are not supported.
+    """
+
+    def __init__(self, graph: OutOfCoreGraph, constraints: Dict[str, float], library: Dict[str, Any],
+                 chunk_size: int = 1 << 20):
+        if constraints.get('propagated_clock', False):
+            raise ValueError("Out-of-core analysis does not support propagated clocks")
+        self.graph = graph
+        self.rules = TimingAnalyzer(Graph(), constraints, library)
+        self.chunk_size = chunk_size
+
+    def run_analysis(self, limit: int = 1000) -> Tuple[float, Optional[str], List[Dict[str, Any]]]:
+        """Runs the analysis; results hold the `limit` worst endpoints."""
+        n = self.graph.num_pins
+        at = self.graph.column("at.bin", np.float64, 'w+', n)
+        rt = self.graph.column("rt.bin", np.float64, 'w+', n)
+
+        print("Setting start and end points...")
+        kinds = self.graph.column("kind.bin", np.int8)
+        for lo in range(0, n, self.chunk_size):
+            hi = min(lo + self.chunk_size, n)
+            names = self.graph.names(lo, hi)
+            types = ["port" if kind == KIND_PORT else "pin" for kind in kinds[lo:hi].tolist()]
+            nodes = [Node(name, node_type) for name, node_type in zip(names, types)]
+            at[lo:hi] = [self.rules._start_arrival(node) for node in nodes]
+            rt[lo:hi] = [self.rules._required_time(node) for node in nodes]
+
+        print("Propagating Arrival Times (out-of-core)...")
+        self._propagate(at)
+
+        print("Calculating Slack...")
+        slack = self.graph.column("slack.bin", np.float64, 'w+', n)
+        for lo in range(0, n, self.chunk_size):
+            hi = min(lo + self.chunk_size, n)
+            constrained = (rt[lo:hi] != 999.0) & (at[lo:hi] != -1.0)
+            slack[lo:hi] = np.where(constrained, rt[lo:hi] - at[lo:hi], np.nan)
+        for column in (at, rt, slack):
+            column.flush()
+        return self._worst(at, rt, slack, limit)
+
+    def _propagate(self, at):
+        n = self.graph.num_pins
+        offsets = self.graph.column("csr_offsets.bin", np.int64)
+        targets = self.graph.column("csr_dst.bin", np.int64)
+        delays = self.graph.column("csr_delay.bin", np.float64)
+
+        in_degree = self.graph.column("indeg.bin", np.int64, 'w+', n)
+        in_degree[:] = 0
+        for lo in range(0, len(targets), self.chunk_size):
+            np.add.at(in_degree, targets[lo:lo + self.chunk_size], 1)
+
+        frontier = np.flatnonzero(in_degree == 0)
+        timed = 0
+        while len(frontier):
+            timed += len(frontier)
+            next_frontier = []
+            for lo in range(0, len(frontier), self.chunk_size):
+                pins = frontier[lo:lo + self.chunk_size]
+                first = offsets[pins]
+                counts = offsets[pins + 1] - first
+                total = int(counts.sum())
+                if total == 0:
+                    continue
+
+                arc = _arc_indices(first, counts)
+                source_at = np.repeat(at[pins], counts)
+                target = targets[arc]
+                reached = source_at != -1.0
+                np.maximum.at(at, target[reached], source_at[reached] + delays[arc][reached])
+
+                np.subtract.at(in_degree, target, 1)
+                touched = np.unique(target)
+                next_frontier.append(touched[in_degree[touched] == 0])
+            frontier = np.concatenate(next_frontier) if next_frontier else np.zeros(0, dtype=np.int64)
+
+        if timed < n:
+            for pins in self._find_loops(in_degree, offsets, targets):
+                shown = ", ".join(pins[:8]) + (", ..." if len(pins) > 8 else "")
+                print(f"Warning: Combinational loop of {len(pins)} pins [{shown}] was not timed")
+            print(f"Warning: {n - timed} pins lie on or behind combinational loops and were not timed")
+
+    def _find_loops(self, in_degree, offsets, targets) -> List[List[str]]:
+        """Returns the pin names of each combinational loop among the pins Kahn left untimed.
+
+        Pins that only lie behind a loop are peeled off first (reverse Kahn
+        over the untimed subgraph), so transient Nodes are created for the
+        loops and the paths between them only.
+        """
+        stuck = np.flatnonzero(in_degree > 0)
+        src, dst = [], []
+        for lo in range(0, len(stuck), self.chunk_size):
+            pins = stuck[lo:lo + self.chunk_size]
+            first = offsets[pins]
+            counts = offsets[pins + 1] - first
+            target = targets[_arc_indices(first, counts)]
+            local = np.minimum(np.searchsorted(stuck, target), len(stuck) - 1)
+            inside = stuck[local] == target
+            src.append(np.repeat(np.arange(lo, lo + len(pins)), counts)[inside])
+            dst.append(local[inside])
+        src = np.concatenate(src) if src else np.zeros(0, dtype=np.int64)
+        dst = np.concatenate(dst) if dst else np.zeros(0, dtype=np.int64)
+
+        out_degree = np.bincount(src, minlength=len(stuck))
+        by_target = np.argsort(dst, kind='stable')
+        in_offsets = np.zeros(len(stuck) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(dst, minlength=len(stuck)), out=in_offsets[1:])
+        alive = np.ones(len(stuck), dtype=bool)
+        sinks = np.flatnonzero(out_degree == 0)
+        while len(sinks):
+            alive[sinks] = False
+            first = in_offsets[sinks]
+            sources = src[by_target[_arc_indices(first, in_offsets[sinks + 1] - first)]]
+            np.subtract.at(out_degree, sources, 1)
+            touched = np.unique(sources)
+            sinks = touched[out_degree[touched] == 0]
+
+        nodes = {k: Node(self.graph.name(int(stuck[k])), "pin") for k in np.flatnonzero(alive).tolist()}
+        for k, j in zip(src.tolist(), dst.tolist()):
+            if k in nodes and j in nodes:
+                nodes[k].add_edge(nodes[j], 0.0, "net")
+        loops = []
+        for component in find_strongly_connected_components(list(nodes.values())):
+            if len(component) > 1 or any(t is component[0] for t, _, _ in component[0].edges):
+                loops.append(sorted(node.name for node in component))
+        return sorted(loops)
+
+    def _worst(self, at, rt, slack, limit: int) -> Tuple[float, Optional[str], List[Dict[str, Any]]]:
+        best_ids = np.zeros(0, dtype=np.int64)
+        best_slack = np.zeros(0)
+        for lo in range(0, len(slack), self.chunk_size):
+            chunk = slack[lo:lo + self.chunk_size]
+            ids = np.flatnonzero(~np.isnan(chunk))
+            ids = np.concatenate([best_ids, ids + lo])
+            values = np.concatenate([best_slack, chunk[ids[len(best_ids):] - lo]])
+            keep = np.argsort(values, kind='stable')[:limit]
+            best_ids, best_slack = ids[keep], values[keep]
+
+        results = []
+        for pin, value in zip(best_ids.tolist(), best_slack.tolist()):
+            results.append({
+                "node": self.graph.name(pin),
+                "at": float(at[pin]),
+                "rt": float(rt[pin]),
+                "slack": value,
+                "status": "MET" if value >= 0 else "VIOLATED"
+            })
+        if not results:
+            return float('inf'), None, results
+        return results[0]['slack'], results[0]['node'], results
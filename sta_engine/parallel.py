@@ -0,0 +1,280 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Any, Tuple, Optional
+
+from .analysis import TimingAnalyzer
+from .graph import Graph, Node
+
+# Per-process views onto the shared AT / fanin arrays (bound by _bind_shared)
+_SHARED: Dict[str, Any] = {}
+_COLUMNS = {"at": 'float64', "pred_offsets": 'int64', "pred_src": 'int64', "pred_dst": 'int64', "pred_delay": 'float64'}
+
+
+@dataclass
+class LevelLayout:
+    """The graph laid out level by level, with its fanin as a CSR over that order."""
+    revision: int             # Graph.revision the layout was built from
+    order: List[Node]         # Pins by level; pins left on cycles come last
+    bounds: Any               # Level k is order[bounds[k]:bounds[k + 1]]
+    pred_offsets: Any         # Fanin of order[v] is pred_src[pred_offsets[v]:pred_offsets[v + 1]]
+    pred_src: Any
+    pred_dst: Any             # Position of the target pin of each fanin arc
+    pred_delay: Any
+    start_at: Any             # Launch AT of each start point in layout order, -1.0 elsewhere
+
+
+def _bind_shared(arrays: Dict[str, Any], blocks: Optional[Dict[str, SharedMemory]] = None):
+    _SHARED.update(arrays)
+    _SHARED["blocks"] = blocks or {}
+
+
+def _attach_shared(names: Dict[str, Tuple[str, int]]):
+    """Pool initializer: maps the parent's shared-memory blocks into this worker."""
+    # Forked workers inherit the parent's views; drop them before re-binding
+    _release_shared(close=False)
+    blocks = {key: SharedMemory(name=name) for key, (name, _) in names.items()}
+    _bind_shared({key: np.frombuffer(blocks[key].buf, dtype=_COLUMNS[key])[:length]
+                  for key, (_, length) in names.items()}, blocks)
+
+
+def _release_shared(close: bool = True):
+    for key in _COLUMNS:
+        _SHARED.pop(key, None)
+    blocks = _SHARED.pop("blocks", {})
+    if close:
+        for shm in blocks.values():
+            shm.close()
+
+
+def _propagate_range(start: int, end: int):
+    """Pulls AT for nodes [start, end) from their fanin; all fanin lies on earlier levels."""
+    at = _SHARED["at"]
+    offsets = _SHARED["pred_offsets"]
+    lo, hi = offsets[start], offsets[end]
+    if lo == hi:
+        return
+
+    source_at = at[_SHARED["pred_src"][lo:hi]]
+    reached = source_at != -1.0
+    np.maximum.at(at, _SHARED["pred_dst"][lo:hi][reached], source_at[reached] + _SHARED["pred_delay"][lo:hi][reached])
+
+
+class ParallelTimingAnalyzer(TimingAnalyzer):
+    """Propagates Arrival Times level by level, splitting wide levels over a process pool.
+
+    The levelized graph is laid out level by level in numpy arrays (AT plus
+    a fanin CSR); each level is one vectorized max over its fanin arcs.
+    The layout, start point ATs included, is built once and reused until
+    the graph changes (`Graph.revision`); loops are searched only among
+    the pins its levelization leaves over. Levels wider than `min_partition` are split into
+    one contiguous range per worker, which share the arrays through shared
+    memory, so workers exchange only index ranges, never `Node` objects.
+    Each node takes the max over its fanin, which is order independent, so
+    results are bit-identical to the serial engine.
+    """
+
+    def __init__(self, graph: Graph, constraints: Dict[str, float], library: Dict[str, Any],
+                 workers: Optional[int] = None, min_partition: int = 2048):
+        if np is None:
+            raise RuntimeError("numpy not installed. Please run 'uv add numpy'")
+        super().__init__(graph, constraints, library)
+        self.workers = workers or os.cpu_count() or 1
+        self.min_partition = min_partition
+        self.layout: Optional[LevelLayout] = None
+
+    def _propagate_arrival_times(self):
+        if self.constraints.get('propagated_clock', False):
+            # CRPR needs the launching register of every worst path, which the
+            # pull-based workers do not track
+            print("Propagated clock requested: using serial propagation")
+            return super()._propagate_arrival_times()
+
+        print(f"Propagating Arrival Times ({self.workers} workers)...")
+        if self.layout is None or self.layout.revision != self.graph.revision:
+            self.layout = self._build_layout(self.graph.get_all_nodes())
+            # Pins left unleveled lie on or behind a loop; cut the loops among
+            # them and level again (a cached layout is already loop free)
+            unleveled = self.layout.order[self.layout.bounds[-1]:]
+            if unleveled and self._break_loops(unleveled) is None:
+                self.layout = self._build_layout(self.graph.get_all_nodes())
+        self.reset_queries()
+        self.launch = {}
+        self.clock_tree = None
+
+        layout = self.layout
+        at = layout.start_at.copy()
+        arrays = {
+            "at": at,
+            "pred_offsets": layout.pred_offsets,
+            "pred_src": layout.pred_src,
+            "pred_dst": layout.pred_dst,
+            "pred_delay": layout.pred_delay,
+        }
+        _bind_shared(arrays)
+        try:
+            at = self._run_levels(layout.bounds, arrays)
+        finally:
+            _release_shared()
+
+        for node, value in zip(layout.order, at.tolist()):
+            node.at = value
+
+    def _build_layout(self, nodes: List[Node]) -> LevelLayout:
+        """Levelizes the graph and builds the fanin CSR in level order (vectorized)."""
+        n = len(nodes)
+        index = {id(node): i for i, node in enumerate(nodes)}
+        edges = [edge for node in nodes for edge in node.edges]
+        src = np.repeat(np.arange(n, dtype=np.int64), [len(node.edges) for node in nodes])
+        dst = np.fromiter(map(index.__getitem__, map(id, map(itemgetter(0), edges))), dtype=np.int64, count=len(edges))
+        delay = np.fromiter(map(itemgetter(1), edges), dtype=np.float64, count=len(edges))
+
+        # Kahn frontiers over a fanout CSR; pins never emitted lie on cycles
+        out_offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=out_offsets[1:])
+        out_dst = dst[np.argsort(src, kind='stable')]
+        in_degree = np.bincount(dst, minlength=n)
+        level = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+        frontier = np.flatnonzero(in_degree == 0)
+        depth = 0
+        while len(frontier):
+            level[frontier] = depth
+            first = out_offsets[frontier]
+            counts = out_offsets[frontier + 1] - first
+            arcs = np.repeat(first - np.cumsum(counts) + counts, counts) + np.arange(int(counts.sum()))
+            targets = out_dst[arcs]
+            np.subtract.at(in_degree, targets, 1)
+            touched = np.unique(targets)
+            frontier = touched[in_degree[touched] == 0]
+            depth += 1
+
+        order = np.argsort(level, kind='stable')
+        position = np.empty(n, dtype=np.int64)
+        position[order] = np.arange(n)
+        bounds = np.searchsorted(level[order], np.arange(depth + 1))
+
+        # Fanin arcs sorted by target position, keeping only edges from leveled nodes
+        leveled = level[src] < depth
+        pred_src = position[src[leveled]]
+        pred_dst = position[dst[leveled]]
+        pred_delay = delay[leveled]
+        by_target = np.argsort(pred_dst, kind='stable')
+        pred_offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pred_dst, minlength=n), out=pred_offsets[1:])
+
+        ordered = [nodes[v] for v in order.tolist()]
+        return LevelLayout(
+            revision=self.graph.revision,
+            order=ordered,
+            bounds=bounds,
+            pred_offsets=pred_offsets,
+            pred_src=pred_src[by_target],
+            pred_dst=pred_dst[by_target],
+            pred_delay=pred_delay[by_target],
+            start_at=np.fromiter(map(self._start_arrival, ordered), dtype=np.float64, count=n),
+        )
+
+    def _create_shared(self, arrays: Dict[str, Any]) -> Dict[str, SharedMemory]:
+        blocks = {}
+        for key, values in arrays.items():
+            shm = SharedMemory(create=True, size=max(values.nbytes, 1))
+            np.frombuffer(shm.buf, dtype=values.dtype)[:len(values)] = values
+            blocks[key] = shm
+        return blocks
+
+    def _run_levels(self, bounds, arrays: Dict[str, Any]):
+        """Runs each level either inline or split across the pool; levels act as barriers.
+
+        Returns the AT array (a copy out of shared memory once the pool is in use).
+        """
+        wide = [k for k in range(len(bounds) - 1) if bounds[k + 1] - bounds[k] >= self.min_partition]
+        if self.workers <= 1 or not wide:
+            for k in range(len(bounds) - 1):
+                _propagate_range(int(bounds[k]), int(bounds[k + 1]))
+            self._propagate_unleveled(bounds)
+            return _SHARED["at"]
+
+        blocks = self._create_shared(arrays)
+        names = {key: (shm.name, len(arrays[key])) for key, shm in blocks.items()}
+        pool = None
+        try:
+            _release_shared()
+            _attach_shared(names)
+            pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_attach_shared, initargs=(names,))
+            for k in range(len(bounds) - 1):
+                start, end = int(bounds[k]), int(bounds[k + 1])
+                if end - start >= self.min_partition:
+                    futures = [pool.submit(_propagate_range, lo, hi) for lo, hi in self._split(start, end)]
+                    for future in futures:
+                        future.result()
+                else:
+                    _propagate_range(start, end)
+            self._propagate_unleveled(bounds)
+            return _SHARED["at"].copy()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            for shm in blocks.values():
+                shm.unlink()
+
+    def _propagate_unleveled(self, bounds):
+        # Loops are broken before levelizing, so this is normally empty; kept so
+        # a graph edited behind our back still matches the serial engine
+        _propagate_range(int(bounds[-1]), len(_SHARED["at"]))
+
+    def _split(self, start: int, end: int) -> List[Tuple[int, int]]:
+        size = end - start
+        chunk = -(-size // self.workers)
+        return [(lo, min(lo + chunk, end)) for lo in range(start, end, chunk)]
+
+
+def measure_scaling(graph: Graph, constraints: Dict[str, float], library: Dict[str, Any],
+                    worker_counts: List[int]) -> List[Dict[str, Any]]:
+    """Times AT propagation for each worker count against the serial engine.
+
+    Every run is checked for bit-identical ATs. Each worker count is timed
+    twice: the first run includes building the level layout, the second
+    reuses it. `speedup` is the cached run against the serial engine, which
+    mostly measures numpy over Python; `scaling` is the cached run against
+    the cached 1-worker run (always timed), i.e. what the extra cores add.
+    """
+    nodes = graph.get_all_nodes()
+
+    serial = TimingAnalyzer(graph, constraints, library)
+    begin = time.perf_counter()
+    serial._propagate_arrival_times()
+    baseline = time.perf_counter() - begin
+    reference = [node.at for node in nodes]
+
+    rows = [{"workers": "serial", "seconds": baseline, "cached": baseline, "speedup": 1.0, "scaling": None,
+             "identical": True}]
+    for count in ([1] if 1 not in worker_counts else []) + list(worker_counts):
+        analyzer = ParallelTimingAnalyzer(graph, constraints, library, workers=count)
+        begin = time.perf_counter()
+        analyzer._propagate_arrival_times()
+        elapsed = time.perf_counter() - begin
+        identical = [node.at for node in nodes] == reference
+
+        begin = time.perf_counter()
+        analyzer._propagate_arrival_times()
+        cached = time.perf_counter() - begin
+        rows.append({
+            "workers": count,
+            "seconds": elapsed,
+            "cached": cached,
+            "speedup": baseline / cached if cached > 0 else float('inf'),
+            "identical": identical and [node.at for node in nodes] == reference,
+        })
+
+    single = next(row['cached'] for row in rows if row['workers'] == 1)
+    for row in rows[1:]:
+        row['scaling'] = single / row['cached'] if row['cached'] > 0 else float('inf')
+    return rows
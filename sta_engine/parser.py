@@ -1,7 +1,7 @@
 from pyverilog.vparser.parser import parse
 from pyverilog.vparser.ast import InstanceList, Description, ModuleDef, Port, Ioport, Input, Output, Pointer, Identifier
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from .graph import Graph, Node
 
 class VerilogParser:
@@ -12,6 +12,7 @@ class VerilogParser:
         self.graph = Graph()
         self.net_drivers: Dict[str, List[Node]] = {} # NetName -> [Node]
         self.net_loads: Dict[str, List[Node]] = {}   # NetName -> [Node]
+        self.instances: Dict[str, Tuple[str, Dict[str, str]]] = {} # InstName -> (CellType, {Port: NetName})
 
     def parse(self, file_path: str) -> Graph:
         """Parses a Verilog file and returns the constructed STA Graph."""
@@ -20,17 +21,24 @@ class VerilogParser:
             
         print(f"Parsing Verilog: {file_path}")
         try:
-            ast, _ = parse([file_path])
-            module_def: ModuleDef = ast.description.definitions[0]
-            
-            self._process_instances(module_def)
-            self._process_ports(module_def)
-            self._build_net_connections()
+            module_def = self._read_module(file_path)
             
+            self._build(module_def)
             return self.graph
         except Exception as e:
             raise RuntimeError(f"Failed to parse Verilog file: {e}") from e
 
+    def _read_module(self, file_path: str) -> ModuleDef:
+        """Runs Pyverilog on the file and returns the first module definition."""
+        ast, _ = parse([file_path])
+        return ast.description.definitions[0]
+
+    def _build(self, module_def: ModuleDef):
+        """Builds nodes and edges from the module AST."""
+        self._process_instances(module_def)
+        self._process_ports(module_def)
+        self._build_net_connections()
+
     def _process_instances(self, module_def: ModuleDef):
         """Iterates over all instances in the module and processes them."""
         for item in module_def.items:
@@ -48,16 +56,22 @@ class VerilogParser:
             return
 
         cell_info = self.lib['cells'][cell_type]
-        self._create_pin_nodes(inst, inst_name, cell_info)
+        self.instances[inst_name] = self._instance_signature(inst)
+        self._create_pin_nodes(inst, inst_name, cell_type, cell_info)
         self._create_internal_timing_arcs(inst_name, cell_info)
 
-    def _create_pin_nodes(self, inst, inst_name: str, cell_info: Dict[str, Any]):
+    def _instance_signature(self, inst) -> Tuple[str, Dict[str, str]]:
+        """Returns (cell type, {port: net}) for an instance."""
+        return (inst.module, {port.portname: self._resolve_net_name(port.argname) for port in inst.portlist})
+
+    def _create_pin_nodes(self, inst, inst_name: str, cell_type: str, cell_info: Dict[str, Any]):
         """Creates graph nodes for instance pins and registers net connections."""
         for port in inst.portlist:
             pin_name = f"{inst_name}/{port.portname}"
             net_name = self._resolve_net_name(port.argname)
             
             pin_node = self.graph.get_or_create_node(pin_name, "pin")
+            pin_node.cell = cell_type
 
             is_input = port.portname in cell_info.get('inputs', [])
             is_output = port.portname in cell_info.get('outputs', [])
@@ -78,7 +92,7 @@ class VerilogParser:
                 out_node = self.graph.get_or_create_node(f"{inst_name}/{out_pin}")
                 for in_pin in cell_info.get('inputs', []):
                     in_node = self.graph.get_or_create_node(f"{inst_name}/{in_pin}")
-                    in_node.add_edge(out_node, delay, "internal")
+                    self.graph.add_edge(in_node, out_node, delay, "internal")
         else:
             # Sequential logic (DFF): No internal combinational arc from D to Q
             # Timing arcs like clk->Q are handled during analysis/arrival time propagation start points
@@ -87,30 +101,43 @@ class VerilogParser:
     def _process_ports(self, module_def: ModuleDef):
         """Processes top-level module ports."""
         for port in module_def.portlist.ports:
-            # Pyverilog AST navigation to find the actual port details
-            first_level = port.first
-            if isinstance(first_level, Ioport):
-                first = first_level.first
-                node = self.graph.get_or_create_node(first.name, "port")
-                
-                if isinstance(first, Input):
-                     self.net_drivers.setdefault(first.name, []).append(node)
-                elif isinstance(first, Output):
-                     self.net_loads.setdefault(first.name, []).append(node)
+            first = self._port_declaration(port)
+            if first is None:
+                continue
+
+            node = self.graph.get_or_create_node(first.name, "port")
+            if isinstance(first, Input):
+                 self.net_drivers.setdefault(first.name, []).append(node)
+            elif isinstance(first, Output):
+                 self.net_loads.setdefault(first.name, []).append(node)
+
+    def _port_declaration(self, port) -> Optional[Any]:
+        """Returns the Input/Output declaration of an ANSI-style port, or None."""
+        # Pyverilog AST navigation: depending on the version the Ioport is the
+        # port itself or wrapped one level down
+        ioport = port if isinstance(port, Ioport) else getattr(port, 'first', None)
+        if isinstance(ioport, Ioport):
+            return ioport.first
+        return None
 
     def _build_net_connections(self):
         """Creates edges between drivers and loads on the same net."""
+        for net_name in self.net_drivers:
+            self._connect_net(net_name)
+
+    def _connect_net(self, net_name: str):
+        """Creates the driver-to-load edges of a single net."""
+        if net_name not in self.net_loads:
+            return
+
         fanout_factor = self.lib.get('wire_load_model', {}).get('fanout_factor', 0.0)
-        
-        for net_name, drivers in self.net_drivers.items():
-            if net_name in self.net_loads:
-                loads = self.net_loads[net_name]
-                fanout = len(loads)
-                delay = fanout * fanout_factor
-                
-                for driver in drivers:
-                    for load in loads:
-                        driver.add_edge(load, delay, "net")
+        loads = self.net_loads[net_name]
+        fanout = len(loads)
+        delay = fanout * fanout_factor
+
+        for driver in self.net_drivers.get(net_name, []):
+            for load in loads:
+                self.graph.add_edge(driver, load, delay, "net")
 
     def _resolve_net_name(self, argname: Any) -> str:
         """Resolves the net name from Pyverilog AST nodes."""
@@ -0,0 +1,67 @@
+import time
+from concurrent.futures import Executor, Future, wait
+from typing import Callable, Dict, List, Any, Optional, Sequence, Tuple
+
+
+class StageSkipped(Exception):
+    """Raised for a stage whose dependency failed."""
+
+
+class TaskGraph:
+    """A small task graph: each stage runs on its executor once its dependencies finish.
+
+    Stages without an executor run inline in the calling thread. Failures do
+    not stop independent stages; `wait` returns every stage's error so the
+    caller can report them together and derive one exit status.
+    """
+
+    def __init__(self):
+        self._futures: Dict[str, Future] = {}
+        self._order: List[str] = []
+        self.durations: Dict[str, float] = {}
+
+    def add(self, name: str, fn: Callable[..., Any], *args, deps: Sequence[str] = (),
+            executor: Optional[Executor] = None) -> Future:
+        """Schedules `fn(*args)` as stage `name` after the stages in `deps`."""
+        dep_futures = [(dep, self._futures[dep]) for dep in deps]
+
+        def run_stage():
+            for dep, future in dep_futures:
+                if future.exception() is not None:
+                    raise StageSkipped(f"dependency '{dep}' failed")
+            start = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                self.durations[name] = time.perf_counter() - start
+
+        if executor is None:
+            future = Future()
+            try:
+                future.set_result(run_stage())
+            except Exception as e:
+                future.set_exception(e)
+        elif not dep_futures:
+            # Process pools cannot run closures; submit the callable itself
+            start = time.perf_counter()
+            future = executor.submit(fn, *args)
+            future.add_done_callback(lambda _: self.durations.__setitem__(name, time.perf_counter() - start))
+        else:
+            future = executor.submit(run_stage)
+
+        self._futures[name] = future
+        self._order.append(name)
+        return future
+
+    def result(self, name: str) -> Any:
+        return self._futures[name].result()
+
+    def wait(self) -> List[Tuple[str, BaseException]]:
+        """Blocks until every stage is done; returns (stage, error) for the failed ones."""
+        wait(list(self._futures.values()))
+        failures = []
+        for name in self._order:
+            error = self._futures[name].exception()
+            if error is not None:
+                failures.append((name, error))
+        return failures
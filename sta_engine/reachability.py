@@ -0,0 +1,229 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from typing import Callable, Dict, List, Tuple
+
+from .loops import find_strongly_connected_components, kahn_order
+
+
+class ReachabilityIndex:
+    """Per-pin sets of the startpoints that reach a pin and the endpoints it reaches.
+
+    Startpoints are pins without fanin (input ports, register outputs) and
+    endpoints are pins without fanout (register inputs, output ports). The
+    sets are structural: the Graph carries no constraints, so the clock
+    port counts as a startpoint and register clock pins or dangling cell
+    outputs as endpoints, unlike TimingAnalyzer's start and end points
+    (filter with `TimingAnalyzer.is_timing_point` for those). The
+    sets are built in one sweep over the strongly connected components in
+    topological order (pins of a combinational loop share one set), as
+    Python int bitsets that are dropped as soon as the last pin consuming
+    them is done, so only the sweep frontier is ever held in that form.
+
+    Every finished set is stored compressed in one shared uint32 pool,
+    roaring style: as a sorted array of ids, or as a bitmap once the array
+    would be larger than the bitmap. A pin whose set equals the one of its
+    single contributing neighbour (buffer chains, cell outputs) shares it.
+    """
+
+    STAGED_SETS = 1024 # Sets decoded per batch while building
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.startpoints: List[str] = []
+        self.endpoints: List[str] = []
+
+        self._start_bit: Dict[str, int] = {}
+        self._end_bit: Dict[str, int] = {}
+        self._component: Dict[str, int] = {} # Pin -> topological rank of its SCC
+        self._fanin: Dict[str, int] = {}     # Pin -> set index (startpoints reaching it)
+        self._fanout: Dict[str, int] = {}    # Pin -> set index (endpoints it reaches)
+
+        # Set i is _pool[_offsets[i]:_offsets[i + 1]], a bitmap if _dense[i] else sorted ids
+        self._blocks: List = []  # Per-set arrays while building
+        self._dense: List = []   # Bitmap flag per set (a numpy array once built)
+        self._staged: List[Tuple[int, bytes]] = []
+        self._pool = None
+        self._offsets = None
+
+    def build(self) -> 'ReachabilityIndex':
+        if np is None:
+            raise RuntimeError("numpy not installed. Please run 'uv add numpy'")
+
+        nodes = self.graph.get_all_nodes()
+        has_fanin = {target.name for node in nodes for target, _, _ in node.edges}
+        self.startpoints = sorted(node.name for node in nodes if node.name not in has_fanin)
+        self.endpoints = sorted(node.name for node in nodes if not node.edges)
+        self._start_bit = {name: i for i, name in enumerate(self.startpoints)}
+        self._end_bit = {name: i for i, name in enumerate(self.endpoints)}
+
+        # Kahn orders the acyclic part; Tarjan only condenses the pins it cannot
+        # order (and emits their components sinks first)
+        ordered, unordered = kahn_order(nodes)
+        components = [[node] for node in ordered]
+        components.extend(reversed(find_strongly_connected_components(unordered)))
+        for rank, component in enumerate(components):
+            for node in component:
+                self._component[node.name] = rank
+
+        fanin = lambda node: [source for source, _, _ in self.graph.get_fanin(node)]
+        fanout = lambda node: [target for target, _, _ in node.edges]
+        self._sweep(components, self._fanin, self._start_bit, fanin, fanout)
+        self._sweep(components[::-1], self._fanout, self._end_bit, fanout, fanin)
+
+        sizes = np.array([0] + [len(block) for block in self._blocks], dtype=np.int64)
+        self._offsets = np.cumsum(sizes)
+        self._pool = np.concatenate(self._blocks) if self._blocks else np.zeros(0, dtype=np.uint32)
+        self._dense = np.array(self._dense, dtype=bool)
+        self._blocks = []
+        return self
+
+    def fanin_startpoints(self, name: str) -> List[str]:
+        """Startpoints with a path to `name`."""
+        return [self.startpoints[i] for i in self._members(self._fanin[name]).tolist()]
+
+    def fanout_endpoints(self, name: str) -> List[str]:
+        """Endpoints reachable from `name`."""
+        return [self.endpoints[i] for i in self._members(self._fanout[name]).tolist()]
+
+    def reaches(self, source: str, target: str) -> bool:
+        """True if there is a path from `source` to `target` (a pin reaches itself)."""
+        if source == target:
+            return True
+        if source in self._start_bit:
+            return self._contains(self._fanin[target], self._start_bit[source])
+        if target in self._end_bit:
+            return self._contains(self._fanout[source], self._end_bit[target])
+        if self._component[source] == self._component[target]:
+            return True
+
+        # Interior pins: search forward, pruning every pin that cannot be on a
+        # source -> target path (wrong topological rank or cone mismatch)
+        rank = self._component[target]
+        bits: Dict[int, int] = {} # Set index -> bitset, decoded once per query
+        def decode(index: int) -> int:
+            if index not in bits:
+                bits[index] = self._bits(index)
+            return bits[index]
+
+        fanin = decode(self._fanin[target])
+        fanout = decode(self._fanout[target])
+        visited = {source}
+        stack = [self.graph.get_node(source)]
+        while stack:
+            node = stack.pop()
+            for next_node, _, _ in node.edges:
+                name = next_node.name
+                if name == target:
+                    return True
+                if name in visited or self._component[name] > rank:
+                    continue
+                visited.add(name)
+                if decode(self._fanin[name]) & ~fanin or fanout & ~decode(self._fanout[name]):
+                    continue
+                stack.append(next_node)
+        return False
+
+    def memory_summary(self) -> str:
+        dense = int(self._dense.sum())
+        return (f"{len(self.startpoints)} startpoints, {len(self.endpoints)} endpoints, "
+                f"{len(self._dense)} distinct sets ({len(self._dense) - dense} arrays, {dense} bitmaps, "
+                f"{self._pool.nbytes / 1024:.1f} KiB)")
+
+    def _sweep(self, components, table: Dict[str, int], own_bit: Dict[str, int],
+               sources_of: Callable, consumers_of: Callable):
+        """Assigns each component the union of its outside sources' sets plus its own bits.
+
+        `components` must list every component after the ones it draws from.
+        A pin's bitset stays live until each outside consumer of it is done.
+        """
+        universe = len(own_bit)
+        live: Dict[str, int] = {}
+        pending: Dict[str, int] = {}
+        for component in components:
+            members = [node.name for node in component]
+            inside = set(members) # Arcs within the component (self-loops included) are skipped
+            sources = [n.name for node in component for n in sources_of(node) if n.name not in inside]
+
+            own = [own_bit[name] for name in members if name in own_bit]
+            bits = 0
+            for i in own:
+                bits |= 1 << i
+            for name in sources:
+                bits |= live[name]
+                left = pending[name] - 1
+                if left:
+                    pending[name] = left
+                else:
+                    del live[name], pending[name]
+
+            shared = {table[name] for name in sources}
+            index = shared.pop() if len(shared) == 1 and not own else self._store(bits, universe)
+            for node, name in zip(component, members):
+                table[name] = index
+                consumers = sum(1 for n in consumers_of(node) if n.name not in inside)
+                if consumers:
+                    live[name] = bits
+                    pending[name] = consumers
+        self._flush((universe + 31) // 32)
+
+    def _store(self, bits: int, universe: int) -> int:
+        """Appends a set as sorted ids, or as a bitmap if that is smaller; returns its index.
+
+        Id arrays are decoded in batches of STAGED_SETS (see _flush).
+        """
+        words = (universe + 31) // 32
+        raw = bits.to_bytes(words * 4, 'little')
+        self._dense.append(bits.bit_count() > words)
+        if self._dense[-1]:
+            self._blocks.append(np.frombuffer(raw, dtype='<u4'))
+        else:
+            self._blocks.append(None)
+            self._staged.append((len(self._blocks) - 1, raw))
+            if len(self._staged) >= self.STAGED_SETS:
+                self._flush(words)
+        return len(self._blocks) - 1
+
+    def _flush(self, words: int):
+        """Turns the staged bitsets into id arrays with one unpack over all of them."""
+        if not self._staged:
+            return
+        indices, rows = zip(*self._staged)
+        bitmaps = np.frombuffer(b"".join(rows), dtype='<u4').reshape(len(rows), words)
+        # Only the non-zero words are unpacked into bits
+        row, word = np.nonzero(bitmaps)
+        values = bitmaps[row, word]
+        hit, bit = np.nonzero(np.unpackbits(values.view(np.uint8).reshape(-1, 4), axis=1, bitorder='little'))
+        ids = (word[hit] * 32 + bit).astype(np.uint32)
+        bounds = np.searchsorted(row[hit], np.arange(len(rows) + 1))
+        for k, index in enumerate(indices):
+            self._blocks[index] = ids[bounds[k]:bounds[k + 1]]
+        self._staged = []
+
+    def _block(self, index: int):
+        return self._pool[self._offsets[index]:self._offsets[index + 1]]
+
+    def _members(self, index: int):
+        block = self._block(index)
+        if self._dense[index]:
+            return np.flatnonzero(np.unpackbits(block.view(np.uint8), bitorder='little'))
+        return block
+
+    def _contains(self, index: int, i: int) -> bool:
+        block = self._block(index)
+        if self._dense[index]:
+            return bool(block[i >> 5] >> (i & 31) & 1)
+        k = int(np.searchsorted(block, i))
+        return k < len(block) and int(block[k]) == i
+
+    def _bits(self, index: int) -> int:
+        """The set as a Python int bitset."""
+        block = self._block(index)
+        if self._dense[index]:
+            return int.from_bytes(block.tobytes(), 'little')
+        bits = 0
+        for i in block.tolist():
+            bits |= 1 << i
+        return bits
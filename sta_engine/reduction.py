@@ -0,0 +1,98 @@
+from typing import Callable, Dict, List, Tuple
+
+from .graph import Graph, Node
+from .loops import find_strongly_connected_components, kahn_order
+
+
+class GraphReducer:
+    """Compacts a timing graph before analysis and maps results back onto it.
+
+    Two rewrites are applied until nothing changes:
+      - parallel edges between the same pair of pins keep only the largest delay;
+      - a pin with a single fanin and a single fanout that is not a timing
+        point (`keep`) is removed, and its two edges are merged into one edge
+        with the summed delay (buffer/inverter chains collapse to one arc).
+
+    Pins on combinational loops are left as they are, so the analyzer's
+    loop breaker sees the same loops, and cuts the same edges, as on the
+    original graph.
+
+    Arrival times of kept pins are the same as on the original graph, except
+    that summing delays ahead of time can move the last bit of a float. The
+    removed pins get their AT back from the driving pin in `expand`.
+    """
+
+    def __init__(self, graph: Graph, keep: Callable[[Node], bool]):
+        self.graph = graph
+        self.keep = keep
+        self.reduced = Graph()
+        self.removed: Dict[str, Tuple[str, float]] = {} # Removed pin -> (driving pin, delay from it)
+
+    def reduce(self) -> Graph:
+        succ: Dict[str, Dict[str, Tuple[float, str]]] = {name: {} for name in self.graph.nodes}
+        pred: Dict[str, Dict[str, Tuple[float, str]]] = {name: {} for name in self.graph.nodes}
+        for node in self.graph.get_all_nodes():
+            for target, weight, edge_type in node.edges:
+                self._connect(succ, pred, node.name, target.name, weight, edge_type)
+
+        pinned = {node.name for node in self.graph.get_all_nodes() if self.keep(node)}
+        pinned.update(self._loop_pins())
+        queue = [name for name in self.graph.nodes if name not in pinned]
+        while queue:
+            name = queue.pop()
+            if name in self.removed or len(pred[name]) != 1 or len(succ[name]) != 1:
+                continue
+            (source, (w_in, type_in)), = pred[name].items()
+            (target, (w_out, type_out)), = succ[name].items()
+
+            del succ[source][name], pred[target][name]
+            del pred[name], succ[name]
+            self.removed[name] = (source, w_in)
+            self._connect(succ, pred, source, target, w_in + w_out,
+                          type_in if type_in == type_out else "reduced")
+            queue.extend(n for n in (source, target) if n not in pinned)
+
+        for name, node in self.graph.nodes.items():
+            if name not in self.removed:
+                self.reduced.get_or_create_node(name, node.type).cell = node.cell
+        for source, targets in succ.items():
+            for target, (weight, edge_type) in targets.items():
+                self.reduced.add_edge(self.reduced.nodes[source], self.reduced.nodes[target], weight, edge_type)
+        return self.reduced
+
+    def expand(self):
+        """Copies AT/RT from the reduced graph onto every pin of the original graph."""
+        for name, node in self.reduced.nodes.items():
+            original = self.graph.nodes[name]
+            original.at = node.at
+            original.rt = node.rt
+
+        # A pin is removed before its driver can be, so reverse order resolves drivers first
+        for name in reversed(list(self.removed)):
+            source, delay = self.removed[name]
+            source_at = self.graph.nodes[source].at
+            original = self.graph.nodes[name]
+            original.at = -1.0 if source_at == -1.0 else source_at + delay
+            original.rt = 999.0
+
+    def summary(self) -> str:
+        before = sum(len(n.edges) for n in self.graph.get_all_nodes())
+        after = sum(len(n.edges) for n in self.reduced.get_all_nodes())
+        return (f"Reduced graph: {len(self.graph.nodes)} -> {len(self.reduced.nodes)} nodes, "
+                f"{before} -> {after} edges")
+
+    def _loop_pins(self) -> List[str]:
+        """Pins on a combinational loop (Tarjan over the pins Kahn cannot order)."""
+        _, unordered = kahn_order(self.graph.get_all_nodes())
+        pins = []
+        for component in find_strongly_connected_components(unordered):
+            if len(component) > 1 or any(t is component[0] for t, _, _ in component[0].edges):
+                pins.extend(node.name for node in component)
+        return pins
+
+    def _connect(self, succ, pred, source: str, target: str, weight: float, edge_type: str):
+        """Adds an edge, keeping only the slowest of parallel edges."""
+        current = succ[source].get(target)
+        if current is not None and current[0] >= weight:
+            return
+        succ[source][target] = pred[target][source] = (weight, edge_type)
@@ -5,27 +5,34 @@ from typing import Dict, List, Any, Optional
 class ReportGenerator:
     """Generates a Markdown report for STA analysis results."""
 
-    def __init__(self, design_path: str, config: Dict[str, Any], worst_slack: float, worst_node: Optional[str], results: List[Dict[str, Any]]):
+    def __init__(self, design_path: str, config: Dict[str, Any], worst_slack: float, worst_node: Optional[str], results: List[Dict[str, Any]],
+                 statistics: Optional[Dict[str, Any]] = None, sensitivity: Optional[Dict[str, Any]] = None):
         self.design_path = design_path
         self.config = config
         self.worst_slack = worst_slack
         self.worst_node = worst_node
         self.results = results
+        self.statistics = statistics
+        self.sensitivity = sensitivity
         self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def generate(self, output_path: str = "sta_report.md"):
-        """Generates the Markdown report at the specified path."""
-        try:
-            with open(output_path, 'w') as f:
-                f.write(self._generate_header())
-                f.write(self._generate_executive_summary())
-                f.write(self._generate_configuration_section())
-                f.write(self._generate_critical_paths_section())
-                f.write(self._generate_footer())
-            
-            print(f"Report generated at: {os.path.abspath(output_path)}")
-        except IOError as e:
-            print(f"Error writing report to {output_path}: {e}")
+        """Generates the Markdown report at the specified path.
+
+        Write errors (OSError) propagate; the caller reports them.
+        """
+        with open(output_path, 'w') as f:
+            f.write(self._generate_header())
+            f.write(self._generate_executive_summary())
+            f.write(self._generate_configuration_section())
+            f.write(self._generate_critical_paths_section())
+            if self.statistics:
+                f.write(self._generate_statistical_section())
+            if self.sensitivity:
+                f.write(self._generate_sensitivity_section())
+            f.write(self._generate_footer())
+
+        print(f"Report generated at: {os.path.abspath(output_path)}")
 
     def _generate_header(self) -> str:
         return (
@@ -89,5 +96,56 @@ class ReportGenerator:
             
         return content + "\n"
 
+    def _generate_statistical_section(self) -> str:
+        stats = self.statistics
+        quantile_keys = list(stats['endpoints'][0]['quantiles']) if stats['endpoints'] else []
+        content = (
+            "## 4. Statistical Timing (Monte Carlo)\n\n"
+            f"- **Samples:** `{stats['samples']}`\n"
+            f"- **Timing Yield:** `{stats['timing_yield'] * 100:.2f} %`\n\n"
+            "| Node | Mean Slack (ns) | Sigma (ns) | "
+            + "".join(f"Q{q * 100:g}% (ns) | " for q in quantile_keys)
+            + "Yield |\n"
+            "| :--- | :---: | :---: | "
+            + "".join(":---: | " for _ in quantile_keys)
+            + ":---: |\n"
+        )
+
+        for ep in stats['endpoints'][:20]:
+            content += (
+                f"| `{ep['node']}` | "
+                f"{ep['mean']:+.4f} | "
+                f"{ep['sigma']:.4f} | "
+                + "".join(f"{ep['quantiles'][q]:+.4f} | " for q in quantile_keys)
+                + f"{ep['yield'] * 100:.2f} % |\n"
+            )
+
+        return content + "\n"
+
+    def _generate_sensitivity_section(self) -> str:
+        sens = self.sensitivity
+        number = 5 if self.statistics else 4
+        content = (
+            f"## {number}. Slack Sensitivity\n\n"
+            "Change in WNS / TNS per ns of added delay (negative = the parameter hurts timing).\n\n"
+            f"- **TNS:** `{sens['tns']:+.4f} ns` ({sens['violating']} violating endpoints)\n\n"
+            "| Parameter | dWNS | dTNS |\n"
+            "| :--- | :---: | :---: |\n"
+        )
+        for p in sens['parameters']:
+            content += f"| `{p['parameter']}` | {p['d_wns']:+.2f} | {p['d_tns']:+.2f} |\n"
+
+        content += (
+            "\n| Arc | Type | Delay (ns) | dWNS | dTNS |\n"
+            "| :--- | :---: | :---: | :---: | :---: |\n"
+        )
+        for arc in sens['arcs'][:20]:
+            content += (
+                f"| `{arc['source']}` → `{arc['target']}` | {arc['type']} | "
+                f"{arc['delay']:.4f} | {arc['d_wns']:+.2f} | {arc['d_tns']:+.2f} |\n"
+            )
+
+        return content + "\n"
+
     def _generate_footer(self) -> str:
         return "---\n*End of Report*\n"
@@ -0,0 +1,121 @@
+import json
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Tuple
+
+from .analysis import TimingAnalyzer
+from .graph import Node
+
+
+class SensitivityAnalyzer:
+    """First-order sensitivity of WNS and TNS to every arc delay and library delay.
+
+    Works on a graph that has already been timed. Every pin's worst
+    predecessor (the fanin arc that sets its AT) defines the critical-path
+    tree; one reverse topological sweep then counts, for each arc, how many
+    violating endpoints have it on their worst path. Adding d to an arc
+    moves TNS by -count * d and WNS by -d if the arc is on the worst
+    endpoint's path. Arc sensitivities are summed into library parameters:
+    `<cell>.delay` over the cell's internal arcs, `DFF.delay_clk_q` over
+    register launches and `wire_load_model.fanout_factor` over net arcs
+    (scaled by fanout). Required times depend on no arc delay (clock
+    period, setup, output delay), so they are constant; they are
+    recomputed from the analyzer rather than read from the pins, which
+    other passes (Monte Carlo) may have overwritten. That no longer holds
+    with propagated clocks, where clock tree arcs move launch times,
+    capture times and the CRPR credit, so those are rejected, as is a graph
+    timed only through endpoint queries (most pins have no AT).
+    """
+
+    def __init__(self, analyzer: TimingAnalyzer):
+        self.analyzer = analyzer
+        self.graph = analyzer.graph
+
+    def run(self) -> Dict[str, Any]:
+        if self.analyzer.constraints.get('propagated_clock', False):
+            raise ValueError("Sensitivity analysis does not support propagated clocks")
+        if self.analyzer._cone_at is not None:
+            raise ValueError("Sensitivity analysis needs a full timing run, not endpoint queries")
+
+        print("Computing slack sensitivities...")
+        nodes = self.graph.get_all_nodes()
+        slack: Dict[str, float] = {}
+        for node in nodes:
+            required = self.analyzer._required_time(node) if node.at != -1.0 else 999.0
+            if required != 999.0:
+                slack[node.name] = required - node.at
+        endpoints = [n for n in nodes if n.name in slack]
+        worst = min(endpoints, key=lambda n: (slack[n.name], n.name), default=None)
+        violating = [n for n in endpoints if slack[n.name] < 0]
+
+        count: Dict[str, int] = defaultdict(int) # Violating endpoints whose worst path passes the pin
+        for node in violating:
+            count[node.name] = 1
+        on_worst_path = {worst.name} if worst is not None else set()
+
+        arcs = []
+        parameters: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0.0]) # Name -> [dWNS, dTNS]
+        fanout_factor = self.analyzer.lib.get('wire_load_model', {}).get('fanout_factor', 0.0)
+
+        for node in reversed(self.analyzer._topological_sort(nodes)):
+            critical = count[node.name]
+            on_path = node.name in on_worst_path
+            if not critical and not on_path:
+                continue
+
+            d_wns = -1.0 if on_path else 0.0
+            d_tns = -float(critical) if critical else 0.0
+            pred = self._worst_predecessor(node)
+            if pred is None:
+                if self.analyzer._is_dff_output(node):
+                    self._accumulate(parameters, "DFF.delay_clk_q", d_wns, d_tns)
+                continue
+
+            source, delay, edge_type = pred
+            count[source.name] += critical
+            if on_path:
+                on_worst_path.add(source.name)
+            arcs.append({
+                "source": source.name,
+                "target": node.name,
+                "type": edge_type,
+                "delay": delay,
+                "d_wns": d_wns,
+                "d_tns": d_tns,
+            })
+
+            if edge_type == "internal" and source.cell is not None:
+                self._accumulate(parameters, f"{source.cell}.delay", d_wns, d_tns)
+            elif edge_type == "net" and fanout_factor:
+                fanout = round(delay / fanout_factor)
+                self._accumulate(parameters, "wire_load_model.fanout_factor", d_wns * fanout, d_tns * fanout)
+
+        ranked = [{"parameter": name, "d_wns": d_wns, "d_tns": d_tns} for name, (d_wns, d_tns) in parameters.items()]
+        return {
+            "wns": slack[worst.name] if worst is not None else float('inf'),
+            "worst_node": worst.name if worst is not None else None,
+            "tns": sum((slack[n.name] for n in violating), 0.0),
+            "violating": len(violating),
+            "parameters": sorted(ranked, key=lambda x: (x['d_tns'], x['d_wns'], x['parameter'])),
+            "arcs": sorted(arcs, key=lambda x: (x['d_tns'], x['d_wns'], x['source'], x['target'])),
+        }
+
+    def _worst_predecessor(self, node: Node) -> Optional[Tuple[Node, float, str]]:
+        """The fanin arc that sets the pin's AT (first by name on ties), or None for a launch."""
+        best = None
+        for source, delay, edge_type in self.graph.get_fanin(node):
+            if source.at == -1.0 or source.at + delay != node.at:
+                continue
+            if best is None or source.name < best[0].name:
+                best = (source, delay, edge_type)
+        return best
+
+    def _accumulate(self, parameters: Dict[str, List[float]], name: str, d_wns: float, d_tns: float):
+        parameters[name][0] += d_wns
+        parameters[name][1] += d_tns
+
+
+def save_sensitivity(path: str, sensitivity: Dict[str, Any]):
+    """Writes the ranked sensitivities as JSON for sizing scripts."""
+    with open(path, 'w') as f:
+        json.dump(sensitivity, f, indent=2)
+    print(f"Sensitivities saved to: {path}")
@@ -0,0 +1,56 @@
+import re
+from typing import Iterator
+
+
+def iter_statements(file_path: str, directives: bool = False) -> Iterator[str]:
+    """Yields the comment-free statements of the first module, one at a time.
+
+    Compiler directive lines (`timescale, `define, `include, ...) are not
+    part of any statement: they are dropped, or yielded as statements of
+    their own with `directives=True`.
+    """
+    pending = []
+    in_block = False
+    in_directive = False
+    with open(file_path) as f:
+        for line in f:
+            text = []
+            while line:
+                if in_block:
+                    end = line.find("*/")
+                    if end < 0:
+                        line = ""
+                    else:
+                        line, in_block = line[end + 2:], False
+                    continue
+                cuts = [i for i in (line.find("//"), line.find("/*")) if i >= 0]
+                if not cuts:
+                    text.append(line)
+                    break
+                cut = min(cuts)
+                text.append(line[:cut])
+                if line.startswith("/*", cut):
+                    line, in_block = line[cut + 2:], True
+                else:
+                    break
+
+            line = "".join(text)
+            # A directive starts a line between statements and runs to the end
+            # of the line (or on, over backslash continuations)
+            if in_directive or (line.lstrip().startswith("`") and not "".join(pending).strip()):
+                in_directive = line.rstrip().endswith("\\")
+                if directives and line.strip():
+                    yield line.strip()
+                continue
+
+            end_module = re.search(r"\bendmodule\b", line)
+            if end_module:
+                line = line[:end_module.start()]
+            parts = line.split(";")
+            for part in parts[:-1]:
+                pending.append(part)
+                yield "".join(pending).strip()
+                pending = []
+            pending.append(parts[-1])
+            if end_module:
+                return
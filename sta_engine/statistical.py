@@ -0,0 +1,239 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from typing import Dict, List, Any, Optional, Tuple
+
+from .analysis import TimingAnalyzer
+from .graph import Graph, Node
+
+QUANTILES = (0.001, 0.01, 0.5)
+
+
+class StatisticalTimingAnalyzer(TimingAnalyzer):
+    """Monte Carlo STA: propagates N delay samples per pin, one topological level at a time.
+
+    Arc delays are drawn as an (arcs x samples) matrix from a normal
+    distribution around the library delay, using `delay_sigma` of the
+    driving cell (`delay_clk_q_sigma` for register launches) and
+    `wire_load_model.sigma_ratio` for net arcs. Samples are processed in
+    chunks of `chunk_size`; each chunk is propagated with one vectorized
+    max per level of the graph and fanin rank (arcs are grouped so a group
+    never writes the same pin twice) and then folded into running per-endpoint
+    statistics (sums, a slack histogram of `bins` bins, the worst slack
+    per sample for the yield), so memory is bounded by (pins + arcs) x
+    chunk_size and endpoints x bins, independent of the sample count.
+    Quantiles are interpolated from the histogram, whose range is set
+    from the first chunk (samples outside it fall into two open-ended
+    bins bounded by the exact min / max).
+    """
+
+    def __init__(self, graph: Graph, constraints: Dict[str, float], library: Dict[str, Any],
+                 samples: int = 1000, seed: Optional[int] = None, chunk_size: int = 256, bins: int = 256):
+        if chunk_size < 1:
+            raise ValueError(f"Monte Carlo chunk size must be at least 1, got {chunk_size}")
+        super().__init__(graph, constraints, library)
+        self.samples = samples
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.bins = bins
+
+    def run_statistical(self) -> Dict[str, Any]:
+        """Runs the Monte Carlo analysis and returns per-endpoint slack statistics."""
+        if np is None:
+            raise RuntimeError("numpy not installed. Please run 'uv add numpy'")
+        if self.constraints.get('propagated_clock', False):
+            # CRPR credit depends on the launching register of every sampled path
+            raise ValueError("Monte Carlo analysis does not support propagated clocks")
+
+        print(f"Running Monte Carlo timing ({self.samples} samples)...")
+        nodes = self.graph.get_all_nodes()
+        topo_order = self._break_loops(nodes) or self._topological_sort(nodes)
+        index = {node.name: i for i, node in enumerate(nodes)}
+
+        starts, start_mean, start_sigma = self._collect_start_points(nodes)
+        src, dst, arc_mean, arc_sigma = self._collect_arcs(topo_order, index)
+        arc_order, groups = self._group_arcs(topo_order, index, dst)
+        src, dst, arc_mean, arc_sigma = src[arc_order], dst[arc_order], arc_mean[arc_order], arc_sigma[arc_order]
+
+        # RTs are computed here, not stored: the graph keeps the deterministic results
+        required_times = [self._required_time(node) for node in nodes]
+        endpoints = np.array([i for i, rt in enumerate(required_times) if rt != 999.0], dtype=np.int64)
+        required = np.array([required_times[i] for i in endpoints])
+
+        rng = np.random.default_rng(self.seed)
+        summary = None
+        for lo in range(0, self.samples, self.chunk_size):
+            width = min(self.chunk_size, self.samples - lo)
+            at = np.full((len(nodes), width), -np.inf)
+            at[starts] = self._draw(rng, start_mean, start_sigma, width)
+            delays = self._draw(rng, arc_mean, arc_sigma, width)
+
+            # One vectorized max per group; a group never repeats a target and
+            # all of its sources lie on earlier levels
+            for a, b in zip(groups[:-1], groups[1:]):
+                pins = dst[a:b]
+                at[pins] = np.maximum(at[pins], at[src[a:b]] + delays[a:b])
+
+            slack = required[:, None] - at[endpoints]
+            if summary is None:
+                summary = _SlackSummary(slack, self.bins)
+            else:
+                summary.add(slack)
+
+        names = [nodes[i].name for i in endpoints]
+        return self._summarize(names, summary)
+
+    def _collect_start_points(self, nodes: List[Node]) -> Tuple[List[int], Any, Any]:
+        clk_q_sigma = self.lib['cells']['DFF'].get('delay_clk_q_sigma', 0.0)
+        starts, mean, sigma = [], [], []
+        for i, node in enumerate(nodes):
+            start_at = self._start_arrival(node)
+            if start_at == -1.0:
+                continue
+            starts.append(i)
+            mean.append(start_at)
+            sigma.append(clk_q_sigma if self._is_dff_output(node) else 0.0)
+        return starts, np.array(mean), np.array(sigma)
+
+    def _collect_arcs(self, topo_order: List[Node], index: Dict[str, int]):
+        net_sigma_ratio = self.lib.get('wire_load_model', {}).get('sigma_ratio', 0.0)
+        src, dst, mean, sigma = [], [], [], []
+        for node in topo_order:
+            if node.cell is not None:
+                cell_sigma = self.lib['cells'].get(node.cell, {}).get('delay_sigma', 0.0)
+            else:
+                cell_sigma = 0.0
+            for target, delay, edge_type in node.edges:
+                src.append(index[node.name])
+                dst.append(index[target.name])
+                mean.append(delay)
+                sigma.append(cell_sigma if edge_type == "internal" else delay * net_sigma_ratio)
+        return np.array(src, dtype=np.int64), np.array(dst, dtype=np.int64), np.array(mean), np.array(sigma)
+
+    def _draw(self, rng, mean, sigma, width: int):
+        """Draws `width` samples per row; delays are clipped at zero."""
+        samples = rng.standard_normal((len(mean), width))
+        samples *= sigma[:, None]
+        samples += mean[:, None]
+        return np.maximum(samples, 0.0, out=samples)
+
+    def _group_arcs(self, topo_order: List[Node], index: Dict[str, int], dst):
+        """Orders arcs by the topological level of their target, then by the arc's
+        rank among that target's fanin; returns the permutation and the group
+        boundaries (one group per level and rank)."""
+        level = [0] * len(index)
+        for node in topo_order:
+            next_level = level[index[node.name]] + 1
+            for target, _, _ in node.edges:
+                t = index[target.name]
+                if level[t] < next_level:
+                    level[t] = next_level
+
+        by_target = np.argsort(dst, kind='stable')
+        sorted_dst = dst[by_target]
+        first = np.flatnonzero(np.r_[True, sorted_dst[1:] != sorted_dst[:-1]]) if len(dst) else np.zeros(0, dtype=np.int64)
+        rank = np.empty(len(dst), dtype=np.int64)
+        rank[by_target] = np.arange(len(dst)) - np.repeat(first, np.diff(np.r_[first, len(dst)]))
+
+        arc_level = np.array(level, dtype=np.int64)[dst]
+        arc_order = np.lexsort((rank, arc_level))
+        key = arc_level[arc_order] * (int(rank.max(initial=0)) + 1) + rank[arc_order]
+        groups = np.r_[np.flatnonzero(np.r_[True, key[1:] != key[:-1]]) if len(key) else [], len(key)].astype(np.int64)
+        return arc_order, groups.tolist()
+
+    def _summarize(self, names: List[str], summary: Optional['_SlackSummary']) -> Dict[str, Any]:
+        """Turns the running slack statistics into per-endpoint statistics and timing yield."""
+        endpoints = []
+        timing_yield = 1.0
+        if summary is not None and summary.reached.any():
+            quantiles = summary.quantiles(QUANTILES)
+            mean, sigma = summary.mean_sigma()
+            for i in np.flatnonzero(summary.reached):
+                endpoints.append({
+                    "node": names[i],
+                    "mean": float(mean[i]),
+                    "sigma": float(sigma[i]),
+                    "quantiles": {q: float(quantiles[j, i]) for j, q in enumerate(QUANTILES)},
+                    "yield": float(summary.passing[i] / summary.count),
+                })
+            timing_yield = float(summary.all_passing / summary.count)
+
+        return {
+            "samples": self.samples,
+            "seed": self.seed,
+            "timing_yield": timing_yield,
+            "endpoints": sorted(endpoints, key=lambda x: x['mean']),
+        }
+
+
+class _SlackSummary:
+    """Streaming per-endpoint slack statistics over (endpoints x samples) chunks.
+
+    Keeps sums and sums of squares, passing-sample counts, the exact min /
+    max and a fixed-range histogram per endpoint, plus the number of
+    samples where every endpoint passes. The histogram range comes from
+    the first chunk, widened by half its spread on either side; bin 0 and
+    the last bin are open-ended and collect whatever falls outside it.
+    Endpoints the first chunk never reaches (infinite slack) are dropped.
+    """
+
+    def __init__(self, first, bins: int):
+        self.reached = np.isfinite(first).all(axis=1)
+        rows = len(first)
+        low = np.where(self.reached, first.min(axis=1, initial=np.inf), 0.0)
+        high = np.where(self.reached, first.max(axis=1, initial=-np.inf), 0.0)
+        spread = np.maximum(high - low, 1e-9 * (1.0 + np.abs(low)))
+        self.bins = bins
+        self.low = low - spread / 2
+        self.bin_width = 2 * spread / bins
+
+        self.count = 0
+        self.all_passing = 0
+        self.total = np.zeros(rows)
+        self.squares = np.zeros(rows)
+        self.passing = np.zeros(rows, dtype=np.int64)
+        self.min = np.full(rows, np.inf)
+        self.max = np.full(rows, -np.inf)
+        self.histogram = np.zeros((rows, bins + 2), dtype=np.int64)
+        self.add(first)
+
+    def add(self, slack):
+        slack = np.where(self.reached[:, None], slack, 0.0)
+        self.count += slack.shape[1]
+        self.all_passing += int((slack[self.reached].min(axis=0, initial=np.inf) >= 0).sum())
+        self.total += slack.sum(axis=1)
+        self.squares += (slack * slack).sum(axis=1)
+        self.passing += (slack >= 0).sum(axis=1)
+        np.minimum(self.min, slack.min(axis=1), out=self.min)
+        np.maximum(self.max, slack.max(axis=1), out=self.max)
+
+        bin_of = np.floor((slack - self.low[:, None]) / self.bin_width[:, None]) + 1
+        bin_of = np.clip(bin_of, 0, self.bins + 1).astype(np.int64)
+        flat = bin_of + (np.arange(len(slack)) * (self.bins + 2))[:, None]
+        self.histogram += np.bincount(flat.ravel(), minlength=self.histogram.size).reshape(self.histogram.shape)
+
+    def mean_sigma(self):
+        mean = self.total / self.count
+        return mean, np.sqrt(np.maximum(self.squares / self.count - mean * mean, 0.0))
+
+    def quantiles(self, levels):
+        """Linearly interpolated quantiles, shape (len(levels), endpoints)."""
+        rows = np.arange(len(self.histogram))
+        cumulative = np.cumsum(self.histogram, axis=1)
+        # Bin edges: the open-ended outer bins are closed by the exact min / max
+        edges = self.low[:, None] + self.bin_width[:, None] * np.arange(self.bins + 1)
+        lower = np.concatenate([np.minimum(self.min, edges[:, 0])[:, None], edges], axis=1)
+        upper = np.concatenate([edges, np.maximum(self.max, edges[:, -1])[:, None]], axis=1)
+
+        result = np.empty((len(levels), len(self.histogram)))
+        for j, q in enumerate(levels):
+            rank = q * self.count
+            b = np.minimum((cumulative < rank).sum(axis=1), self.bins + 1)
+            before = np.where(b > 0, cumulative[rows, b - 1], 0)
+            inside = self.histogram[rows, b]
+            fraction = np.where(inside > 0, (rank - before) / np.maximum(inside, 1), 0.0)
+            value = lower[rows, b] + np.clip(fraction, 0.0, 1.0) * (upper[rows, b] - lower[rows, b])
+            result[j] = np.clip(value, self.min, self.max)
+        return result
@@ -0,0 +1,269 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import json
+import mmap
+import os
+import re
+import struct
+from array import array
+from bisect import bisect_left
+from fnmatch import fnmatchcase
+from typing import Dict, List, Any, Optional, Tuple
+
+from .graph import Graph
+
+MAGIC = b"STARES01"
+VERSION = 1
+
+# (column name, array typecode); names are stored as offsets into a UTF-8 blob
+COLUMNS = (("at", 'd'), ("rt", 'd'), ("slack", 'd'), ("endpoint", 'B'), ("name_offsets", 'Q'))
+DTYPES = {'d': '<f8', 'B': 'u1', 'Q': '<u8'}
+
+
+def save_results(path: str, graph: Graph, results: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None):
+    """Writes per-pin AT/RT/slack and run metadata to a memory-mappable columnar file.
+
+    Rows are sorted by pin name so lookups and run diffs can use binary search
+    and merges. Slack is NaN for unconstrained pins; `endpoint` marks the rows
+    that appear in the analysis results.
+    """
+    slack_by_name = {res['node']: res['slack'] for res in results}
+    nodes = sorted(graph.get_all_nodes(), key=lambda n: n.name)
+
+    blob = bytearray()
+    offsets = array('Q', [0])
+    for node in nodes:
+        blob += node.name.encode('utf-8')
+        offsets.append(len(blob))
+
+    columns = {
+        "at": array('d', (node.at for node in nodes)),
+        "rt": array('d', (node.rt for node in nodes)),
+        "slack": array('d', (slack_by_name.get(node.name, float('nan')) for node in nodes)),
+        "endpoint": array('B', (node.name in slack_by_name for node in nodes)),
+        "name_offsets": offsets,
+    }
+
+    # Lay columns out on 8-byte boundaries after the header
+    layout = {}
+    position = 0
+    for name, _ in COLUMNS:
+        size = len(columns[name]) * columns[name].itemsize
+        layout[name] = [position, size]
+        position += _align(size)
+    layout["names"] = [position, len(blob)]
+
+    header = json.dumps({
+        "version": VERSION,
+        "count": len(nodes),
+        "metadata": metadata or {},
+        "columns": layout,
+    }).encode('utf-8')
+    header += b" " * (_align(len(header)) - len(header))
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        for name, _ in COLUMNS:
+            raw = columns[name].tobytes()
+            f.write(raw + b"\0" * (_align(len(raw)) - len(raw)))
+        f.write(blob)
+
+    print(f"Results saved to: {os.path.abspath(path)}")
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+class ResultStore:
+    """Read-only, memory-mapped view of a results file written by `save_results`.
+
+    Columns are exposed both as memoryviews (single rows) and as numpy
+    arrays over the same mapping (bulk filters), so nothing is copied.
+    """
+
+    def __init__(self, path: str):
+        if np is None:
+            raise RuntimeError("numpy not installed. Please run 'uv add numpy'")
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            self._file.close()
+            raise ValueError(f"{path} is not a results file: {e}") from e
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a results file")
+
+        header_len, = struct.unpack_from('<Q', self._mmap, len(MAGIC))
+        base = len(MAGIC) + 8
+        header = json.loads(self._mmap[base:base + header_len].decode('utf-8'))
+        if header['version'] != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported results file version {header['version']}")
+
+        self.metadata: Dict[str, Any] = header['metadata']
+        self.count: int = header['count']
+
+        data = base + header_len
+        view = memoryview(self._mmap)
+        self._views = []
+        self._columns = {}
+        self._arrays = {}
+        for name, typecode in COLUMNS:
+            offset, size = header['columns'][name]
+            column = view[data + offset:data + offset + size].cast(typecode)
+            self._views.append(column)
+            self._columns[name] = column
+            self._arrays[name] = np.frombuffer(column, dtype=DTYPES[typecode])
+        offset, size = header['columns']['names']
+        self._names = view[data + offset:data + offset + size]
+        self._views.append(self._names)
+        self._views.append(view)
+
+    def close(self):
+        self._arrays = {} # Drop the numpy views before releasing the buffers they export
+        for view in getattr(self, '_views', []):
+            view.release()
+        self._views = []
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def name(self, i: int) -> str:
+        offsets = self._columns['name_offsets']
+        return bytes(self._names[offsets[i]:offsets[i + 1]]).decode('utf-8')
+
+    def row(self, i: int) -> Dict[str, Any]:
+        slack = self._columns['slack'][i]
+        return {
+            "node": self.name(i),
+            "at": self._columns['at'][i],
+            "rt": self._columns['rt'][i],
+            "slack": slack,
+            "endpoint": bool(self._columns['endpoint'][i]),
+            "status": "MET" if slack >= 0 else "VIOLATED" if slack < 0 else "UNCONSTRAINED",
+        }
+
+    def find(self, name: str) -> Optional[int]:
+        """Returns the row of the given pin via binary search, or None."""
+        names = _NameSequence(self)
+        i = bisect_left(names, name)
+        if i < self.count and names[i] == name:
+            return i
+        return None
+
+    def query(self, pattern: Optional[str] = None, min_slack: Optional[float] = None,
+              max_slack: Optional[float] = None, endpoints_only: bool = False) -> List[Dict[str, Any]]:
+        """Filters rows by glob pattern on the pin name and/or a slack range.
+
+        Slack and endpoint filters run over the mapped columns; names are only
+        decoded for the rows that pass them (and, for a pattern with a literal
+        prefix, only within the prefix's range of the sorted name column).
+        """
+        slack = self._arrays['slack']
+        lo, hi = self._prefix_range(pattern) if pattern is not None else (0, self.count)
+        keep = np.ones(hi - lo, dtype=bool)
+        if endpoints_only:
+            keep &= self._arrays['endpoint'][lo:hi] != 0
+        if min_slack is not None:
+            keep &= slack[lo:hi] >= min_slack # NaN (unconstrained) never passes
+        if max_slack is not None:
+            keep &= slack[lo:hi] <= max_slack
+
+        rows = []
+        for i in (np.flatnonzero(keep) + lo).tolist():
+            if pattern is not None and not fnmatchcase(self.name(i), pattern):
+                continue
+            rows.append(self.row(i))
+        return rows
+
+    def histogram(self, bins: int = 10) -> List[Tuple[float, float, int]]:
+        """Bins endpoint slack into `bins` equal-width buckets: [(low, high, count)]."""
+        if bins < 1:
+            raise ValueError(f"Histogram needs at least 1 bin, got {bins}")
+        values = self._arrays['slack'][self._arrays['endpoint'] != 0]
+        if not len(values):
+            return []
+
+        low, high = float(values.min()), float(values.max())
+        width = (high - low) / bins or 1.0
+        bucket = np.minimum(((values - low) / width).astype(np.int64), bins - 1)
+        counts = np.bincount(bucket, minlength=bins).tolist()
+        return [(low + i * width, low + (i + 1) * width, counts[i]) for i in range(bins)]
+
+    def _prefix_range(self, pattern: str) -> Tuple[int, int]:
+        """Rows whose name starts with the pattern's literal prefix (names are sorted)."""
+        prefix = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+        if not prefix:
+            return 0, self.count
+        names = _NameSequence(self)
+        lo = bisect_left(names, prefix)
+        hi = bisect_left(names, prefix[:-1] + chr(ord(prefix[-1]) + 1), lo)
+        return lo, hi
+
+    def diff(self, baseline: 'ResultStore') -> Dict[str, Any]:
+        """Compares endpoint slack against an earlier run by merging the sorted name columns."""
+        deltas = []
+        added, removed = [], []
+        i = j = 0
+        while i < self.count or j < baseline.count:
+            name = self.name(i) if i < self.count else None
+            base_name = baseline.name(j) if j < baseline.count else None
+
+            if base_name is None or (name is not None and name < base_name):
+                if self._columns['endpoint'][i]:
+                    added.append(name)
+                i += 1
+            elif name is None or base_name < name:
+                if baseline._columns['endpoint'][j]:
+                    removed.append(base_name)
+                j += 1
+            else:
+                is_ep = self._columns['endpoint'][i]
+                was_ep = baseline._columns['endpoint'][j]
+                if is_ep and was_ep:
+                    new, old = self._columns['slack'][i], baseline._columns['slack'][j]
+                    deltas.append({"node": name, "old_slack": old, "new_slack": new, "delta": new - old})
+                elif is_ep:
+                    added.append(name)
+                elif was_ep:
+                    removed.append(base_name)
+                i += 1
+                j += 1
+
+        return {
+            "newly_violating": [d for d in deltas if d['new_slack'] < 0 <= d['old_slack']],
+            "fixed": [d for d in deltas if d['old_slack'] < 0 <= d['new_slack']],
+            "deltas": sorted(deltas, key=lambda d: d['delta']),
+            "added_endpoints": added,
+            "removed_endpoints": removed,
+        }
+
+
+class _NameSequence:
+    """Lazy sequence over the sorted name column, for `bisect`."""
+
+    def __init__(self, store: ResultStore):
+        self.store = store
+
+    def __len__(self) -> int:
+        return self.store.count
+
+    def __getitem__(self, i: int) -> str:
+        return self.store.name(i)
@@ -0,0 +1,191 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import re
+from collections import defaultdict
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Tuple
+
+from .analysis import TimingAnalyzer
+from .graph import Graph, Node
+
+_BUS_BIT = re.compile(r"^(.*)\[(\d+)\]$")
+
+
+def group_bus_instances(instances: Dict[str, Tuple[str, Dict[str, str]]]) -> List[List[str]]:
+    """Groups bit-parallel instances: same cell, same scalar nets, and the same buses
+    at the same bit offsets from the instance's first bus pin (so shifted and
+    rotated wiring still groups). Each group is ordered by that first bit."""
+    groups: Dict[Any, Dict[int, str]] = defaultdict(dict)
+    for inst_name, (cell_type, connections) in instances.items():
+        bit = None
+        key = []
+        for port, net in sorted(connections.items()):
+            match = _BUS_BIT.match(net)
+            if match is None:
+                key.append((port, net, None))
+                continue
+            index = int(match.group(2))
+            if bit is None:
+                bit = index
+            key.append((port, match.group(1), index - bit))
+        if bit is None:
+            continue
+        members = groups[(cell_type, tuple(key))]
+        if bit in members:
+            continue # Two instances on the same bit cannot share a vector lane
+        members[bit] = inst_name
+
+    return [[members[bit] for bit in sorted(members)] for members in groups.values() if len(members) > 1]
+
+
+class VectorTimingAnalyzer(TimingAnalyzer):
+    """Propagates Arrival Times over bus-compressed vector nodes.
+
+    Bit-parallel instances (see group_bus_instances) are folded into vector
+    pins whose lanes (one per bit) sit side by side in one numpy AT array;
+    every other pin is a vector of width 1. The vector pins are levelized
+    and the scalar arcs sorted by the level of their source, so each level
+    is one vectorized max over the arcs leaving its buses. A group whose folding
+    would close a cycle between vector pins (e.g. a ripple carry, where
+    lane i of a cell group drives lane i+1 of the same group) is split back
+    into scalars. ATs are written back to the scalar pins, which are still
+    used for required times, slack and reporting, so results are identical
+    to the scalar engine. Only the flat layout (pins by lane, arc arrays,
+    level bounds, start point ATs) is kept; it is built once with numpy and
+    reused until the graph changes (`Graph.revision`).
+    """
+
+    def __init__(self, graph: Graph, constraints: Dict[str, float], library: Dict[str, Any],
+                 instances: Dict[str, Tuple[str, Dict[str, str]]]):
+        if np is None:
+            raise RuntimeError("numpy not installed. Please run 'uv add numpy'")
+        super().__init__(graph, constraints, library)
+        self.instances = instances
+        self.pins: List[Node] = []          # Scalar pins by lane; vector pin v is pins[offsets[v]:offsets[v + 1]]
+        self.offsets = None
+        self.arc_src = None                 # Scalar arcs as lane positions, sorted by the level of their source
+        self.arc_dst = None
+        self.arc_delay = None
+        self.bounds: List[int] = []         # Level k owns arcs [bounds[k], bounds[k + 1])
+        self.start_at = None                # Launch AT per lane, -inf where nothing launches
+        self.revision: Optional[int] = None # Graph.revision the layout was built from
+
+    def _propagate_arrival_times(self):
+        if self.constraints.get('propagated_clock', False):
+            raise ValueError("Bus-compressed analysis does not support propagated clocks")
+
+        print("Propagating Arrival Times (bus-compressed)...")
+        if self.revision != self.graph.revision:
+            # Loops are cut before folding; a cached layout is already loop free
+            nodes = self.graph.get_all_nodes()
+            self._break_loops(nodes)
+            self._build_vector_graph(nodes)
+            self.revision = self.graph.revision
+        self.reset_queries()
+        self.launch = {}
+        self.clock_tree = None
+
+        # Unreached lanes stay at -inf, which no arc can raise; every pin is a
+        # lane, so the write-back also resets the pins no start point reaches
+        at = self.start_at.copy()
+        for lo, hi in zip(self.bounds, self.bounds[1:]):
+            np.maximum.at(at, self.arc_dst[lo:hi], at[self.arc_src[lo:hi]] + self.arc_delay[lo:hi])
+        at[at == -np.inf] = -1.0
+
+        for node, value in zip(self.pins, at.tolist()):
+            node.at = value
+
+    def _build_vector_graph(self, nodes: List[Node]):
+        """Folds bus groups into vector pins and lays the arcs out by vector level."""
+        groups = [g for g in group_bus_instances(self.instances) if all(inst in self.instances for inst in g)]
+        index = {id(node): p for p, node in enumerate(nodes)}
+        edges = [edge for node in nodes for edge in node.edges]
+        src = np.repeat(np.arange(len(nodes), dtype=np.int64), [len(node.edges) for node in nodes])
+        dst = np.fromiter(map(index.__getitem__, map(id, map(itemgetter(0), edges))), dtype=np.int64, count=len(edges))
+        delay = np.fromiter(map(itemgetter(1), edges), dtype=np.float64, count=len(edges))
+        while True:
+            vector, position = self._fold(nodes, index, groups)
+            count = len(self.offsets) - 1
+            pairs = np.unique(vector[src] * count + vector[dst])
+            v, w = pairs // count, pairs % count # One vector edge per (source, target) vector pair
+            level, depth = self._levelize(count, v, w)
+            cyclic = np.flatnonzero(level == -1)
+            if not len(cyclic):
+                break
+
+            # Split every group that owns a vector pin left on a cycle and retry;
+            # leveling the leftover backwards drops the pins only fed by a cycle
+            inside = (level[v] == -1) & (level[w] == -1)
+            reverse, _ = self._levelize(count, w[inside], v[inside])
+            looped = cyclic[reverse[cyclic] == -1]
+            wide = looped[np.diff(self.offsets)[looped] > 1]
+            split = {self.pins[p].name.rsplit("/", 1)[0] for p in self.offsets[wide].tolist()}
+            groups = [g for g in groups if g[0] not in split]
+            if not split:
+                # Scalar loops only (already reported by the loop breaker): one level per pin
+                level[cyclic] = depth + np.arange(len(cyclic))
+                depth += len(cyclic)
+                break
+
+        by_level = np.argsort(level[vector[src]], kind='stable')
+        self.arc_src = position[src[by_level]]
+        self.arc_dst = position[dst[by_level]]
+        self.arc_delay = delay[by_level]
+        self.bounds = np.searchsorted(level[vector[src]][by_level], np.arange(depth + 1)).tolist()
+        self.start_at = np.fromiter(map(self._start_arrival, self.pins), dtype=np.float64, count=len(self.pins))
+        self.start_at[self.start_at == -1.0] = -np.inf
+        print(f"Vector graph: {count} vector pins for {len(self.pins)} pins, "
+              f"{len(pairs)} vector edges, {depth} levels")
+
+    def _fold(self, nodes: List[Node], index: Dict[int, int], groups: List[List[str]]):
+        """Builds the vector pins of `groups` (plus one per remaining pin) with their lanes
+        side by side; returns each scalar pin's vector pin and lane position."""
+        vector = np.full(len(nodes), -1, dtype=np.int64)   # Scalar pin -> vector pin
+        position = np.zeros(len(nodes), dtype=np.int64)    # Scalar pin -> lane position
+        pins: List[Node] = []
+        widths: List[int] = []
+        for group in groups:
+            cell_info = self.lib['cells'][self.instances[group[0]][0]]
+            for pin in cell_info.get('inputs', []) + cell_info.get('outputs', []):
+                lanes = [self.graph.get_node(f"{inst}/{pin}") for inst in group]
+                if any(node is None for node in lanes):
+                    continue
+                scalars = [index[id(node)] for node in lanes]
+                vector[scalars] = len(widths)
+                position[scalars] = len(pins) + np.arange(len(lanes))
+                pins.extend(lanes)
+                widths.append(len(lanes))
+        single = np.flatnonzero(vector == -1)
+        vector[single] = len(widths) + np.arange(len(single))
+        position[single] = len(pins) + np.arange(len(single))
+        pins.extend(nodes[p] for p in single.tolist())
+
+        self.pins = pins
+        self.offsets = np.zeros(len(widths) + len(single) + 1, dtype=np.int64)
+        np.cumsum(np.r_[np.array(widths, dtype=np.int64), np.ones(len(single), dtype=np.int64)], out=self.offsets[1:])
+        return vector, position
+
+    def _levelize(self, count: int, v, w) -> Tuple[Any, int]:
+        """Kahn frontiers over the vector edges (v -> w); returns each vector pin's
+        level (-1 if left on a cycle) and the number of levels."""
+        out_offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(v, minlength=count), out=out_offsets[1:])
+        out_dst = w[np.argsort(v, kind='stable')]
+        in_degree = np.bincount(w, minlength=count)
+        level = np.full(count, -1, dtype=np.int64)
+        frontier = np.flatnonzero(in_degree == 0)
+        depth = 0
+        while len(frontier):
+            level[frontier] = depth
+            first = out_offsets[frontier]
+            counts = out_offsets[frontier + 1] - first
+            arcs = np.repeat(first - np.cumsum(counts) + counts, counts) + np.arange(int(counts.sum()))
+            targets = out_dst[arcs]
+            np.subtract.at(in_degree, targets, 1)
+            touched = np.unique(targets)
+            frontier = touched[in_degree[touched] == 0]
+            depth += 1
+        return level, depth
@@ -1,10 +1,20 @@
 try:
-    from graphviz import Digraph
+    from graphviz import Digraph, Source
 except ImportError:
     Digraph = None
+    Source = None
 
 from .graph import Graph
 
+def render_source(source: str, output_file: str):
+    """Runs the external `dot` renderer on DOT source; safe to call in a worker process."""
+    try:
+        Source(source).render(output_file, view=False, format='png')
+    except Exception as e:
+        # graphviz exceptions do not survive pickling back from a worker process
+        raise RuntimeError(str(e)) from None
+    print(f"Graph rendered to {output_file}.png")
+
 class GraphVisualizer:
     """Handles visualization of the STA Graph using Graphviz."""
     
@@ -13,9 +23,20 @@ class GraphVisualizer:
 
     def plot(self, output_file: str = "sta_graph"):
         """Generates a visual representation of the graph."""
+        dot = self.build()
+        if dot is None:
+            return
+
+        try:
+            render_source(dot.source, output_file)
+        except Exception as e:
+            print(f"Error rendering graph: {e}")
+
+    def build(self):
+        """Builds the Graphviz description of the graph without rendering it."""
         if Digraph is None:
             print("Error: graphviz not installed. Please run 'uv add graphviz'")
-            return
+            return None
 
         dot = Digraph(comment='STA Timing Graph')
         dot.attr(rankdir='LR')
@@ -23,12 +44,7 @@ class GraphVisualizer:
         for node in self.graph.get_all_nodes():
             self._add_node_to_graph(dot, node)
             self._add_edges_to_graph(dot, node)
-
-        try:
-            dot.render(output_file, view=False, format='png')
-            print(f"Graph rendered to {output_file}.png")
-        except Exception as e:
-            print(f"Error rendering graph: {e}")
+        return dot
 
     def _add_node_to_graph(self, dot, node):
         # Color code: Inputs (green/blue), Outputs (red), Others (white)
@@ -0,0 +1,68 @@
+import json
+import os
+import random
+import tempfile
+
+from pyverilog.vparser.parser import VerilogParser as PyverilogParser
+
+from sta_engine.graph import Graph
+from sta_engine.parser import VerilogParser
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+CONFIG = os.path.join(ROOT, "config", "sta_config.json")
+ACCUMULATOR = os.path.join(ROOT, "design", "accumulator.v")
+
+_pyverilog = None
+
+
+def load_config():
+    with open(CONFIG) as f:
+        return json.load(f)
+
+
+def read_design(path=ACCUMULATOR):
+    with open(path) as f:
+        return f.read()
+
+
+def read_module(text):
+    """The first module of `text`, from Pyverilog run on the text directly
+    (VerilogParser._read_module preprocesses the file with iverilog)."""
+    global _pyverilog
+    if _pyverilog is None:
+        _pyverilog = PyverilogParser(outputdir=tempfile.gettempdir(), debug=False)
+    return _pyverilog.parse(text, debug=0).description.definitions[0]
+
+
+def parse_verilog(lib, text):
+    """Builds the Graph of `text` the way VerilogParser.parse does (see read_module)."""
+    parser = VerilogParser(lib)
+    parser._build(read_module(text))
+    return parser
+
+
+def random_graph(width=40, depth=6, loops=0, seed=1):
+    """Random levelized logic between `width` launch and capture registers
+    (names follow the analyzer's start / end point rules); `loops` cells get
+    their output fed back to their input."""
+    rng = random.Random(seed)
+    graph = Graph()
+    previous = [graph.get_or_create_node(f"reg_a{i}/Q") for i in range(width)]
+    previous.append(graph.get_or_create_node("data_in", "port"))
+    outputs = []
+    for level in range(depth):
+        current = []
+        for i in range(width):
+            pin_a = graph.get_or_create_node(f"u{level}_{i}/A")
+            pin_y = graph.get_or_create_node(f"u{level}_{i}/Y")
+            graph.add_edge(pin_a, pin_y, round(rng.uniform(0.01, 0.1), 3), "internal")
+            for source in rng.sample(previous, 2):
+                graph.add_edge(source, pin_a, round(rng.uniform(0.0, 0.01), 4), "net")
+            current.append(pin_y)
+        outputs.extend(current)
+        previous = current
+    for i, source in enumerate(previous):
+        graph.add_edge(source, graph.get_or_create_node(f"reg_z{i}/D"), 0.003, "net")
+    for pin_y in rng.sample(outputs, loops):
+        graph.add_edge(pin_y, graph.nodes[pin_y.name[:-1] + "A"], 0.002, "net")
+    return graph
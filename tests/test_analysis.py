@@ -0,0 +1,58 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from support import load_config, random_graph
+from sta_engine.analysis import TimingAnalyzer
+
+
+class EndpointQueryTest(unittest.TestCase):
+    def setUp(self):
+        config = load_config()
+        self.constraints = config['timing_constraints']
+        self.lib = config['library']
+
+    def full_run(self, graph):
+        with redirect_stdout(io.StringIO()):
+            return TimingAnalyzer(graph, self.constraints, self.lib).run_analysis()
+
+    def test_queries_match_full_analysis(self):
+        expected = self.full_run(random_graph(seed=11))
+        names = [row['node'] for row in expected[2]]
+
+        # One analyzer for every query, so later queries reuse memoized cones
+        analyzer = TimingAnalyzer(random_graph(seed=11), self.constraints, self.lib)
+        by_node = lambda row: row['node']
+        for name in names[::2]:
+            self.assertEqual(analyzer.query_endpoint(name), next(r for r in expected[2] if r['node'] == name))
+        results = analyzer.query_endpoints(names)
+        self.assertEqual(results[:2], expected[:2])
+        self.assertEqual(sorted(results[2], key=by_node), sorted(expected[2], key=by_node))
+
+    def test_reset_after_an_edit(self):
+        graph = random_graph(seed=12)
+        analyzer = TimingAnalyzer(graph, self.constraints, self.lib)
+        before = analyzer.query_endpoint("reg_z3/D")
+
+        graph.add_edge(graph.nodes["reg_a0/Q"], graph.nodes["reg_z3/D"], 2.0, "net")
+        analyzer.reset_queries()
+        after = analyzer.query_endpoint("reg_z3/D")
+        edited = random_graph(seed=12)
+        edited.add_edge(edited.nodes["reg_a0/Q"], edited.nodes["reg_z3/D"], 2.0, "net")
+        expected = next(r for r in self.full_run(edited)[2] if r['node'] == "reg_z3/D")
+        self.assertLess(after['slack'], before['slack'])
+        self.assertEqual(after, expected)
+
+    def test_bad_endpoints(self):
+        graph = random_graph(seed=12)
+        graph.get_or_create_node("reg_x/D")
+        analyzer = TimingAnalyzer(graph, self.constraints, self.lib)
+        with self.assertRaises(ValueError):
+            analyzer.query_endpoint("no/such_pin")
+        with self.assertRaises(ValueError):
+            analyzer.query_endpoint("u0_0/Y")
+        self.assertIsNone(analyzer.query_endpoint("reg_x/D"))
+
+
+if __name__ == "__main__":
+    unittest.main()
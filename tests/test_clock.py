@@ -0,0 +1,103 @@
+import copy
+import io
+import random
+import unittest
+from contextlib import redirect_stdout
+
+from support import load_config, parse_verilog
+from sta_engine.analysis import TimingAnalyzer
+
+
+def random_design(seed, buffers=12, registers=8, gates=15):
+    """A random buffer tree from clk feeding registers that talk through AND2 logic."""
+    rng = random.Random(seed)
+    lines, wires = [], []
+    for i in range(buffers):
+        source = "clk" if i == 0 else f"ck{rng.randrange(i)}"
+        lines.append(f"BUF b{i} (.A({source}), .Y(ck{i}));")
+        wires.append(f"ck{i}")
+    signals = [f"q{i}" for i in range(registers)]
+    wires += signals
+    for i in range(gates):
+        a, b = rng.sample(signals, 2)
+        lines.append(f"AND2 g{i} (.A({a}), .B({b}), .Y(n{i}));")
+        wires.append(f"n{i}")
+        signals.append(f"n{i}")
+    for i in range(registers):
+        lines.append(f"DFF reg_{i} (.C(ck{rng.randrange(buffers)}), .D({rng.choice(signals[registers:])}), .Q(q{i}));")
+    return ("module crpr (input clk, input din, output dout);\n    wire " + ", ".join(wires) + ";\n    "
+            + "\n    ".join(lines) + "\nendmodule\n")
+
+
+class ClockTest(unittest.TestCase):
+    def setUp(self):
+        config = load_config()
+        self.lib = config['library']
+        self.base = config['timing_constraints']
+
+    def brute_force(self, graph, constraints):
+        """Worst slack per register input, from every launch register separately, with the
+        CRPR credit taken from the deepest pin the two clock paths share."""
+        early_derate = constraints['clock_derate_early']
+        late_derate = constraints['clock_derate_late']
+        dff = self.lib['cells']['DFF']
+
+        def clock_path(pin):
+            path = [graph.nodes[pin]]
+            while path[-1].name != "clk":
+                (driver, _, _), = graph.get_fanin(path[-1])
+                path.append(driver)
+            return path[::-1]
+
+        def latency(path, derate):
+            return sum(next(d for t, d, _ in a.edges if t is b) * derate for a, b in zip(path, path[1:]))
+
+        def credit(launch_path, capture_path):
+            common = 0
+            while common + 1 < min(len(launch_path), len(capture_path)) and \
+                    launch_path[common + 1] is capture_path[common + 1]:
+                common += 1
+            shared = launch_path[:common + 1]
+            return latency(shared, late_derate) - latency(shared, early_derate)
+
+        registers = sorted({name.split("/")[0] for name in graph.nodes if name.startswith("reg_")})
+        paths = {reg: clock_path(f"{reg}/C") for reg in registers}
+        order = TimingAnalyzer(graph, constraints, self.lib)._topological_sort(graph.get_all_nodes())
+        worst = {}
+        for launch in registers:
+            arrival = {f"{launch}/Q": latency(paths[launch], late_derate) + dff['delay_clk_q']}
+            for node in order:
+                if node.name in arrival:
+                    for target, delay, _ in node.edges:
+                        arrival[target.name] = max(arrival.get(target.name, float('-inf')), arrival[node.name] + delay)
+            for capture in registers:
+                pin = f"{capture}/D"
+                if pin not in arrival:
+                    continue
+                required = (constraints['clock_period'] - dff['setup'] - constraints['clock_uncertainty']
+                            + latency(paths[capture], early_derate) + credit(paths[launch], paths[capture]))
+                worst[pin] = min(worst.get(pin, float('inf')), required - arrival[pin])
+        return worst
+
+    def test_crpr_matches_brute_force(self):
+        for seed in range(12):
+            rng = random.Random(seed)
+            constraints = copy.deepcopy(self.base)
+            constraints.update(propagated_clock=True, clock_derate_early=rng.choice([0.5, 0.9, 1.2]),
+                               clock_derate_late=rng.choice([1.5, 1.1, 0.8]))
+            graph = parse_verilog(self.lib, random_design(seed)).graph
+            with redirect_stdout(io.StringIO()):
+                _, _, results = TimingAnalyzer(graph, constraints, self.lib).run_analysis()
+                queried = TimingAnalyzer(graph, constraints, self.lib).query_endpoints(
+                    sorted(row['node'] for row in results))[2]
+            expected = self.brute_force(graph, constraints)
+
+            with self.subTest(seed=seed):
+                self.assertEqual({row['node'] for row in results}, set(expected))
+                for rows in (results, queried):
+                    for row in rows:
+                        self.assertAlmostEqual(row['slack'], expected[row['node']], places=12)
+
+
+if __name__ == "__main__":
+    unittest.main()
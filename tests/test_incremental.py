@@ -0,0 +1,103 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from support import load_config, parse_verilog, read_design, read_module
+from sta_engine.analysis import TimingAnalyzer
+from sta_engine.incremental import IncrementalParser
+
+DESIGN = read_design()
+
+
+class TextIncrementalParser(IncrementalParser):
+    def _read_module(self, file_path):
+        with open(file_path) as f:
+            return read_module(f.read())
+
+
+def snapshot(graph):
+    return {node.name: (node.at, node.rt, sorted((t.name, w, k) for t, w, k in node.edges))
+            for node in graph.get_all_nodes()}
+
+
+class IncrementalTest(unittest.TestCase):
+    def setUp(self):
+        config = load_config()
+        self.constraints = config['timing_constraints']
+        self.lib = config['library']
+        workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, workdir)
+        self.path = os.path.join(workdir, "design.v")
+
+        self.write(DESIGN)
+        self.parser = TextIncrementalParser(self.lib)
+        with redirect_stdout(io.StringIO()):
+            self.graph = self.parser.parse(self.path)
+            self.analyzer = TimingAnalyzer(self.graph, self.constraints, self.lib)
+            self.analyzer.run_analysis()
+
+    def write(self, text):
+        with open(self.path, 'w') as f:
+            f.write(text)
+
+    def reparse(self, text):
+        """Applies an edit incrementally; returns the diff and the timing results."""
+        self.write(text)
+        with redirect_stdout(io.StringIO()):
+            diff = self.parser.reparse(self.path)
+            if diff.full_rebuild:
+                results = self.analyzer.run_analysis()
+            else:
+                results = self.analyzer.update_analysis(diff.touched)
+        return diff, results
+
+    def assertMatchesFullRun(self, text, results):
+        with redirect_stdout(io.StringIO()):
+            graph = parse_verilog(self.lib, text).graph
+            expected = TimingAnalyzer(graph, self.constraints, self.lib).run_analysis()
+        self.assertEqual(snapshot(self.graph), snapshot(graph))
+        self.assertEqual(results[:2], expected[:2])
+        by_node = lambda row: row['node']
+        self.assertEqual(sorted(results[2], key=by_node), sorted(expected[2], key=by_node))
+
+    def test_edits_match_a_full_run(self):
+        edits = {
+            "rewire": DESIGN.replace("XOR2 x1b (.A(sum1_half), .B(c0)", "XOR2 x1b (.A(sum1_half), .B(c1)"),
+            "insert buffer": DESIGN.replace("    DFF reg_sum1", "    BUF bx (.A(c0), .Y(c0b));\n    DFF reg_sum1")
+                                   .replace("XOR2 x1b (.A(sum1_half), .B(c0)", "XOR2 x1b (.A(sum1_half), .B(c0b)"),
+            "remove": DESIGN.replace("    AND2 a1b (.A(sum1_half), .B(c0), .Y(c1_b));\n", ""),
+            "revert": DESIGN,
+        }
+        for name, text in edits.items():
+            with self.subTest(edit=name):
+                diff, results = self.reparse(text)
+                self.assertFalse(diff.full_rebuild)
+                self.assertFalse(diff.is_empty())
+                self.assertMatchesFullRun(text, results)
+
+    def test_comment_and_whitespace_edits_are_empty(self):
+        diff, _ = self.reparse(DESIGN.replace("XOR2 x1b", "// tweak\n    XOR2   x1b"))
+        self.assertTrue(diff.is_empty())
+
+    def test_port_change_rebuilds(self):
+        text = DESIGN.replace("input clk", "input clk2, input clk")
+        diff, results = self.reparse(text)
+        self.assertTrue(diff.full_rebuild)
+        self.assertMatchesFullRun(text, results)
+
+    def test_directive_change_parses_the_module(self):
+        diff, _ = self.reparse("`timescale 1ns/1ps\n" + DESIGN)
+        self.assertTrue(diff.is_empty())
+        self.assertIn("`timescale 1ns/1ps", self.parser.statements)
+
+        text = "`timescale 1ns/1ps\n" + DESIGN.replace("    AND2 a1b (.A(sum1_half), .B(c0), .Y(c1_b));\n", "")
+        diff, results = self.reparse(text)
+        self.assertEqual(diff.removed, ["a1b"])
+        self.assertMatchesFullRun(text, results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from support import load_config, random_graph
+from sta_engine.analysis import TimingAnalyzer
+from sta_engine.loops import LoopBreaker, find_strongly_connected_components, kahn_order
+
+
+def reachable(node):
+    seen, stack = set(), [node]
+    while stack:
+        for target, _, _ in stack.pop().edges:
+            if target.name not in seen:
+                seen.add(target.name)
+                stack.append(target)
+    return seen
+
+
+def ring(graph, names, delay=0.01):
+    nodes = [graph.get_or_create_node(name) for name in names]
+    for source, target in zip(nodes, nodes[1:] + nodes[:1]):
+        graph.add_edge(source, target, delay, "net")
+    return nodes
+
+
+class LoopTest(unittest.TestCase):
+    def setUp(self):
+        config = load_config()
+        self.constraints = config['timing_constraints']
+        self.lib = config['library']
+
+    def test_components_match_mutual_reachability(self):
+        graph = random_graph(width=12, depth=4, loops=4, seed=9)
+        ring(graph, ["u0_0/Y", "u1_1/A", "u1_1/Y", "u0_0/A"])
+        nodes = graph.get_all_nodes()
+        reach = {node.name: reachable(node) for node in nodes}
+
+        components = find_strongly_connected_components(nodes)
+        self.assertEqual(sum(map(len, components)), len(nodes))
+        for component in components:
+            names = {node.name for node in component}
+            for node in nodes:
+                mutual = node.name in names or all(node.name in reach[n] and n in reach[node.name] for n in names)
+                self.assertEqual(node.name in names, mutual, node.name)
+
+    def test_kahn_order(self):
+        graph = random_graph(width=12, depth=4, seed=9)
+        ordered, rest = kahn_order(graph.get_all_nodes())
+        self.assertEqual(rest, [])
+        position = {node.name: i for i, node in enumerate(ordered)}
+        for node in ordered:
+            for target, _, _ in node.edges:
+                self.assertLess(position[node.name], position[target.name])
+
+        ring(graph, ["x", "y"])
+        graph.add_edge(graph.nodes["y"], graph.get_or_create_node("z"), 0.0, "net")
+        _, rest = kahn_order(graph.get_all_nodes())
+        self.assertEqual(sorted(node.name for node in rest), ["x", "y", "z"])
+
+    def test_breaking_leaves_the_graph_acyclic(self):
+        for policy, pins in (("back_edge", None), ("pins", ["b"])):
+            with self.subTest(policy=policy):
+                graph = random_graph(width=12, depth=4, loops=3, seed=9)
+                ring(graph, ["a", "b", "c"])
+                ring(graph, ["c", "d"])
+                loops = LoopBreaker(graph, policy, pins).run()
+
+                self.assertEqual(len(loops), 4)
+                self.assertEqual(kahn_order(graph.get_all_nodes())[1], [])
+                big = next(loop for loop in loops if "a" in loop.pins)
+                self.assertEqual(big.pins, ["a", "b", "c", "d"])
+                if policy == "pins":
+                    self.assertIn(("a", "b", 0.01, "net"), big.broken_edges)
+
+    def test_analysis_matches_precut_graph(self):
+        graph = random_graph(loops=5, seed=10)
+        analyzer = TimingAnalyzer(graph, self.constraints, self.lib)
+        with redirect_stdout(io.StringIO()):
+            results = analyzer.run_analysis()
+        self.assertEqual(len(analyzer.loops), 5)
+
+        # The same cuts made up front leave nothing for the analyzer to break
+        expected_graph = random_graph(loops=5, seed=10)
+        for loop in analyzer.loops:
+            for source, target, _, edge_type in loop.broken_edges:
+                expected_graph.remove_edge(expected_graph.nodes[source], expected_graph.nodes[target], edge_type)
+        expected = TimingAnalyzer(expected_graph, self.constraints, self.lib)
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(results, expected.run_analysis())
+        self.assertEqual(expected.loops, [])
+        self.assertEqual({n: node.at for n, node in graph.nodes.items()},
+                         {n: node.at for n, node in expected_graph.nodes.items()})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from support import load_config, parse_verilog, read_design
+from sta_engine.analysis import TimingAnalyzer
+from sta_engine.statistical import np
+
+if np is not None:
+    from sta_engine.outofcore import OutOfCoreAnalyzer, OutOfCoreBuilder
+
+HEADER = "`timescale 1ns/1ps\n`define WIDTH 4\n"
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class OutOfCoreTest(unittest.TestCase):
+    def setUp(self):
+        self.config = load_config()
+        self.lib = self.config['library']
+        self.constraints = self.config['timing_constraints']
+        self.workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.workdir)
+
+    def out_of_core(self, text, chunk_size=7):
+        path = os.path.join(self.workdir, "design.v")
+        with open(path, 'w') as f:
+            f.write(text)
+        with redirect_stdout(io.StringIO()) as log:
+            graph = OutOfCoreBuilder(self.lib, os.path.join(self.workdir, "ooc"), chunk_size=chunk_size).build(path)
+            results = OutOfCoreAnalyzer(graph, self.constraints, self.lib, chunk_size=chunk_size).run_analysis()
+        return graph, results, log.getvalue()
+
+    def assertMatchesInMemory(self, text, graph, results):
+        reference = parse_verilog(self.lib, text).graph
+        analyzer = TimingAnalyzer(reference, self.constraints, self.lib)
+        with redirect_stdout(io.StringIO()):
+            wns, worst, expected = analyzer.run_analysis()
+
+        names = graph.names(0, graph.num_pins)
+        self.assertEqual(sorted(names), sorted(reference.nodes))
+        self.assertEqual(graph.num_arcs, sum(len(node.edges) for node in reference.nodes.values()))
+        at = graph.column("at.bin", np.float64)
+        rt = graph.column("rt.bin", np.float64)
+        for pin, name in enumerate(names):
+            self.assertEqual((at[pin], rt[pin]), (reference.nodes[name].at, reference.nodes[name].rt), name)
+
+        self.assertEqual(results[:2], (wns, worst))
+        self.assertEqual(sorted((r['node'], r['slack']) for r in results[2]),
+                         sorted((r['node'], r['slack']) for r in expected))
+
+    def test_matches_in_memory_analysis(self):
+        text = read_design()
+        graph, results, _ = self.out_of_core(text)
+        self.assertMatchesInMemory(text, graph, results)
+
+    def test_directive_header(self):
+        graph, results, log = self.out_of_core(HEADER + read_design())
+        self.assertEqual((graph.num_pins, graph.num_arcs), (43, 36))
+        self.assertMatchesInMemory(HEADER + read_design(), graph, results)
+        self.assertNotIn("Warning", log)
+
+    def test_hash_collisions_keep_nets_apart(self):
+        with mock.patch("sta_engine.outofcore.hash", create=True, return_value=0):
+            graph, results, _ = self.out_of_core(read_design())
+        self.assertMatchesInMemory(read_design(), graph, results)
+
+    def test_unrecognized_statement_warns(self):
+        text = read_design().replace("endmodule", "(* keep *) ;\nendmodule")
+        _, _, log = self.out_of_core(text)
+        self.assertIn("Warning: Skipping unrecognized statement", log)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from support import load_config, random_graph
+from sta_engine.analysis import TimingAnalyzer
+from sta_engine.parallel import ParallelTimingAnalyzer, measure_scaling, np
+
+
+def arrival_times(graph):
+    return {name: node.at for name, node in graph.nodes.items()}
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class ParallelTest(unittest.TestCase):
+    def setUp(self):
+        config = load_config()
+        self.constraints = config['timing_constraints']
+        self.lib = config['library']
+
+    def serial(self, graph):
+        analyzer = TimingAnalyzer(graph, self.constraints, self.lib)
+        return analyzer, analyzer.run_analysis()
+
+    def parallel(self, graph, workers):
+        # A small min_partition sends most levels through the pool
+        analyzer = ParallelTimingAnalyzer(graph, self.constraints, self.lib, workers=workers, min_partition=8)
+        return analyzer, analyzer.run_analysis()
+
+    def test_bit_identical_to_serial(self):
+        serial_graph = random_graph(seed=3)
+        _, expected = self.serial(serial_graph)
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                graph = random_graph(seed=3)
+                _, results = self.parallel(graph, workers)
+                self.assertEqual(arrival_times(graph), arrival_times(serial_graph))
+                self.assertEqual(results, expected)
+
+    def test_loops_broken_like_serial(self):
+        serial_graph, parallel_graph = random_graph(loops=5, seed=4), random_graph(loops=5, seed=4)
+        serial, expected = self.serial(serial_graph)
+        analyzer, results = self.parallel(parallel_graph, 2)
+
+        self.assertEqual(len(serial.loops), 5)
+        self.assertEqual(sorted(map(str, analyzer.loops)), sorted(map(str, serial.loops)))
+        self.assertEqual(arrival_times(parallel_graph), arrival_times(serial_graph))
+        self.assertEqual(results, expected)
+
+    def test_layout_reused_until_the_graph_changes(self):
+        graph = random_graph(seed=5)
+        analyzer, _ = self.parallel(graph, 1)
+        layout = analyzer.layout
+        analyzer.run_analysis()
+        self.assertIs(analyzer.layout, layout)
+
+        graph.add_edge(graph.nodes["reg_a0/Q"], graph.nodes["reg_z0/D"], 0.5, "net")
+        results = analyzer.run_analysis()
+        self.assertIsNot(analyzer.layout, layout)
+        serial_graph = random_graph(seed=5)
+        serial_graph.add_edge(serial_graph.nodes["reg_a0/Q"], serial_graph.nodes["reg_z0/D"], 0.5, "net")
+        self.assertEqual(results, self.serial(serial_graph)[1])
+
+    def test_measure_scaling(self):
+        rows = measure_scaling(random_graph(seed=6), self.constraints, self.lib, [2])
+        self.assertEqual([row['workers'] for row in rows], ["serial", 1, 2])
+        self.assertTrue(all(row['identical'] for row in rows))
+        self.assertIsNone(rows[0]['scaling'])
+        self.assertEqual(rows[1]['scaling'], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
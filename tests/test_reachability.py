@@ -0,0 +1,74 @@
+import unittest
+
+from support import random_graph
+from sta_engine.graph import Graph
+from sta_engine.reachability import ReachabilityIndex, np
+
+
+def bfs(start, step):
+    seen, stack = {start.name}, [start]
+    while stack:
+        for node in step(stack.pop()):
+            if node.name not in seen:
+                seen.add(node.name)
+                stack.append(node)
+    return seen
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class ReachabilityTest(unittest.TestCase):
+    def assertMatchesSearch(self, graph):
+        nodes = graph.get_all_nodes()
+        startpoints = {node.name for node in nodes if not graph.get_fanin(node)}
+        endpoints = {node.name for node in nodes if not node.edges}
+        fanout = lambda node: [target for target, _, _ in node.edges]
+        fanin = lambda node: [source for source, _, _ in graph.get_fanin(node)]
+
+        forward = {node.name: bfs(node, fanout) for node in nodes}
+        for node in nodes:
+            self.assertEqual(sorted(graph.fanin_cone(node.name)), sorted(bfs(node, fanin) & startpoints), node.name)
+            self.assertEqual(sorted(graph.fanout_cone(node.name)), sorted(forward[node.name] & endpoints), node.name)
+        for source in nodes:
+            for target in nodes:
+                self.assertEqual(graph.reaches(source.name, target.name), target.name in forward[source.name],
+                                 (source.name, target.name))
+
+    def test_matches_search(self):
+        self.assertMatchesSearch(random_graph(width=10, depth=4, seed=13))
+
+    def test_matches_search_with_loops(self):
+        graph = random_graph(width=10, depth=4, loops=4, seed=13)
+        ring = [graph.nodes[name] for name in ("u0_1/Y", "u2_3/A", "u2_3/Y", "u1_5/A")]
+        graph.add_edge(ring[-1], ring[0], 0.0, "net")
+        graph.add_edge(graph.nodes["u3_2/Y"], graph.nodes["u3_2/Y"], 0.0, "net")
+        self.assertMatchesSearch(graph)
+
+    def test_self_loop(self):
+        graph = Graph()
+        x, y, z = (graph.get_or_create_node(name) for name in "xyz")
+        graph.add_edge(x, y, 0.1, "net")
+        graph.add_edge(y, y, 0.1, "net")
+        graph.add_edge(y, z, 0.1, "net")
+        self.assertEqual(graph.fanin_cone("y"), ["x"])
+        self.assertEqual(graph.fanin_cone("z"), ["x"])
+        self.assertEqual(graph.fanout_cone("x"), ["z"])
+        self.assertTrue(graph.reaches("x", "z"))
+        self.assertFalse(graph.reaches("z", "y"))
+
+    def test_rebuilt_after_edits(self):
+        graph = random_graph(width=6, depth=3, seed=14)
+        index = graph.reachability()
+        self.assertFalse(graph.reaches("reg_z0/D", "reg_a0/Q"))
+        graph.add_edge(graph.nodes["reg_z0/D"], graph.nodes["reg_a0/Q"], 0.0, "net")
+        self.assertIsNot(graph.reachability(), index)
+        self.assertMatchesSearch(graph)
+
+    def test_sparse_and_dense_sets(self):
+        index = ReachabilityIndex(random_graph(width=80, depth=3, seed=15)).build()
+        dense = int(index._dense.sum())
+        self.assertGreater(dense, 0)
+        self.assertGreater(len(index._dense) - dense, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from support import load_config, random_graph
+from sta_engine.analysis import TimingAnalyzer
+from sta_engine.reduction import GraphReducer
+
+
+def buffered_graph(seed, loops=0):
+    """random_graph with buffer chains spliced into some of its nets, parallel arcs,
+    and (with `loops`) a feedback ring running through a buffer chain."""
+    graph = random_graph(width=20, depth=5, loops=loops, seed=seed)
+
+    def chain(source, target, name, length, delay):
+        previous = source
+        for i in range(length):
+            pin_a = graph.get_or_create_node(f"{name}_{i}/A")
+            pin_y = graph.get_or_create_node(f"{name}_{i}/Y")
+            graph.add_edge(previous, pin_a, 0.001 * (i + 1), "net")
+            graph.add_edge(pin_a, pin_y, delay, "internal")
+            previous = pin_y
+        graph.add_edge(previous, target, 0.002, "net")
+
+    for i in range(10):
+        chain(graph.nodes[f"u{i % 5}_{i}/Y"], graph.nodes[f"reg_z{i}/D"], f"buf{i}", 3 + i % 3, 0.02)
+    graph.add_edge(graph.nodes["u1_1/A"], graph.nodes["u1_1/Y"], 0.09, "net") # Parallel to the cell arc
+    if loops:
+        # The loop breaker starts from lp_0/A, inside the chain the reducer would collapse
+        chain(graph.nodes["u2_0/Y"], graph.nodes["u2_0/A"], "lp", 4, 0.7)
+    return graph
+
+
+class ReductionTest(unittest.TestCase):
+    def setUp(self):
+        config = load_config()
+        self.constraints = config['timing_constraints']
+        self.lib = config['library']
+
+    def assertMatchesUnreduced(self, seed, loops):
+        with redirect_stdout(io.StringIO()):
+            graph = buffered_graph(seed, loops)
+            expected = TimingAnalyzer(graph, self.constraints, self.lib)
+            expected_results = expected.run_analysis()
+
+            reduced_graph = buffered_graph(seed, loops)
+            reducer = GraphReducer(reduced_graph, TimingAnalyzer(reduced_graph, self.constraints, self.lib).is_timing_point)
+            analyzer = TimingAnalyzer(reducer.reduce(), self.constraints, self.lib)
+            results = analyzer.run_analysis()
+            reducer.expand()
+
+        self.assertLess(len(reducer.reduced.nodes), len(graph.nodes))
+        self.assertEqual([str(loop) for loop in analyzer.loops], [str(loop) for loop in expected.loops])
+        for name, node in graph.nodes.items():
+            self.assertAlmostEqual(reduced_graph.nodes[name].at, node.at, places=12, msg=name)
+            self.assertEqual(reduced_graph.nodes[name].rt, node.rt, name)
+        self.assertEqual(results[1], expected_results[1])
+        slack = {row['node']: row['slack'] for row in expected_results[2]}
+        self.assertEqual(set(slack), {row['node'] for row in results[2]})
+        for row in results[2]:
+            self.assertAlmostEqual(row['slack'], slack[row['node']], places=12)
+
+    def test_matches_unreduced_analysis(self):
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                self.assertMatchesUnreduced(seed, loops=0)
+
+    def test_loops_are_cut_like_the_unreduced_graph(self):
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                self.assertMatchesUnreduced(seed, loops=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import copy
+import json
+import os
+import unittest
+
+from sta_engine.analysis import TimingAnalyzer
+from sta_engine.graph import Graph
+from sta_engine.sensitivity import SensitivityAnalyzer
+from sta_engine.statistical import StatisticalTimingAnalyzer, np
+
+CONFIG = os.path.join(os.path.dirname(__file__), "..", "config", "sta_config.json")
+EPS = 1e-6
+
+
+def load_config():
+    with open(CONFIG) as f:
+        config = json.load(f)
+    # Tight enough that both capture registers violate
+    config['timing_constraints']['clock_period'] = 0.25
+    return config
+
+
+def build_graph(lib, clock_tree=False):
+    """Three launch registers through AND2 / XOR2 logic into two capture registers,
+    with the arc delays the parser would derive from `lib` (and with `clock_tree`,
+    a clk port buffered to every register)."""
+    graph = Graph()
+
+    def cell(inst, cell_type):
+        info = lib['cells'][cell_type]
+        for pin in info['inputs'] + info['outputs']:
+            graph.get_or_create_node(f"{inst}/{pin}").cell = cell_type
+        if not info.get('is_seq', False):
+            for out_pin in info['outputs']:
+                for in_pin in info['inputs']:
+                    graph.add_edge(graph.nodes[f"{inst}/{in_pin}"], graph.nodes[f"{inst}/{out_pin}"],
+                                   info['delay'], "internal")
+
+    def net(driver, *loads):
+        delay = len(loads) * lib['wire_load_model']['fanout_factor']
+        for load in loads:
+            graph.add_edge(graph.nodes[driver], graph.nodes[load], delay, "net")
+
+    for inst in ("reg_a", "reg_b", "reg_c", "reg_d", "reg_e"):
+        cell(inst, "DFF")
+    cell("u1", "AND2")
+    cell("u2", "XOR2")
+    cell("u3", "XOR2")
+    net("reg_a/Q", "u1/A", "u2/A")
+    net("reg_b/Q", "u1/B")
+    net("reg_c/Q", "u2/B", "u3/B")
+    net("u1/Y", "u3/A")
+    net("u2/Y", "reg_d/D")
+    net("u3/Y", "reg_e/D")
+    if clock_tree:
+        graph.get_or_create_node("clk", "port")
+        cell("cb", "BUF")
+        net("clk", "cb/A")
+        net("cb/Y", *(f"reg_{r}/C" for r in "abcde"))
+    return graph
+
+
+def perturb(lib, parameter, delta):
+    lib = copy.deepcopy(lib)
+    name, field = parameter.split(".")
+    if name == "wire_load_model":
+        lib['wire_load_model'][field] += delta
+    else:
+        lib['cells'][name][field] += delta
+    return lib
+
+
+def sensitivities(config, lib):
+    analyzer = TimingAnalyzer(build_graph(lib), config['timing_constraints'], lib)
+    analyzer.run_analysis()
+    return SensitivityAnalyzer(analyzer).run()
+
+
+class SensitivityTest(unittest.TestCase):
+    def setUp(self):
+        self.config = load_config()
+        self.lib = self.config['library']
+
+    def test_parameters_match_finite_differences(self):
+        base = sensitivities(self.config, self.lib)
+        self.assertEqual(base['violating'], 2)
+        self.assertGreater(len(base['parameters']), 0)
+
+        for row in base['parameters']:
+            with self.subTest(parameter=row['parameter']):
+                moved = sensitivities(self.config, perturb(self.lib, row['parameter'], EPS))
+                self.assertAlmostEqual((moved['wns'] - base['wns']) / EPS, row['d_wns'], delta=1e-6)
+                self.assertAlmostEqual((moved['tns'] - base['tns']) / EPS, row['d_tns'], delta=1e-6)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_unaffected_by_monte_carlo(self):
+        graph = build_graph(self.lib)
+        analyzer = TimingAnalyzer(graph, self.config['timing_constraints'], self.lib)
+        analyzer.run_analysis()
+        before = SensitivityAnalyzer(analyzer).run()
+
+        StatisticalTimingAnalyzer(graph, self.config['timing_constraints'], self.lib, samples=64, seed=1).run_statistical()
+        self.assertEqual(SensitivityAnalyzer(analyzer).run(), before)
+
+    def test_rejects_propagated_clock(self):
+        constraints = dict(self.config['timing_constraints'], propagated_clock=True)
+        analyzer = TimingAnalyzer(build_graph(self.lib, clock_tree=True), constraints, self.lib)
+        analyzer.run_analysis()
+        with self.assertRaises(ValueError):
+            SensitivityAnalyzer(analyzer).run()
+
+    def test_rejects_endpoint_queries(self):
+        analyzer = TimingAnalyzer(build_graph(self.lib), self.config['timing_constraints'], self.lib)
+        analyzer.query_endpoints(["reg_d/D"])
+        with self.assertRaises(ValueError):
+            SensitivityAnalyzer(analyzer).run()
+
+
+if __name__ == "__main__":
+    unittest.main()
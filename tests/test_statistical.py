@@ -0,0 +1,69 @@
+import copy
+import unittest
+
+from support import load_config, random_graph
+from sta_engine.analysis import TimingAnalyzer
+from sta_engine.statistical import QUANTILES, StatisticalTimingAnalyzer, _SlackSummary, np
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class StatisticalTest(unittest.TestCase):
+    def setUp(self):
+        config = load_config()
+        self.constraints = config['timing_constraints']
+        self.lib = config['library']
+
+    def monte_carlo(self, lib, samples=200, chunk_size=64, seed=7):
+        analyzer = StatisticalTimingAnalyzer(random_graph(seed=2), self.constraints, lib,
+                                             samples=samples, seed=seed, chunk_size=chunk_size)
+        return analyzer.run_statistical()
+
+    def test_zero_sigma_matches_deterministic_analysis(self):
+        lib = copy.deepcopy(self.lib)
+        for cell in lib['cells'].values():
+            cell['delay_sigma'] = cell['delay_clk_q_sigma'] = 0.0
+        lib['wire_load_model']['sigma_ratio'] = 0.0
+
+        _, _, results = TimingAnalyzer(random_graph(seed=2), self.constraints, lib).run_analysis()
+        expected = {row['node']: row['slack'] for row in results}
+        statistics = self.monte_carlo(lib)
+
+        self.assertEqual({row['node'] for row in statistics['endpoints']}, set(expected))
+        for row in statistics['endpoints']:
+            with self.subTest(endpoint=row['node']):
+                slack = expected[row['node']]
+                self.assertAlmostEqual(row['mean'], slack, places=9)
+                self.assertAlmostEqual(row['sigma'], 0.0, places=6)
+                for q in QUANTILES:
+                    self.assertAlmostEqual(row['quantiles'][q], slack, places=9)
+                self.assertEqual(row['yield'], 1.0 if slack >= 0 else 0.0)
+
+    def test_seeded_runs_repeat(self):
+        self.assertEqual(self.monte_carlo(self.lib), self.monte_carlo(self.lib))
+
+    def test_streaming_summary_matches_numpy(self):
+        rng = np.random.default_rng(3)
+        slack = rng.normal(0.1, 0.05, size=(5, 3000)) * np.arange(1, 6)[:, None]
+        summary = _SlackSummary(slack[:, :500], bins=256)
+        for lo in range(500, slack.shape[1], 700):
+            summary.add(slack[:, lo:lo + 700])
+
+        mean, sigma = summary.mean_sigma()
+        np.testing.assert_allclose(mean, slack.mean(axis=1), rtol=1e-12)
+        np.testing.assert_allclose(sigma, slack.std(axis=1), rtol=1e-9)
+        np.testing.assert_array_equal(summary.passing, (slack >= 0).sum(axis=1))
+        self.assertEqual(summary.all_passing, int((slack.min(axis=0) >= 0).sum()))
+
+        # Interpolated quantiles land within a bin of the exact ones
+        levels = (0.01, 0.25, 0.5, 0.9)
+        exact = np.quantile(slack, levels, axis=1)
+        approx = summary.quantiles(levels)
+        self.assertTrue((np.abs(approx - exact) <= summary.bin_width).all())
+
+    def test_rejects_empty_chunks(self):
+        with self.assertRaises(ValueError):
+            StatisticalTimingAnalyzer(random_graph(), self.constraints, self.lib, chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
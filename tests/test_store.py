@@ -0,0 +1,87 @@
+import math
+import os
+import shutil
+import tempfile
+import unittest
+from fnmatch import fnmatchcase
+
+from support import load_config, random_graph
+from sta_engine.analysis import TimingAnalyzer
+from sta_engine.store import ResultStore, np, save_results
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class ResultStoreTest(unittest.TestCase):
+    def setUp(self):
+        config = load_config()
+        self.constraints = config['timing_constraints']
+        self.lib = config['library']
+        self.workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.workdir)
+
+    def save(self, graph, name):
+        _, _, results = TimingAnalyzer(graph, self.constraints, self.lib).run_analysis()
+        path = os.path.join(self.workdir, name)
+        save_results(path, graph, results, {"design": name})
+        store = ResultStore(path)
+        self.addCleanup(store.close)
+        return store, results
+
+    def test_round_trip(self):
+        graph = random_graph(seed=8)
+        store, results = self.save(graph, "run.stares")
+        slack = {row['node']: row['slack'] for row in results}
+
+        self.assertEqual(len(store), len(graph.nodes))
+        self.assertEqual(store.metadata, {"design": "run.stares"})
+        for name, node in graph.nodes.items():
+            row = store.row(store.find(name))
+            self.assertEqual((row['node'], row['at'], row['rt'], row['endpoint']),
+                             (name, node.at, node.rt, name in slack))
+            if name in slack:
+                self.assertEqual(row['slack'], slack[name])
+            else:
+                self.assertTrue(math.isnan(row['slack']))
+        self.assertIsNone(store.find("no/such_pin"))
+
+    def test_query_matches_a_scan(self):
+        store, results = self.save(random_graph(seed=8), "run.stares")
+        slacks = sorted(row['slack'] for row in results)
+        low, high = slacks[len(slacks) // 4], slacks[3 * len(slacks) // 4]
+
+        rows = store.query("reg_z1*", min_slack=low, max_slack=high, endpoints_only=True)
+        expected = sorted(row['node'] for row in results
+                          if fnmatchcase(row['node'], "reg_z1*") and low <= row['slack'] <= high)
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(sorted(row['node'] for row in rows), expected)
+        self.assertEqual(len(store.query(endpoints_only=True)), len(results))
+
+    def test_diff(self):
+        before, _ = self.save(random_graph(seed=8), "before.stares")
+        graph = random_graph(seed=8)
+        graph.add_edge(graph.nodes["reg_a0/Q"], graph.nodes["reg_z0/D"], 2.0, "net")
+        graph.remove_node("reg_z1/D")
+        after, _ = self.save(graph, "after.stares")
+
+        diff = after.diff(before)
+        self.assertEqual(diff['removed_endpoints'], ["reg_z1/D"])
+        self.assertEqual(diff['added_endpoints'], [])
+        self.assertEqual([d['node'] for d in diff['newly_violating']], ["reg_z0/D"])
+        self.assertEqual(diff['deltas'][0]['node'], "reg_z0/D")
+        self.assertTrue(all(d['delta'] == 0 for d in diff['deltas'][1:]))
+
+    def test_histogram(self):
+        store, results = self.save(random_graph(seed=8), "run.stares")
+        values = np.array([row['slack'] for row in results])
+        for bins in (1, 7):
+            with self.subTest(bins=bins):
+                buckets = store.histogram(bins)
+                counts, edges = np.histogram(values, bins)
+                self.assertEqual([count for _, _, count in buckets], counts.tolist())
+                np.testing.assert_allclose([low for low, _, _ in buckets], edges[:-1])
+        with self.assertRaises(ValueError):
+            store.histogram(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from support import load_config, parse_verilog
+from sta_engine.analysis import TimingAnalyzer
+from sta_engine.vector import VectorTimingAnalyzer, group_bus_instances, np
+
+
+def bus_design(width=8):
+    """A register bus through a lane-aligned AND2 bus (wrapping at the top bit),
+    a ripple carry chain and a shifted XOR2 bus into capture registers."""
+    lines = [f"module bus(input clk, input [{width - 1}:0] din, output [{width - 1}:0] dout);",
+             f"  wire [{width - 1}:0] q, a, x;",
+             f"  wire [{width}:0] cy;",
+             "  BUF gb (.A(din[0]), .Y(cy[0]));"]
+    for i in range(width):
+        lines += [f"  DFF ra{i} (.C(clk), .D(din[{i}]), .Q(q[{i}]));",
+                  f"  AND2 ga{i} (.A(q[{i}]), .B(q[{(i + 1) % width}]), .Y(a[{i}]));",
+                  f"  XOR2 gc{i} (.A(a[{i}]), .B(cy[{i}]), .Y(cy[{i + 1}]));",
+                  f"  XOR2 gx{i} (.A(a[{i}]), .B(cy[{i + 1}]), .Y(x[{i}]));",
+                  f"  DFF rz{i} (.C(clk), .D(x[{i}]), .Q(dout[{i}]));"]
+    return "\n".join(lines + ["endmodule"])
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class VectorTest(unittest.TestCase):
+    def setUp(self):
+        config = load_config()
+        self.constraints = config['timing_constraints']
+        self.lib = config['library']
+        with redirect_stdout(io.StringIO()):
+            self.parser = parse_verilog(self.lib, bus_design())
+
+    def analyzers(self):
+        graph = self.parser.graph
+        return (TimingAnalyzer(graph, self.constraints, self.lib),
+                VectorTimingAnalyzer(graph, self.constraints, self.lib, self.parser.instances))
+
+    def assertMatchesScalar(self, expected, analyzer):
+        with redirect_stdout(io.StringIO()):
+            expected_results = expected.run_analysis()
+            expected_at = {name: node.at for name, node in self.parser.graph.nodes.items()}
+            results = analyzer.run_analysis()
+        self.assertEqual({name: node.at for name, node in self.parser.graph.nodes.items()}, expected_at)
+        self.assertEqual(results, expected_results)
+
+    def test_matches_scalar_analysis(self):
+        expected, analyzer = self.analyzers()
+        self.assertMatchesScalar(expected, analyzer)
+
+        # Registers, both gate buses and the ripple cells group; the ripple
+        # group is split back to scalars, so its pins stay width 1
+        groups = {group[0] for group in group_bus_instances(self.parser.instances)}
+        self.assertTrue({"ra0", "ga0", "gc0", "gx0", "rz0"} <= groups)
+        widths = {analyzer.pins[p].name: int(w) for p, w in zip(analyzer.offsets[:-1].tolist(), np.diff(analyzer.offsets))}
+        self.assertEqual(widths["ga0/A"], 7) # ga7 wraps to q[0]
+        self.assertEqual(widths["gx0/A"], 8)
+        self.assertEqual(widths["ra0/Q"], 8)
+        self.assertTrue(all(widths[f"gc{i}/Y"] == 1 for i in range(8)))
+        self.assertLess(len(widths), len(self.parser.graph.nodes))
+
+    def test_rebuilds_after_graph_edit(self):
+        expected, analyzer = self.analyzers()
+        self.assertMatchesScalar(expected, analyzer)
+        graph = self.parser.graph
+        graph.add_edge(graph.nodes["gb/Y"], graph.nodes["gx3/B"], 0.5, "net")
+        self.assertMatchesScalar(expected, analyzer)
+
+    def test_rejects_propagated_clock(self):
+        constraints = dict(self.constraints, propagated_clock=True)
+        analyzer = VectorTimingAnalyzer(self.parser.graph, constraints, self.lib, self.parser.instances)
+        with redirect_stdout(io.StringIO()), self.assertRaises(ValueError):
+            analyzer.run_analysis()
+
+
+if __name__ == "__main__":
+    unittest.main()